@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Compares GraphQL extraction wall time for several course page sizes and
+concurrency limits, against a local stub GraphQL server that serves generated
+courses with a fixed latency per request. Courses with more enrollments than
+the nested page size need follow-up queries. Example:
+
+    poetry run python benchmarks/graphql_page_size_benchmark.py --courses 2000 \\
+        --enrollments 250 --latency-ms 100 --page-sizes 1 10 50 --concurrency 1 4 8
+"""
+
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+from threading import Thread
+from time import perf_counter, sleep
+from typing import Dict, List
+
+from edfi_canvas_extractor.graphql.extractor import GraphQLExtractor
+from edfi_canvas_extractor.graphql.schema import NESTED_PAGE_SIZE
+
+COURSES_PAGE = re.compile(r'coursesConnection\(first: (\d+), after: "(\d*)"\)')
+ENROLLMENTS_PAGE = re.compile(
+    r'course\(id: "(\d+)"\).*enrollmentsConnection\(first: (\d+), after: "(\d*)"\)',
+    re.DOTALL,
+)
+
+
+def _connection(nodes: List, after: str = "", first: int = NESTED_PAGE_SIZE) -> Dict:
+    start = int(after or 0)
+    end = start + first
+    return {
+        "nodes": nodes[start:end],
+        "pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end)},
+    }
+
+
+def _course(id: int, enrollment_count: int) -> Dict:
+    section = {
+        "_id": f"{id}01",
+        "sisId": None,
+        "name": f"Section {id}",
+        "createdAt": "2021-01-01T00:00:00Z",
+        "updatedAt": "2021-01-01T00:00:00Z",
+    }
+    enrollments = [
+        {
+            "_id": f"{id}{user:03}",
+            "createdAt": "2021-01-01T00:00:00Z",
+            "updatedAt": "2021-01-01T00:00:00Z",
+            "state": "active",
+            "type": "StudentEnrollment",
+            "section": {"_id": section["_id"]},
+            "user": {
+                "_id": str(user),
+                "sisId": None,
+                "createdAt": "2021-01-01T00:00:00Z",
+                "email": None,
+                "name": f"Student {user}",
+                "loginId": None,
+            },
+            "grades": None,
+        }
+        for user in range(enrollment_count)
+    ]
+    return {
+        "_id": str(id),
+        "name": f"Course {id}",
+        "state": "available",
+        "term": {"startAt": None, "endAt": None},
+        "assignmentsConnection": [],
+        "enrollmentsConnection": enrollments,
+        "sectionsConnection": [section],
+        "submissionsConnection": [],
+    }
+
+
+def _with_first_pages(course: Dict) -> Dict:
+    return {
+        key: _connection(value) if key.endswith("Connection") else value
+        for key, value in course.items()
+    }
+
+
+def _start_server(
+    courses: int, enrollments: int, latency: float
+) -> ThreadingHTTPServer:
+    all_courses = [_course(id, enrollments) for id in range(1, courses + 1)]
+
+    class StubGraphQLHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            query = json.loads(self.rfile.read(length))["query"]
+
+            nested = ENROLLMENTS_PAGE.search(query)
+            if nested:
+                id, first, after = nested.groups()
+                enrollments = all_courses[int(id) - 1]["enrollmentsConnection"]
+                page = _connection(enrollments, after, int(first))
+                data = {"course": {"enrollmentsConnection": page}}
+            else:
+                first, after = COURSES_PAGE.search(query).groups()  # type: ignore
+                page = _connection(all_courses, after, int(first))
+                page["nodes"] = [_with_first_pages(node) for node in page["nodes"]]
+                data = {"account": {"coursesConnection": page}}
+
+            sleep(latency)
+            body = json.dumps({"data": data})
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body.encode("utf-8"))
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGraphQLHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--courses", type=int, default=2000)
+    parser.add_argument("--enrollments", type=int, default=250)
+    parser.add_argument("--latency-ms", type=int, default=100)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    server = _start_server(args.courses, args.enrollments, args.latency_ms / 1000)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    follow_ups = -(-args.enrollments // NESTED_PAGE_SIZE) - 1
+    print(
+        f"{'page size':>10}{'concurrency':>13}{'requests':>10}"
+        f"{'seconds':>10}{'courses/s':>12}"
+    )
+    for page_size in args.page_sizes:
+        for concurrency in args.concurrency:
+            gql = GraphQLExtractor(
+                url, "token", "1", None, None, page_size, concurrency
+            )
+            start = perf_counter()
+            gql.run()
+            seconds = perf_counter() - start
+
+            assert len(gql.get_courses()) == args.courses
+            assert len(gql.enrollments) == args.courses * args.enrollments
+            requests = -(-args.courses // page_size) + args.courses * follow_ups
+            rate = args.courses / seconds
+            print(
+                f"{page_size:>10}{concurrency:>13}{requests:>10}"
+                f"{seconds:>10.2f}{rate:>12,.0f}"
+            )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
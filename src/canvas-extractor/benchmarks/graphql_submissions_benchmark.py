@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Times the matching of submissions to section enrollments and assignments in
+GraphQLExtractor.extract, for generated course pages with one submission per
+student and assignment, and reports the peak memory. With --stream, the
+submissions are passed on in batches instead of being kept in memory. Example:
+
+    poetry run python benchmarks/graphql_submissions_benchmark.py --students 300 \\
+        --assignments 200 --sections 2 --courses 10 --stream
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+import tracemalloc
+from typing import Dict, List
+
+from edfi_canvas_extractor.graphql.extractor import GraphQLExtractor
+
+
+def _connection(nodes: List) -> Dict:
+    return {"nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+
+
+def _course(id: int, students: int, assignments: int, sections: int) -> Dict:
+    section_nodes = [
+        {
+            "_id": str(section),
+            "sisId": None,
+            "name": f"Section {section}",
+            "createdAt": None,
+            "updatedAt": None,
+        }
+        for section in range(sections)
+    ]
+    assignment_nodes = [
+        {
+            "_id": str(assignment),
+            "name": f"Assignment {assignment}",
+            "description": None,
+            "createdAt": None,
+            "updatedAt": None,
+            "lockAt": None,
+            "unlockAt": None,
+            "dueAt": "2021-01-01T00:00:00Z",
+            "submissionTypes": ["online_text_entry"],
+            "pointsPossible": 10,
+        }
+        for assignment in range(assignments)
+    ]
+    enrollment_nodes = [
+        {
+            "_id": str(user),
+            "createdAt": None,
+            "updatedAt": None,
+            "state": "active",
+            "type": "StudentEnrollment",
+            "section": {"_id": str(user % sections)},
+            "user": {
+                "_id": str(user),
+                "sisId": None,
+                "createdAt": None,
+                "email": None,
+                "name": f"User {user}",
+                "loginId": None,
+            },
+            "grades": None,
+        }
+        for user in range(students)
+    ]
+    submission_nodes = [
+        {
+            "_id": f"{assignment}-{user}",
+            "late": False,
+            "missing": False,
+            "submittedAt": None,
+            "grade": None,
+            "createdAt": None,
+            "updatedAt": None,
+            "gradedAt": None,
+            "user": {"_id": str(user)},
+            "assignment": {"_id": str(assignment)},
+        }
+        for assignment in range(assignments)
+        for user in range(students)
+    ]
+    return {
+        "_id": str(id),
+        "name": f"Course {id}",
+        "state": "available",
+        "term": {"startAt": None, "endAt": None},
+        "assignmentsConnection": _connection(assignment_nodes),
+        "enrollmentsConnection": _connection(enrollment_nodes),
+        "sectionsConnection": _connection(section_nodes),
+        "submissionsConnection": _connection(submission_nodes),
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--students", type=int, default=300)
+    parser.add_argument("--assignments", type=int, default=200)
+    parser.add_argument("--sections", type=int, default=2)
+    parser.add_argument("--courses", type=int, default=1)
+    parser.add_argument("--stream", action="store_true")
+    args = parser.parse_args()
+
+    gql = GraphQLExtractor("http://localhost", "token", "1", None, None)
+    submission_count = 0
+
+    def count(batch: List) -> None:
+        nonlocal submission_count
+        submission_count += len(batch)
+
+    if args.stream:
+        gql.stream_submissions(count)
+
+    elapsed = 0.0
+    tracemalloc.start()
+    for id in range(args.courses):
+        course = _course(id, args.students, args.assignments, args.sections)
+        body = {"data": {"account": {"coursesConnection": _connection([course])}}}
+        del course
+
+        started = perf_counter()
+        gql.extract(body)
+        elapsed += perf_counter() - started
+        del body
+
+    gql._flush_submissions()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    submission_count += len(gql.get_submissions())
+    print(
+        f"{args.courses} courses x {args.students} students x {args.assignments} "
+        f"assignments: {submission_count} submissions in {elapsed:.2f}s, "
+        f"peak memory {peak / 2**20:.0f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Times the lookup of the synced submissions of a page of courses, which
+incremental runs make once per course page, in a sync database holding a
+large history of submissions. With --no-index, the course id index is dropped
+first, to compare with a full scan. Example:
+
+    poetry run python benchmarks/synced_submissions_benchmark.py \\
+        --submissions 500000 --courses 5000 --page-size 10
+"""
+
+from argparse import ArgumentParser
+import json
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from edfi_canvas_extractor.graphql import submissions
+from edfi_canvas_extractor.graphql.submissions import (
+    COURSE_ID_INDEX_NAME,
+    SUBMISSIONS_RESOURCE_NAME,
+    submissions_synced_as_df,
+    synced_submissions,
+)
+from edfi_lms_extractor_lib.api.sync_db import SYNC_DB_FILE_NAME, get_sync_db_engine
+
+
+def _submission(number: int, courses: int) -> dict:
+    return {
+        "id": str(number),
+        "course_id": str(number % courses),
+        "user_id": str(number),
+        "grade": "A",
+        "submitted_at": "2021-01-02T00:00:00Z",
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--submissions", type=int, default=500000)
+    parser.add_argument("--courses", type=int, default=5000)
+    parser.add_argument("--page-size", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--no-index", action="store_true")
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as directory:
+        sync_db = get_sync_db_engine(directory)
+        submissions_synced_as_df([_submission(0, args.courses)], sync_db)
+        with sync_db.connect() as con:
+            con.execute(
+                f"""
+                INSERT INTO {SUBMISSIONS_RESOURCE_NAME}
+                    (SourceId, Json, Hash, SyncNeeded)
+                VALUES (?, ?, '', 0)
+                """,
+                [
+                    (str(number), json.dumps(_submission(number, args.courses)))
+                    for number in range(1, args.submissions)
+                ],
+            )
+            if args.no_index:
+                con.execute(f"DROP INDEX {COURSE_ID_INDEX_NAME}")
+
+        if args.no_index:
+            # Otherwise the lookup creates the index again
+            setattr(submissions, "_ensure_course_id_index", lambda con: None)
+
+        started = perf_counter()
+        found = 0
+        for page in range(args.pages):
+            first = page * args.page_size
+            course_ids = [
+                str(course) for course in range(first, first + args.page_size)
+            ]
+            found += len(synced_submissions(course_ids, sync_db))
+        elapsed = perf_counter() - started
+
+        sync_db.dispose()
+        size = os.path.getsize(os.path.join(directory, SYNC_DB_FILE_NAME))
+
+    print(
+        f"{args.submissions} synced submissions ({size / 2 ** 20:.0f} MiB), "
+        f"index: {not args.no_index}: {found} found in {args.pages} pages of "
+        f"{args.page_size} courses, {elapsed / args.pages * 1000:.1f} ms per page"
+    )
+
+
+if __name__ == "__main__":
+    main()
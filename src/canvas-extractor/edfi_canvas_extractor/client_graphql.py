@@ -190,15 +190,16 @@ def extract_assignments(
 
 
 def extract_submissions(
-    gql: GraphQLExtractor,
+    submissions: List[Dict[str, str]],
     sync_db: sqlalchemy.engine.base.Engine,
 ) -> Dict[Tuple[str, str], DataFrame]:
     """
-    Gets all Canvas submissions for sections, in the Ed-Fi UDM format.
+    Gets a batch of Canvas submissions for sections, in the Ed-Fi UDM format.
     Parameters
     ----------
-    sections: List[Dict[str, str]]
-        A List of Section dictionaries.
+    submissions: List[Dict[str, str]]
+        A List of Submission dictionaries, holding all the submissions
+        of each of their courses.
     sync_db: sqlalchemy.engine.base.Engine
         Sync database connection.
     Returns
@@ -208,7 +209,6 @@ def extract_submissions(
         as value.
     """
     export: Dict[Tuple[str, str], DataFrame] = {}
-    submissions: List[Dict[str, str]] = gql.get_submissions()
     if len(list(submissions)) < 1:
         logger.info(
             "Skipping submissions for section - No data returned by API",
@@ -4,14 +4,13 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 import logging
-import os
 import socket
 
 from canvasapi.exceptions import CanvasException
 from requests import RequestException
-from sqlalchemy import create_engine
 import sqlalchemy
 from canvasapi import Canvas
+from edfi_lms_extractor_lib.api import sync_db
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +24,7 @@ def get_sync_db_engine(sync_database_directory: str) -> sqlalchemy.engine.base.E
     sqlalchemy.engine.base.Engine
         a SQL Alchemy Engine
     """
-    logger.debug(
-        "Ensuring database directory at %s", os.path.abspath(sync_database_directory)
-    )
-    os.makedirs(sync_database_directory, exist_ok=True)
-    return create_engine(f"sqlite:///{sync_database_directory}/sync.sqlite")
+    return sync_db.get_sync_db_engine(sync_database_directory)
 
 
 def get_canvas_api(canvas_base_url: str, canvas_access_token: str) -> Canvas:
@@ -8,14 +8,17 @@ import sqlalchemy
 import sys
 
 from datetime import datetime
+from functools import partial
 from pandas import DataFrame
-from typing import cast, Dict, Tuple
+from typing import cast, Dict, List, Tuple
 
 from canvasapi import Canvas
 from canvasapi.paginated_list import PaginatedList
 
 from edfi_canvas_extractor.config import get_canvas_api, get_sync_db_engine
 from edfi_canvas_extractor.graphql.extractor import GraphQLExtractor
+from edfi_canvas_extractor.graphql.submissions import SUBMISSIONS_RESOURCE_NAME
+from edfi_canvas_extractor.graphql.watermarks import Watermarks
 from edfi_lms_extractor_lib.csv_generation.write import (
     write_assignments,
     write_assignment_submissions,
@@ -96,7 +99,12 @@ def _write_sections(
     _, udm_sections_df, _ = results_store["sections"]
 
     logger.info("Writing LMS UDM Sections to CSV file")
-    write_sections(udm_sections_df, datetime.now(), arguments.output_directory)
+    write_sections(
+        udm_sections_df,
+        datetime.now(),
+        arguments.output_directory,
+        arguments.output_format,
+    )
 
 
 @catch_exceptions
@@ -106,7 +114,11 @@ def _get_section_activities(
     (_, _, all_section_ids) = results_store["sections"]
     logger.info("Writing empty LMS UDM SectionActivities to CSV files")
     write_section_activities(
-        dict(), all_section_ids, datetime.now(), arguments.output_directory
+        dict(),
+        all_section_ids,
+        datetime.now(),
+        arguments.output_directory,
+        arguments.output_format,
     )
 
 
@@ -127,7 +139,12 @@ def _write_students(arguments: MainArguments) -> None:
     (students, udm_students_df) = results_store["students"]
 
     logger.info("Writing LMS UDM Users to CSV file")
-    write_users(udm_students_df, datetime.now(), arguments.output_directory)
+    write_users(
+        udm_students_df,
+        datetime.now(),
+        arguments.output_directory,
+        arguments.output_format,
+    )
 
 
 @catch_exceptions
@@ -150,7 +167,11 @@ def _write_sections_associations(arguments: MainArguments) -> None:
 
     logger.info("Writing LMS UDM UserSectionAssociations to CSV files")
     write_section_associations(
-        udm_enrollments, all_section_ids, datetime.now(), arguments.output_directory
+        udm_enrollments,
+        all_section_ids,
+        datetime.now(),
+        arguments.output_directory,
+        arguments.output_format,
     )
 
 
@@ -178,24 +199,30 @@ def _write_assignments(
     (_, _, all_section_ids) = results_store["sections"]
     (_, udm_assignments_df) = results_store["assignments"]
     write_assignments(
-        udm_assignments_df, all_section_ids, datetime.now(), arguments.output_directory
+        udm_assignments_df,
+        all_section_ids,
+        datetime.now(),
+        arguments.output_directory,
+        arguments.output_format,
     )
 
 
 @catch_exceptions
-def _get_submissions(
+def _write_submissions(
     arguments: MainArguments,
-    gql: GraphQLExtractor,
     sync_db: sqlalchemy.engine.base.Engine,
+    submissions: List[Dict[str, str]],
 ) -> bool:
-    logger.info("Extracting Submissions from Canvas")
     logger.info("Writing LMS UDM AssignmentSubmissions to CSV files")
-    submissions = extract_submissions(gql, sync_db)
-    if submissions:
+    submissions_by_section: Dict[Tuple[str, str], DataFrame] = extract_submissions(
+        submissions, sync_db
+    )
+    if submissions_by_section:
         write_assignment_submissions(
-            submissions,
+            submissions_by_section,
             datetime.now(),
             arguments.output_directory,
+            arguments.output_format,
         )
 
     return True
@@ -211,7 +238,11 @@ def _get_grades(arguments: MainArguments) -> None:
     )
     logger.info("Writing LMS UDM Grades to CSV files")
     write_grades(
-        udm_grades, all_section_ids, datetime.now(), arguments.output_directory
+        udm_grades,
+        all_section_ids,
+        datetime.now(),
+        arguments.output_directory,
+        arguments.output_format,
     )
 
 
@@ -234,7 +265,18 @@ def run(arguments: MainArguments) -> None:
             arguments.access_token,
             _id,
             arguments.start_date,
-            arguments.end_date
+            arguments.end_date,
+            arguments.page_size,
+            arguments.max_concurrency,
+            )
+        if arguments.extract_assignments:
+            # Submissions are written in batches while the pages are extracted
+            logger.info("Extracting Submissions from Canvas")
+            gql.stream_submissions(
+                partial(_write_submissions, arguments, sync_db),
+                watermarks=Watermarks(
+                    sync_db, SUBMISSIONS_RESOURCE_NAME, arguments.full_sync_days
+                ),
             )
         gql.run()
 
@@ -259,10 +301,8 @@ def run(arguments: MainArguments) -> None:
         _write_sections_associations(arguments)
 
         if arguments.extract_assignments:
-            succeeded = _get_assignments(gql, sync_db)
+            _get_assignments(gql, sync_db)
             _write_assignments(arguments)
-            if succeeded:
-                _get_submissions(arguments, gql, sync_db)
 
         if arguments.extract_activities:
             _get_section_activities(
@@ -3,19 +3,45 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from opnieuw import retry
 
 from edfi_canvas_extractor.config import RETRY_CONFIG
 
 from .canvas_helper import remove_duplicates
-from .schema import query_builder
+from .rate_limit import RateLimitThrottle
+from .schema import (
+    COURSE_CONNECTIONS,
+    DEFAULT_PAGE_SIZE,
+    nested_query_builder,
+    query_builder,
+)
+from .submissions import delete_missing_submissions, synced_submissions
 from .utils import validate_date, format_full_date
+from .watermarks import Watermarks
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Number of submissions held in memory before they are passed to the
+# submissions handler, when one is set
+SUBMISSIONS_BATCH_SIZE = 10000
+
+# The only course connection that supports the updatedSince filter
+SUBMISSIONS_CONNECTION = "submissionsConnection"
+
+
+def _latest_updated_at(nodes: List) -> Optional[str]:
+    updated_at = [node["updatedAt"] for node in nodes if node["updatedAt"]]
+    if not updated_at:
+        return None
+    return max(updated_at, key=format_full_date)
 
 
 class GraphQLExtractor(object):
@@ -32,7 +58,9 @@ class GraphQLExtractor(object):
         token: str,
         account: str,
         start: Optional[str],
-        end: Optional[str]
+        end: Optional[str],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """
         Initialize Adapter for GraphQL Extraction
@@ -43,6 +71,10 @@ class GraphQLExtractor(object):
             Base URL to connect to Canvas
         token: str
             Secret to get access to Canvas
+        page_size: int
+            Number of courses to request per GraphQL query
+        max_concurrency: int
+            Maximum number of GraphQL requests in flight at once
         """
         self.assignments = list()
         self.courses = list()
@@ -51,6 +83,22 @@ class GraphQLExtractor(object):
         self.sections = list()
         self.submissions = list()
         self.students = list()
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.throttle = RateLimitThrottle()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.submissions_handler: Optional[Callable[[List], Optional[bool]]] = None
+        self.submissions_batch_size = SUBMISSIONS_BATCH_SIZE
+        self.watermarks: Optional[Watermarks] = None
+        self._pending_watermarks: Dict[str, Tuple[Optional[str], bool]] = {}
+        # The submission ids of the courses pulled in full, by course id
+        self._pending_full_syncs: Dict[str, List[str]] = {}
+
+        # One keep-alive connection per concurrent request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         self.set_account(account)
         self.set_credentials(url, token)
@@ -74,41 +122,105 @@ class GraphQLExtractor(object):
         GRAPHQL_URL = f"{self.url}/api/graphql"
         GRAPHQL_AUTH = {'Authorization': f'Bearer {self.token}'}
 
-        fetch = requests.post(
+        self.throttle.wait()
+        fetch = self.session.post(
             GRAPHQL_URL,
             headers=GRAPHQL_AUTH,
             json={"query": query}
             )
+        self.throttle.update(fetch.headers)
         if fetch.status_code != 200:
             fetch.raise_for_status()
 
-        body = json.loads(fetch.text)
+        # Parse the raw bytes, without first decoding them to a string
+        body = json.loads(fetch.content)
 
         if "errors" in body:
             raise RuntimeError(str(body))
         return body
 
-    def extract(self, body) -> None:
+    def get_remaining_nodes(self, course, updated_since: Optional[str] = None) -> None:
         """
-        Extract data from GraphQL query in Canvas
+        Complete the connections nested in a course that have more than one
+        page of nodes, following each connection's own cursor
 
         Parameters
         ----------
-        body: Dict JSON Object
+        course: Dict JSON Object
+            a course node, which will be mutated by appending the nodes
+            of the following pages
+        updated_since: str, optional
+            only get the submissions updated since this date
         """
-        courses = body["data"]["account"]["coursesConnection"]["nodes"][0]
+        for name in COURSE_CONNECTIONS:
+            connection = course.get(name)
+            while connection and connection.get("pageInfo", {}).get("hasNextPage"):
+                logging.debug(f"Getting next page of {name} for course {course['_id']}")
+                query = nested_query_builder(
+                    course["_id"],
+                    name,
+                    connection["pageInfo"]["endCursor"],
+                    updated_since if name == SUBMISSIONS_CONNECTION else None,
+                )
+                next_page = self.get_from_canvas(query)["data"]["course"][name]
+
+                connection["nodes"].extend(next_page["nodes"])
+                connection["pageInfo"] = next_page["pageInfo"]
+
+    def _is_extracted(self, course) -> bool:
+        if course["state"] not in ["available", "completed"]:
+            return False
+
+        start_term = course["term"]["startAt"]
+        end_term = course["term"]["endAt"]
+
+        if start_term is not None and end_term is not None:
+            if not validate_date(self.start, self.end, start_term, end_term):
+                return False
+
+        return True
+
+    def _map(self, function: Callable, items: List) -> Iterator:
+        if self._executor is None:
+            return map(function, items)
+        return self._executor.map(function, items)
 
-        for course in courses["term"]["coursesConnection"]["nodes"]:
-            if course["state"] not in ["available", "completed"]:
-                continue
-
-            start_term = courses["term"]["startAt"]
-            end_term = courses["term"]["endAt"]
+    def extract(self, body) -> None:
+        """
+        Extract data from a page of the GraphQL query in Canvas
 
-            if start_term is not None and end_term is not None:
-                if not validate_date(self.start, self.end, start_term, end_term):
-                    continue
+        Parameters
+        ----------
+        body: Dict JSON Object
+        """
+        nodes = body["data"]["account"]["coursesConnection"]["nodes"]
+        courses = [course for course in nodes if self._is_extracted(course)]
 
+        updated_since: Dict[str, str] = {}
+        if self.watermarks is not None:
+            updated_since = self.watermarks.updated_since(
+                [course["_id"] for course in courses]
+            )
+            # The submissions are left out of the page query, and requested
+            # for each course with its own updatedSince filter instead
+            for course in courses:
+                course[SUBMISSIONS_CONNECTION] = {
+                    "nodes": [],
+                    "pageInfo": {"hasNextPage": True, "endCursor": ""},
+                }
+
+        def get_remaining_nodes(course) -> None:
+            self.get_remaining_nodes(course, updated_since.get(course["_id"]))
+
+        # The follow-up pages of each course are independent, so they can
+        # be fetched concurrently
+        for _ in self._map(get_remaining_nodes, courses):
+            pass
+
+        if updated_since:
+            self._add_synced_submissions(courses, updated_since)
+
+        for course in courses:
             self.courses.append({
                 "id": course["_id"],
                 "name": course["name"],
@@ -182,45 +294,45 @@ class GraphQLExtractor(object):
                     })
 
             if course.get("submissionsConnection", {}).get("nodes"):
-                # Get the section
-                _section_ids = [_section["_id"] for _section in sections]
+                # Index the first submission of each user for each assignment
+                _submissions_by_user_assignment: Dict[Tuple[str, str], Dict] = {}
+                for _submission in course["submissionsConnection"]["nodes"]:
+                    _user_id = _submission["user"]["_id"]
+                    _key = (_user_id, _submission["assignment"]["_id"])
+                    _submissions_by_user_assignment.setdefault(_key, _submission)
+
+                # Get the enrolled users of each section
+                _enrolled_users_by_section: Dict[str, List[str]] = {}
+                for _enrollment in course.get("enrollmentsConnection", {}).get("nodes"):
+                    if _enrollment["type"] not in ["TeacherEnrollment"]:
+                        _enrolled_users_by_section.setdefault(
+                            _enrollment["section"]["_id"], []
+                        ).append(_enrollment["user"]["_id"])
+
+                now = datetime.now(timezone.utc)
+                _past_due = {
+                    _assignment["_id"]: _assignment["dueAt"] is not None
+                    and (format_full_date(_assignment["dueAt"]) - now).days <= 0
+                    for _assignment in assignments
+                }
+
                 # For each section with submissions
-                for _section_id in _section_ids:
-                    logging.debug(f"Section > {_section_id}")
+                for _section in sections:
+                    _section_id = _section["_id"]
+                    logging.debug("Section > %s", _section_id)
+                    _enrolled_users = _enrolled_users_by_section.get(_section_id, [])
+                    logging.debug("Enrollments of the section: %s", _enrolled_users)
                     # Get the assignments
-                    for _assignment in course.get("assignmentsConnection", {}).get("nodes"):
+                    for _assignment in assignments:
                         assignment_id = _assignment["_id"]
+                        is_past_due = _past_due[assignment_id]
 
-                        is_past_due = False
-                        now = datetime.now(timezone.utc)
-
-                        if _assignment["dueAt"] is not None:
-                            due_date = format_full_date(_assignment["dueAt"])
-                            is_past_due = (due_date - now).days <= 0
-
-                        logging.debug(f"Assignment > {assignment_id}")
-                        # Get the enrollments in the section
-                        _enrolled_users = [
-                            _enrollment["user"]["_id"]
-                            for _enrollment
-                            in course.get("enrollmentsConnection", {}).get("nodes")
-                            if _enrollment["section"]["_id"] == _section_id
-                            if _enrollment["type"] not in ["TeacherEnrollment"]
-                            ]
-                        logging.debug("Enrollments of the section")
-                        logging.debug(json.dumps(_enrolled_users, indent=2))
+                        logging.debug("Assignment > %s", assignment_id)
                         for _enrollment in _enrolled_users:
-                            logging.debug(f"Enrollment > {_enrollment}")
-                            _submission = [
-                                _submission
-                                for _submission
-                                in course.get("submissionsConnection", {}).get("nodes")
-                                if _submission["user"]["_id"] == _enrollment
-                                if _submission["assignment"]["_id"] == assignment_id
-                                ]
-                            if _submission:
-                                logging.debug(f"There is a submission for {_enrollment} in assignment {assignment_id}")
-                                submission = _submission[0]
+                            submission = _submissions_by_user_assignment.get(
+                                (_enrollment, assignment_id)
+                            )
+                            if submission:
                                 _new_submission = {
                                     "course_id": course["_id"],
                                     "section_id": _section_id,
@@ -237,7 +349,6 @@ class GraphQLExtractor(object):
                                     }
                                 self.submissions.append(_new_submission)
                             else:
-                                logging.debug(f"There are no submissions for {_enrollment} in assignment {assignment_id}")
                                 _no_submission = {
                                     "course_id": course["_id"],
                                     "section_id": _section_id,
@@ -285,12 +396,111 @@ class GraphQLExtractor(object):
                         }
                         self.submissions.append(_no_submission)
 
-            if courses.get("pageInfo"):
-                courses_page = courses["pageInfo"]
-                if courses_page["hasNextPage"]:
-                    after = courses_page["endCursor"]
-                    query = query_builder(self.account, after)
-                    self.get_from_canvas(query)
+            if self.watermarks is not None:
+                nodes = course[SUBMISSIONS_CONNECTION]["nodes"]
+                full_sync = course["_id"] not in updated_since
+                self._pending_watermarks[course["_id"]] = (
+                    _latest_updated_at(nodes),
+                    full_sync,
+                )
+                if full_sync:
+                    self._pending_full_syncs[course["_id"]] = [
+                        node["_id"] for node in nodes
+                    ]
+
+            if len(self.submissions) >= self.submissions_batch_size:
+                self._flush_submissions()
+
+    def _add_synced_submissions(self, courses: List, updated_since: Dict) -> None:
+        """
+        Complete the submissions of the courses pulled incrementally with the
+        submissions synced by earlier runs that have not been updated since
+        """
+        assert self.watermarks is not None
+        synced: Dict[str, List] = {}
+        for row in synced_submissions(list(updated_since), self.watermarks.sync_db):
+            synced.setdefault(row["course_id"], []).append({
+                "_id": row["id"],
+                "late": row["late"],
+                "missing": row["missing"],
+                "submittedAt": row["submitted_at"],
+                "grade": row["grade"],
+                "createdAt": row["created_at"],
+                "updatedAt": row["updated_at"],
+                "gradedAt": row["graded_at"],
+                "user": {"_id": row["user_id"]},
+                "assignment": {"_id": row["assignment_id"]},
+            })
+
+        for course in courses:
+            nodes = course[SUBMISSIONS_CONNECTION]["nodes"]
+            updated_ids = {node["_id"] for node in nodes}
+            nodes.extend(
+                node
+                for node in synced.get(course["_id"], [])
+                if node["_id"] not in updated_ids
+            )
+
+    def stream_submissions(
+        self,
+        handler: Callable[[List], Optional[bool]],
+        batch_size: int = SUBMISSIONS_BATCH_SIZE,
+        watermarks: Optional[Watermarks] = None,
+    ) -> None:
+        """
+        Pass the submissions to a handler in batches while the pages are
+        extracted, instead of keeping all of them in memory. A batch holds the
+        submissions of one or more whole courses, and is passed on once it
+        reaches the batch size and at the end of the run.
+
+        With watermarks, only the submissions updated since the previous run
+        are requested for each course, and completed with the submissions
+        synced by earlier runs. The marks of the courses in a batch are saved
+        once the handler has processed it, and the synced submissions that a
+        full pull of a course no longer returns are deleted.
+
+        Parameters
+        ----------
+        handler: Callable[[List], Optional[bool]]
+            receives each batch as a sorted List of Submissions, and returns
+            False when the batch could not be processed
+        batch_size: int
+            the number of submissions that triggers a batch
+        watermarks: Watermarks, optional
+            the submission watermarks of each course
+        """
+        self.submissions_handler = handler
+        self.submissions_batch_size = batch_size
+        self.watermarks = watermarks
+
+    def _flush_submissions(self) -> None:
+        if self.submissions_handler is None:
+            return
+
+        if self.submissions:
+            batch = self.get_submissions()
+            self.submissions = list()
+            if self.submissions_handler(batch) is False:
+                # Keep the previous marks, so these courses are pulled again
+                self._pending_watermarks = {}
+                self._pending_full_syncs = {}
+                return
+
+        if self.watermarks is not None:
+            # Before the marks, so that an interrupted run pulls in full again
+            for course_id, submission_ids in self._pending_full_syncs.items():
+                delete_missing_submissions(
+                    course_id, submission_ids, self.watermarks.sync_db
+                )
+            for course_id, (updated_at, full_sync) in self._pending_watermarks.items():
+                self.watermarks.save(course_id, updated_at, full_sync)
+        self._pending_watermarks = {}
+        self._pending_full_syncs = {}
+
+    def _page_connections(self) -> List[str]:
+        if self.watermarks is None:
+            return list(COURSE_CONNECTIONS)
+        return [name for name in COURSE_CONNECTIONS if name != SUBMISSIONS_CONNECTION]
 
     def get_assignments(self) -> List[Dict[str, str]]:
         """
@@ -400,15 +610,47 @@ class GraphQLExtractor(object):
 
     def run(self) -> None:
         """
-        Builds and executes a GraphQL query, storing the results in self for
-        further processing.
-        """
-        if not self.has_data:
-            query = query_builder(self.account)
-
-            data = self.get_from_canvas(query)
+        Builds and executes a GraphQL query for each page of courses, storing
+        the results in self for further processing.
 
-            if data:
-                self.extract(data)
-                self.has_data = True
+        Up to `max_concurrency` requests run at once: the next page of courses
+        is requested as soon as its cursor is known, while the current page's
+        courses are completed and extracted.
+        """
+        if self.has_data:
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            self._executor = executor
+            try:
+                self._run_pages(executor)
+            finally:
+                self._executor = None
         return None
+
+    def _run_pages(self, executor: ThreadPoolExecutor) -> None:
+        query = query_builder(
+            self.account, "", self.page_size, self._page_connections()
+        )
+        next_page: Optional[Future] = executor.submit(self.get_from_canvas, query)
+
+        while next_page is not None:
+            data = next_page.result()
+            if not data:
+                return
+
+            next_page = None
+            page_info = data["data"]["account"]["coursesConnection"]["pageInfo"]
+            if page_info["hasNextPage"]:
+                query = query_builder(
+                    self.account,
+                    page_info["endCursor"],
+                    self.page_size,
+                    self._page_connections(),
+                )
+                next_page = executor.submit(self.get_from_canvas, query)
+
+            self.extract(data)
+
+        self._flush_submissions()
+        self.has_data = True
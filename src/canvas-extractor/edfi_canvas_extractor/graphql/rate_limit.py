@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import logging
+from threading import Lock
+import time
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_REMAINING_HEADER = "X-Rate-Limit-Remaining"
+REQUEST_COST_HEADER = "X-Request-Cost"
+
+# Canvas starts each token with a bucket of 700 units and refills it at
+# roughly 10 units per second. Requests are held back while the bucket is
+# estimated to be below the threshold, leaving headroom for the requests
+# already in flight.
+RATE_LIMIT_THRESHOLD = 100
+RATE_LIMIT_REFILL_PER_SECOND = 10.0
+
+
+class RateLimitThrottle(object):
+    """
+    Token bucket that mirrors the Canvas rate limit bucket, using the
+    `X-Rate-Limit-Remaining` header of each response. Each request admitted
+    takes the cost of the latest response (`X-Request-Cost`) from the bucket,
+    until the next response reports the actual level. Safe to share between
+    threads.
+    """
+
+    def __init__(
+        self,
+        threshold: float = RATE_LIMIT_THRESHOLD,
+        refill_per_second: float = RATE_LIMIT_REFILL_PER_SECOND,
+    ):
+        self.threshold = threshold
+        self.refill_per_second = refill_per_second
+        self._remaining: Optional[float] = None
+        self._request_cost = 0.0
+        self._updated_at = 0.0
+        self._lock = Lock()
+
+    def _estimated_remaining(self) -> Optional[float]:
+        if self._remaining is None:
+            return None
+        elapsed = time.monotonic() - self._updated_at
+        return self._remaining + elapsed * self.refill_per_second
+
+    def wait(self) -> None:
+        """
+        Block until the bucket is estimated to be at or above the threshold,
+        then take the cost of a request from it. The lock is released while
+        waiting, so that levels reported by responses on other threads are
+        recorded, and seen when the waiting thread wakes.
+        """
+        while True:
+            with self._lock:
+                remaining = self._estimated_remaining()
+                if remaining is None:
+                    return
+
+                if remaining >= self.threshold:
+                    self._remaining = remaining - self._request_cost
+                    self._updated_at = time.monotonic()
+                    return
+
+                delay = (self.threshold - remaining) / self.refill_per_second
+
+            logger.debug(
+                f"Canvas rate limit bucket at {remaining:.0f}, waiting {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Record the bucket level reported in a Canvas response.
+
+        Parameters
+        ----------
+        headers: Mapping[str, str]
+            the response headers
+        """
+        value = headers.get(RATE_LIMIT_REMAINING_HEADER)
+        if value is None:
+            return
+
+        with self._lock:
+            self._remaining = float(value)
+            self._request_cost = float(headers.get(REQUEST_COST_HEADER, 0))
+            self._updated_at = time.monotonic()
@@ -4,12 +4,125 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 
-from typing import Optional
+from typing import Dict, Iterable, Optional
+
+DEFAULT_PAGE_SIZE = 10
+
+# Page size for the connections nested in each course. Kept independent of the
+# course page size so that large course pages stay under the Canvas GraphQL
+# node limits; courses with more nodes are completed with follow-up queries.
+NESTED_PAGE_SIZE = 100
+
+PAGE_INFO = """
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+"""
+
+# Node fields requested from each connection nested in a course
+COURSE_CONNECTIONS: Dict[str, str] = {
+    "assignmentsConnection": """
+        _id
+        name
+        description
+        createdAt
+        updatedAt
+        lockAt
+        unlockAt
+        dueAt
+        submissionTypes
+        pointsPossible
+        course {
+          _id
+          createdAt
+          updatedAt
+        }
+    """,
+    "enrollmentsConnection": """
+        _id
+        createdAt
+        updatedAt
+        state
+        type
+        section {
+          _id
+        }
+        user {
+          _id
+          sisId
+          createdAt
+          email
+          name
+          loginId
+        }
+        grades {
+          finalGrade
+          currentGrade
+          currentScore
+          finalScore
+        }
+    """,
+    "sectionsConnection": """
+        _id
+        sisId
+        name
+        createdAt
+        updatedAt
+    """,
+    "submissionsConnection": """
+        _id
+        late
+        missing
+        submittedAt
+        grade
+        createdAt
+        updatedAt
+        gradedAt
+        user {
+          _id
+        }
+        assignment {
+          _id
+          name
+          description
+          createdAt
+          updatedAt
+          lockAt
+          unlockAt
+          dueAt
+          submissionTypes
+          pointsPossible
+        }
+    """,
+}
+
+
+def _connection(
+    name: str,
+    fields: str,
+    page_size: int,
+    after_cursor: Optional[str] = "",
+    updated_since: Optional[str] = None,
+) -> str:
+    arguments = f'first: {page_size}, after: "{after_cursor or ""}"'
+    if updated_since:
+        arguments += f', filter: {{updatedSince: "{updated_since}"}}'
+    return f"""
+      {name}({arguments}) {{
+        nodes {{
+          {fields}
+        }}
+        {PAGE_INFO}
+      }}
+    """
 
 
 def query_builder(
     account_id: int,
-    after_cursor: Optional[str] = ""
+    after_cursor: Optional[str] = "",
+    page_size: int = DEFAULT_PAGE_SIZE,
+    connections: Iterable[str] = COURSE_CONNECTIONS,
 ) -> str:
     """
     a Query to GraphQL to obtain the data
@@ -20,120 +133,83 @@ def query_builder(
         an account id to get from GraphQL
     after_cursor: str, optional
         to switch between results pages
+    page_size: int, optional
+        the number of courses per page
+    connections: Iterable[str], optional
+        the connections nested in each course, keys of COURSE_CONNECTIONS
 
     Returns
     -------
     string
         a query with parameters to get from GraphQL
     """
-    ACCOUNT_ID = account_id
-    PAGE_SIZE = 1
+    nested_connections = "".join(
+        _connection(name, COURSE_CONNECTIONS[name], NESTED_PAGE_SIZE)
+        for name in connections
+    )
+    course_fields = f"""
+        _id
+        name
+        state
+        term {{
+          startAt
+          endAt
+        }}
+        {nested_connections}
+    """
 
     query = f"""
        {{
-          account(id: {ACCOUNT_ID}) {{
-            coursesConnection(first: {PAGE_SIZE}, after: "{after_cursor}") {{
-            nodes {{
-              term {{
-                startAt
-                endAt
-                coursesConnection {{
-                  nodes {{
-                    _id
-                    name
-                    state
-                    assignmentsConnection {{
-                      nodes {{
-                        _id
-                        name
-                        description
-                        createdAt
-                        updatedAt
-                        lockAt
-                        unlockAt
-                        dueAt
-                        submissionTypes
-                        pointsPossible
-                        course {{
-                            _id
-                            createdAt
-                            updatedAt
-                          }}
-                      }}
-                    }}
-                    enrollmentsConnection {{
-                      nodes {{
-                        _id
-                        createdAt
-                        updatedAt
-                        state
-                        type
-                        section {{
-                          _id
-                        }}
-                        user {{
-                            _id
-                            sisId
-                            createdAt
-                            email
-                            name
-                            loginId
-                        }}
-                        grades {{
-                          finalGrade
-                          currentGrade
-                          currentScore
-                          finalScore
-                        }}
-                      }}
-                    }}
-                    sectionsConnection {{
-                      nodes {{
-                        _id
-                        sisId
-                        name
-                        createdAt
-                        updatedAt
-                      }}
-                    }}
-                    submissionsConnection {{
-                      nodes {{
-                        _id
-                        late
-                        missing
-                        submittedAt
-                        grade
-                        createdAt
-                        updatedAt
-                        gradedAt
-                        user {{
-                          _id
-                        }}
-                        assignment {{
-                          _id
-                          name
-                          description
-                          createdAt
-                          updatedAt
-                          lockAt
-                          unlockAt
-                          dueAt
-                          submissionTypes
-                          pointsPossible
-                        }}
-                      }}
-                    }}
-                  }}
-                }}
-              }}
-            }}
-            pageInfo {{
-              hasNextPage
-              endCursor
-            }}
+          account(id: {account_id}) {{
+            {_connection("coursesConnection", course_fields, page_size, after_cursor)}
           }}
-        }}
-      }}
+       }}
+    """
+
+    return query
+
+
+def nested_query_builder(
+    course_id: str,
+    connection: str,
+    after_cursor: Optional[str] = "",
+    updated_since: Optional[str] = None,
+) -> str:
+    """
+    a Query to GraphQL to obtain the next page of a connection nested
+    in a course
+
+    Parameters
+    ----------
+    course_id: str
+        the id of the course
+    connection: str
+        the name of the connection, one of the keys of COURSE_CONNECTIONS
+    after_cursor: str, optional
+        the end cursor of the previous page of the connection
+    updated_since: str, optional
+        only get the nodes updated since this date, for connections
+        that support the updatedSince filter
+
+    Returns
+    -------
+    string
+        a query with parameters to get from GraphQL
+    """
+    connection_query = _connection(
+        connection,
+        COURSE_CONNECTIONS[connection],
+        NESTED_PAGE_SIZE,
+        after_cursor,
+        updated_since,
+    )
+
+    query = f"""
+       {{
+          course(id: "{course_id}") {{
+            {connection_query}
+          }}
+       }}
     """
 
     return query
@@ -3,6 +3,7 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+import json
 import logging
 from typing import Dict, List
 
@@ -18,6 +19,14 @@ from .canvas_helper import to_df
 
 SUBMISSIONS_RESOURCE_NAME = "Submissions"
 
+# Synced submissions are looked up by course, so the course id in their Json
+# is indexed. Queries must use this exact expression to use the index.
+COURSE_ID_EXPRESSION = "json_extract(Json, '$.course_id')"
+COURSE_ID_INDEX_NAME = f"IX_{SUBMISSIONS_RESOURCE_NAME}_CourseId"
+
+# Keeps each DELETE below SQLite's limit on the number of parameters
+DELETE_BATCH_SIZE = 500
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,10 +52,135 @@ def submissions_synced_as_df(
     """
     submissions_df: DataFrame = _sync_without_cleanup(to_df(submissions), sync_db)
     cleanup_after_sync(SUBMISSIONS_RESOURCE_NAME, sync_db)
+    with sync_db.connect() as con:
+        _ensure_course_id_index(con)
 
     return submissions_df
 
 
+def synced_submissions(
+    course_ids: List[str],
+    sync_db: sqlalchemy.engine.base.Engine,
+) -> List[Dict[str, str]]:
+    """
+    Get the Canvas submissions of some courses stored in the sync database by
+    earlier runs, leaving out the rows generated for missing submissions
+
+    Parameters
+    ----------
+    course_ids: List[str]
+        the ids of the courses
+    sync_db: sqlalchemy.engine.base.Engine
+        an Engine instance for creating database connections
+
+    Returns
+    -------
+    List[Dict[str, str]]
+        a list of Submissions, as they were synced
+    """
+    if not course_ids:
+        return []
+
+    placeholders = ", ".join("?" for _ in course_ids)
+    with sync_db.connect() as con:
+        if not _table_exists(con):
+            return []
+
+        # Databases synced before the index was added get it on first use
+        _ensure_course_id_index(con)
+        rows = con.execute(
+            f"""
+            SELECT Json FROM {SUBMISSIONS_RESOURCE_NAME}
+            WHERE {COURSE_ID_EXPRESSION} IN ({placeholders})
+            AND SourceId NOT LIKE '%#%'
+            """,
+            tuple(course_ids),
+        ).fetchall()
+
+    return [json.loads(row[0]) for row in rows]
+
+
+def delete_missing_submissions(
+    course_id: str,
+    submission_ids: List[str],
+    sync_db: sqlalchemy.engine.base.Engine,
+) -> None:
+    """
+    Delete the synced submissions of a course that a full pull of the course
+    did not return, because they were deleted in Canvas. Otherwise later
+    incremental pulls would add them back from the sync database.
+
+    Parameters
+    ----------
+    course_id: str
+        the id of the course
+    submission_ids: List[str]
+        the ids of all of the submissions returned by the full pull
+    sync_db: sqlalchemy.engine.base.Engine
+        an Engine instance for creating database connections
+    """
+    with sync_db.connect() as con:
+        if not _table_exists(con):
+            return
+
+        _ensure_course_id_index(con)
+        rows = con.execute(
+            f"""
+            SELECT SourceId FROM {SUBMISSIONS_RESOURCE_NAME}
+            WHERE {COURSE_ID_EXPRESSION} = ?
+            AND SourceId NOT LIKE '%#%'
+            """,
+            (course_id,),
+        ).fetchall()
+
+        returned = set(submission_ids)
+        missing = [row[0] for row in rows if row[0] not in returned]
+        if missing:
+            logger.debug(
+                f"Deleting {len(missing)} submissions of course {course_id} "
+                "no longer in Canvas"
+            )
+        for start in range(0, len(missing), DELETE_BATCH_SIZE):
+            batch = missing[start:start + DELETE_BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            con.execute(
+                f"""
+                DELETE FROM {SUBMISSIONS_RESOURCE_NAME}
+                WHERE SourceId IN ({placeholders})
+                """,
+                tuple(batch),
+            )
+
+
+def _table_exists(con: sqlalchemy.engine.base.Connection) -> bool:
+    return (
+        con.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (SUBMISSIONS_RESOURCE_NAME,),
+        ).fetchone()
+        is not None
+    )
+
+
+def _ensure_course_id_index(con: sqlalchemy.engine.base.Connection) -> None:
+    """
+    Create the index on the course id of synced submissions, if it does not
+    exist yet, so that looking up the submissions of a page of courses does
+    not scan every synced submission
+
+    Parameters
+    ----------
+    con: sqlalchemy.engine.base.Connection
+        an open database connection, which will not be closed by this function
+    """
+    con.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS {COURSE_ID_INDEX_NAME}
+        ON {SUBMISSIONS_RESOURCE_NAME} ({COURSE_ID_EXPRESSION})
+        """
+    )
+
+
 def _sync_without_cleanup(
     resource_df: DataFrame, sync_db: sqlalchemy.engine.base.Engine
 ) -> DataFrame:
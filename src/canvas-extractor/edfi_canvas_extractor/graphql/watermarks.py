@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import sqlalchemy
+
+WATERMARKS_TABLE_NAME = "Watermarks"
+
+# Courses are pulled in full again after this many days, to pick up deleted
+# nodes, which the updatedSince filter does not report
+DEFAULT_FULL_SYNC_DAYS = 7
+
+
+class Watermarks(object):
+    """
+    High-water marks of a resource for each course, kept in the sync database:
+    the latest `updatedAt` extracted, and when the course was last pulled in
+    full. Courses without a mark, or whose last full pull is older than
+    `full_sync_days`, are pulled in full.
+    """
+
+    def __init__(
+        self,
+        sync_db: sqlalchemy.engine.base.Engine,
+        resource_name: str,
+        full_sync_days: int = DEFAULT_FULL_SYNC_DAYS,
+    ):
+        self.sync_db = sync_db
+        self.resource_name = resource_name
+        self.full_sync_days = full_sync_days
+
+        with self.sync_db.connect() as con:
+            con.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {WATERMARKS_TABLE_NAME} (
+                    CourseId TEXT NOT NULL,
+                    ResourceName TEXT NOT NULL,
+                    UpdatedAt TEXT,
+                    FullSyncAt TEXT,
+                    PRIMARY KEY (CourseId, ResourceName)
+                )
+                """
+            )
+
+    def updated_since(self, course_ids: List[str]) -> Dict[str, str]:
+        """
+        Get the marks of the courses that are due an incremental pull.
+
+        Parameters
+        ----------
+        course_ids: List[str]
+            the ids of the courses
+
+        Returns
+        -------
+        Dict[str, str]
+            the latest `updatedAt` extracted, by course id. Courses that
+            must be pulled in full are left out.
+        """
+        if not course_ids:
+            return {}
+
+        full_sync_after = datetime.now(timezone.utc) - timedelta(
+            days=self.full_sync_days
+        )
+        placeholders = ", ".join("?" for _ in course_ids)
+        with self.sync_db.connect() as con:
+            rows = con.execute(
+                f"""
+                SELECT CourseId, UpdatedAt FROM {WATERMARKS_TABLE_NAME}
+                WHERE ResourceName = ?
+                AND UpdatedAt IS NOT NULL
+                AND FullSyncAt > ?
+                AND CourseId IN ({placeholders})
+                """,
+                (self.resource_name, full_sync_after.isoformat(), *course_ids),
+            ).fetchall()
+
+        return {course_id: updated_at for course_id, updated_at in rows}
+
+    def save(
+        self, course_id: str, updated_at: Optional[str], full_sync: bool
+    ) -> None:
+        """
+        Record the nodes extracted for a course. A course's mark is kept when
+        it had no nodes.
+
+        Parameters
+        ----------
+        course_id: str
+            the id of the course
+        updated_at: str, optional
+            the latest `updatedAt` of the extracted nodes
+        full_sync: bool
+            whether the course was pulled in full
+        """
+        full_sync_at = datetime.now(timezone.utc).isoformat() if full_sync else None
+        with self.sync_db.connect() as con:
+            con.execute(
+                f"""
+                INSERT INTO {WATERMARKS_TABLE_NAME}
+                    (CourseId, ResourceName, UpdatedAt, FullSyncAt)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (CourseId, ResourceName) DO UPDATE SET
+                    UpdatedAt = COALESCE(excluded.UpdatedAt, UpdatedAt),
+                    FullSyncAt = COALESCE(excluded.FullSyncAt, FullSyncAt)
+                """,
+                (course_id, self.resource_name, updated_at, full_sync_at),
+            )
@@ -3,11 +3,23 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from argparse import ArgumentTypeError
 from dataclasses import dataclass
 from typing import List
 
 from configargparse import ArgParser
 
+from edfi_lms_extractor_lib.csv_generation.write import (
+    CSV_FORMAT,
+    OUTPUT_FORMATS,
+    PARQUET_FORMAT,
+    parquet_supported,
+)
+
+from edfi_canvas_extractor.graphql.extractor import DEFAULT_MAX_CONCURRENCY
+from edfi_canvas_extractor.graphql.schema import DEFAULT_PAGE_SIZE
+from edfi_canvas_extractor.graphql.watermarks import DEFAULT_FULL_SYNC_DAYS
+
 from . import constants
 
 
@@ -28,6 +40,32 @@ class MainArguments:
     extract_assignments: bool = False
     extract_attendance: bool = False
     extract_grades: bool = False
+    output_format: str = CSV_FORMAT
+    page_size: int = DEFAULT_PAGE_SIZE
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    full_sync_days: int = DEFAULT_FULL_SYNC_DAYS
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def _output_format(value: str) -> str:
+    if value == PARQUET_FORMAT and not parquet_supported():
+        raise ArgumentTypeError(
+            "parquet output requires the pyarrow package, from the parquet extra"
+        )
+    return value
+
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise ArgumentTypeError(f"{value} is not a non-negative integer")
+    return number
 
 
 def parse_main_arguments(args_in: List[str]) -> MainArguments:
@@ -129,6 +167,45 @@ def parse_main_arguments(args_in: List[str]) -> MainArguments:
         default=[],
         env_var="FEATURE",
     )
+
+    parser.add(  # type: ignore
+        "--output-format",
+        required=False,
+        help="The format of the generated files. Parquet files are smaller and faster for the LMS Data Store Loader to read.",
+        type=_output_format,
+        choices=OUTPUT_FORMATS,
+        default=CSV_FORMAT,
+        env_var="OUTPUT_FORMAT",
+    )
+
+    parser.add(  # type: ignore
+        "--page-size",
+        required=False,
+        help="The number of courses to request per GraphQL query.",
+        type=_positive_int,
+        default=DEFAULT_PAGE_SIZE,
+        env_var="CANVAS_PAGE_SIZE",
+    )
+
+    parser.add(  # type: ignore
+        "--max-concurrency",
+        required=False,
+        help="The maximum number of concurrent GraphQL requests to Canvas.",
+        type=_positive_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        env_var="MAX_CONCURRENCY",
+    )
+
+    parser.add(  # type: ignore
+        "--full-sync-days",
+        required=False,
+        help="""The number of days after which the submissions of a course are
+        pulled in full again. In between, only the submissions updated since
+        the previous run are pulled. 0 always pulls in full.""",
+        type=_non_negative_int,
+        default=DEFAULT_FULL_SYNC_DAYS,
+        env_var="CANVAS_FULL_SYNC_DAYS",
+    )
     args_parsed = parser.parse_args(args_in)
 
     arguments = MainArguments(
@@ -143,6 +220,10 @@ def parse_main_arguments(args_in: List[str]) -> MainArguments:
         extract_assignments=constants.Features.Assignments in args_parsed.feature,
         extract_attendance=constants.Features.Attendance in args_parsed.feature,
         extract_grades=constants.Features.Grades in args_parsed.feature,
+        output_format=args_parsed.output_format,
+        page_size=args_parsed.page_size,
+        max_concurrency=args_parsed.max_concurrency,
+        full_sync_days=args_parsed.full_sync_days,
     )
 
     return arguments
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from edfi_canvas_extractor.graphql.extractor import GraphQLExtractor
+from edfi_canvas_extractor.graphql.schema import (
+    NESTED_PAGE_SIZE,
+    nested_query_builder,
+    query_builder,
+)
+
+
+def _page_info(end_cursor: Optional[str] = None) -> Dict:
+    return {"hasNextPage": end_cursor is not None, "endCursor": end_cursor}
+
+
+def _connection(nodes: List, end_cursor: Optional[str] = None) -> Dict:
+    return {"nodes": nodes, "pageInfo": _page_info(end_cursor)}
+
+
+def _course(id: str, sections: Dict) -> Dict:
+    return {
+        "_id": id,
+        "name": f"Course {id}",
+        "state": "available",
+        "term": {"startAt": None, "endAt": None},
+        "assignmentsConnection": _connection([]),
+        "enrollmentsConnection": _connection([]),
+        "sectionsConnection": sections,
+        "submissionsConnection": _connection([]),
+    }
+
+
+def _section(id: str) -> Dict:
+    return {
+        "_id": id,
+        "sisId": None,
+        "name": f"Section {id}",
+        "createdAt": None,
+        "updatedAt": None,
+    }
+
+
+def _courses_page(courses: List, end_cursor: Optional[str] = None) -> Dict:
+    page = _connection(courses, end_cursor)
+    return {"data": {"account": {"coursesConnection": page}}}
+
+
+@pytest.fixture
+def gql() -> GraphQLExtractor:
+    gql = GraphQLExtractor(
+        "https://example.com", "1234567890", "1", "2021-01-01", "2030-01-01", 2
+    )
+
+    responses = {
+        query_builder("1", "", 2): _courses_page(
+            [
+                _course("1", _connection([_section("11")], "S1")),
+                _course("2", _connection([_section("21")])),
+            ],
+            "C1",
+        ),
+        query_builder("1", "C1", 2): _courses_page(
+            [_course("3", _connection([_section("31")]))]
+        ),
+        nested_query_builder("1", "sectionsConnection", "S1"): {
+            "data": {
+                "course": {"sectionsConnection": _connection([_section("12")])}
+            }
+        },
+    }
+    gql.get_from_canvas = MagicMock(side_effect=lambda query: responses[query])
+    gql.run()
+    return gql
+
+
+@pytest.mark.unit
+def test_query_builder_uses_the_page_size():
+    query = query_builder("1", "C1", 25)
+
+    assert 'coursesConnection(first: 25, after: "C1")' in query
+    assert f'sectionsConnection(first: {NESTED_PAGE_SIZE}, after: "")' in query
+
+
+@pytest.mark.unit
+def test_run_follows_course_pages(gql: GraphQLExtractor):
+    assert [course["id"] for course in gql.get_courses()] == ["1", "2", "3"]
+
+
+@pytest.mark.unit
+def test_run_follows_nested_connection_pages(gql: GraphQLExtractor):
+    assert [section["id"] for section in gql.get_sections()] == [
+        "11",
+        "12",
+        "21",
+        "31",
+    ]
+
+
+@pytest.mark.unit
+def test_run_queries_each_page_once(gql: GraphQLExtractor):
+    assert gql.get_from_canvas.call_count == 3  # type: ignore
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from edfi_canvas_extractor.graphql.extractor import GraphQLExtractor
+
+
+def _connection(nodes: List) -> Dict:
+    return {"nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+
+
+def _course(id: str, students: int) -> Dict:
+    return {
+        "_id": id,
+        "name": f"Course {id}",
+        "state": "available",
+        "term": {"startAt": None, "endAt": None},
+        "assignmentsConnection": _connection(
+            [
+                {
+                    "_id": f"{id}-a",
+                    "name": "Assignment",
+                    "description": None,
+                    "createdAt": None,
+                    "updatedAt": None,
+                    "lockAt": None,
+                    "unlockAt": None,
+                    "dueAt": None,
+                    "submissionTypes": [],
+                    "pointsPossible": 10,
+                }
+            ]
+        ),
+        "enrollmentsConnection": _connection(
+            [
+                {
+                    "_id": f"{id}-{user}",
+                    "createdAt": None,
+                    "updatedAt": None,
+                    "state": "active",
+                    "type": "StudentEnrollment",
+                    "section": {"_id": f"{id}-s"},
+                    "user": {
+                        "_id": str(user),
+                        "sisId": None,
+                        "createdAt": None,
+                        "email": None,
+                        "name": f"User {user}",
+                        "loginId": None,
+                    },
+                    "grades": None,
+                }
+                for user in range(students)
+            ]
+        ),
+        "sectionsConnection": _connection(
+            [
+                {
+                    "_id": f"{id}-s",
+                    "sisId": None,
+                    "name": "Section",
+                    "createdAt": None,
+                    "updatedAt": None,
+                }
+            ]
+        ),
+        "submissionsConnection": _connection([]),
+    }
+
+
+@pytest.fixture
+def gql() -> GraphQLExtractor:
+    gql = GraphQLExtractor("https://example.com", "1234567890", "1", None, None)
+    page = _connection([_course("1", 2), _course("2", 3), _course("3", 1)])
+    gql.get_from_canvas = MagicMock(  # type: ignore
+        return_value={"data": {"account": {"coursesConnection": page}}}
+    )
+    return gql
+
+
+def _course_ids(batch: List) -> List[str]:
+    return [submission["course_id"] for submission in batch]
+
+
+@pytest.mark.unit
+def test_submissions_stay_in_memory_without_a_handler(gql: GraphQLExtractor):
+    gql.run()
+
+    assert len(gql.get_submissions()) == 6
+
+
+@pytest.mark.unit
+def test_submissions_are_passed_in_batches_of_whole_courses(gql: GraphQLExtractor):
+    batches: List[List] = []
+    gql.stream_submissions(batches.append, batch_size=4)
+
+    gql.run()
+
+    assert [_course_ids(batch) for batch in batches] == [
+        ["1", "1", "2", "2", "2"],
+        ["3"],
+    ]
+    assert gql.get_submissions() == []
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import Dict, List, Optional
+
+import pytest
+
+from edfi_canvas_extractor.graphql.extractor import GraphQLExtractor
+
+PAST_DUE = "2021-01-01T00:00:00Z"
+NOT_DUE = "2999-01-01T00:00:00Z"
+
+
+def _connection(nodes: List) -> Dict:
+    return {"nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+
+
+def _assignment(id: str, due_at: Optional[str]) -> Dict:
+    return {
+        "_id": id,
+        "name": f"Assignment {id}",
+        "description": None,
+        "createdAt": None,
+        "updatedAt": None,
+        "lockAt": None,
+        "unlockAt": None,
+        "dueAt": due_at,
+        "submissionTypes": ["online_text_entry"],
+        "pointsPossible": 10,
+    }
+
+
+def _enrollment(user_id: str, section_id: str, type: str) -> Dict:
+    return {
+        "_id": f"{section_id}-{user_id}",
+        "createdAt": None,
+        "updatedAt": None,
+        "state": "active",
+        "type": type,
+        "section": {"_id": section_id},
+        "user": {
+            "_id": user_id,
+            "sisId": None,
+            "createdAt": None,
+            "email": None,
+            "name": f"User {user_id}",
+            "loginId": None,
+        },
+        "grades": None,
+    }
+
+
+def _section(id: str) -> Dict:
+    return {
+        "_id": id,
+        "sisId": None,
+        "name": f"Section {id}",
+        "createdAt": None,
+        "updatedAt": None,
+    }
+
+
+def _submission(id: str, user_id: str, assignment_id: str) -> Dict:
+    return {
+        "_id": id,
+        "late": False,
+        "missing": False,
+        "submittedAt": "2021-01-02T00:00:00Z",
+        "grade": "A",
+        "createdAt": None,
+        "updatedAt": None,
+        "gradedAt": None,
+        "user": {"_id": user_id},
+        "assignment": {"_id": assignment_id},
+    }
+
+
+def _submission_row(section_id: str, id: str, user_id: str, assignment_id: str):
+    return {
+        "course_id": "1",
+        "section_id": section_id,
+        "assignment_id": assignment_id,
+        "id": id,
+        "user_id": user_id,
+        "late": False,
+        "missing": False,
+        "submitted_at": "2021-01-02T00:00:00Z",
+        "grade": "A",
+        "created_at": None,
+        "updated_at": None,
+        "graded_at": None,
+    }
+
+
+def _no_submission_row(
+    section_id: str, user_id: str, assignment_id: str, missing: bool
+) -> Dict:
+    return {
+        "course_id": "1",
+        "section_id": section_id,
+        "assignment_id": assignment_id,
+        "id": f"{section_id}#{assignment_id}#{user_id}",
+        "user_id": user_id,
+        "late": False,
+        "missing": missing,
+        "submitted_at": None,
+        "grade": None,
+        "created_at": None,
+        "updated_at": None,
+        "graded_at": None,
+    }
+
+
+@pytest.fixture
+def submissions() -> List:
+    gql = GraphQLExtractor("https://example.com", "1234567890", "1", None, None)
+    course = {
+        "_id": "1",
+        "name": "Course 1",
+        "state": "available",
+        "term": {"startAt": None, "endAt": None},
+        "assignmentsConnection": _connection(
+            [_assignment("a1", PAST_DUE), _assignment("a2", NOT_DUE)]
+        ),
+        "enrollmentsConnection": _connection(
+            [
+                _enrollment("t1", "s1", "TeacherEnrollment"),
+                _enrollment("u2", "s1", "StudentEnrollment"),
+                _enrollment("u1", "s1", "StudentEnrollment"),
+                _enrollment("u1", "s2", "StudentEnrollment"),
+            ]
+        ),
+        "sectionsConnection": _connection([_section("s1"), _section("s2")]),
+        "submissionsConnection": _connection(
+            [
+                _submission("sub1", "u1", "a1"),
+                _submission("sub2", "u1", "a1"),
+                _submission("sub3", "t1", "a1"),
+                _submission("sub4", "u2", "a2"),
+            ]
+        ),
+    }
+    gql.extract({"data": {"account": {"coursesConnection": _connection([course])}}})
+    return gql.get_submissions()
+
+
+@pytest.mark.unit
+def test_submissions_follow_sections_assignments_and_enrollments(submissions):
+    assert submissions == [
+        _no_submission_row("s1", "u2", "a1", missing=True),
+        _submission_row("s1", "sub1", "u1", "a1"),
+        _submission_row("s1", "sub4", "u2", "a2"),
+        _no_submission_row("s1", "u1", "a2", missing=False),
+        _submission_row("s2", "sub1", "u1", "a1"),
+        _no_submission_row("s2", "u1", "a2", missing=False),
+    ]
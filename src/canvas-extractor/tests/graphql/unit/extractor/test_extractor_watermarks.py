@@ -0,0 +1,220 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+import pytest
+import sqlalchemy
+
+from edfi_canvas_extractor.extract_graphql import _write_submissions
+from edfi_canvas_extractor.graphql.extractor import GraphQLExtractor
+from edfi_canvas_extractor.graphql.submissions import (
+    SUBMISSIONS_RESOURCE_NAME,
+    submissions_synced_as_df,
+)
+from edfi_canvas_extractor.graphql.watermarks import DEFAULT_FULL_SYNC_DAYS, Watermarks
+from edfi_canvas_extractor.helpers.arg_parser import MainArguments
+from edfi_lms_extractor_lib.api.sync_db import get_sync_db_engine
+
+
+def _connection(nodes: List) -> Dict:
+    return {"nodes": nodes, "pageInfo": {"hasNextPage": False, "endCursor": None}}
+
+
+def _submission(id: str, user_id: str, grade: str, updated_at: str) -> Dict:
+    return {
+        "_id": id,
+        "late": False,
+        "missing": False,
+        "submittedAt": "2021-01-02T00:00:00Z",
+        "grade": grade,
+        "createdAt": "2021-01-02T00:00:00Z",
+        "updatedAt": updated_at,
+        "gradedAt": None,
+        "user": {"_id": user_id},
+        "assignment": {"_id": "a1"},
+    }
+
+
+def _course() -> Dict:
+    return {
+        "_id": "1",
+        "name": "Course 1",
+        "state": "available",
+        "term": {"startAt": None, "endAt": None},
+        "assignmentsConnection": _connection(
+            [
+                {
+                    "_id": "a1",
+                    "name": "Assignment",
+                    "description": None,
+                    "createdAt": None,
+                    "updatedAt": None,
+                    "lockAt": None,
+                    "unlockAt": None,
+                    "dueAt": None,
+                    "submissionTypes": [],
+                    "pointsPossible": 10,
+                }
+            ]
+        ),
+        "enrollmentsConnection": _connection(
+            [
+                {
+                    "_id": f"e{user}",
+                    "createdAt": None,
+                    "updatedAt": None,
+                    "state": "active",
+                    "type": "StudentEnrollment",
+                    "section": {"_id": "s1"},
+                    "user": {
+                        "_id": user,
+                        "sisId": None,
+                        "createdAt": None,
+                        "email": None,
+                        "name": f"User {user}",
+                        "loginId": None,
+                    },
+                    "grades": None,
+                }
+                for user in ["u1", "u2", "u3"]
+            ]
+        ),
+        "sectionsConnection": _connection(
+            [
+                {
+                    "_id": "s1",
+                    "sisId": None,
+                    "name": "Section",
+                    "createdAt": None,
+                    "updatedAt": None,
+                }
+            ]
+        ),
+    }
+
+
+FIRST_RUN_SUBMISSIONS = [
+    _submission("1", "u1", "B", "2021-01-03T00:00:00Z"),
+    _submission("2", "u2", "C", "2021-01-05T00:00:00Z"),
+]
+SECOND_RUN_SUBMISSIONS = [_submission("2", "u2", "A", "2021-01-08T00:00:00Z")]
+
+
+@pytest.fixture
+def sync_db(tmp_path) -> sqlalchemy.engine.base.Engine:
+    engine = get_sync_db_engine(str(tmp_path))
+    yield engine
+    engine.dispose()
+
+
+def _run(
+    sync_db,
+    canvas_submissions: List,
+    queries: List[str],
+    succeeds: bool = True,
+    write: Optional[Callable[[List], bool]] = None,
+    full_sync_days: int = DEFAULT_FULL_SYNC_DAYS,
+) -> List:
+    gql = GraphQLExtractor("https://example.com", "1234567890", "1", None, None)
+    batches: List = []
+
+    def handler(batch: List) -> bool:
+        if succeeds:
+            submissions_synced_as_df(batch, sync_db)
+            batches.extend(batch)
+        return succeeds
+
+    def get_from_canvas(query: str) -> Dict:
+        queries.append(query)
+        if "coursesConnection" in query:
+            page = _connection([_course()])
+            return {"data": {"account": {"coursesConnection": page}}}
+        submissions = _connection(canvas_submissions)
+        return {"data": {"course": {"submissionsConnection": submissions}}}
+
+    gql.get_from_canvas = get_from_canvas  # type: ignore
+    gql.stream_submissions(
+        write or handler,
+        watermarks=Watermarks(sync_db, SUBMISSIONS_RESOURCE_NAME, full_sync_days),
+    )
+    gql.run()
+    return batches
+
+
+def _grades(batch: List) -> Dict:
+    return {submission["id"]: submission["grade"] for submission in batch}
+
+
+@pytest.mark.unit
+def test_first_run_pulls_all_submissions(sync_db):
+    queries: List[str] = []
+
+    batch = _run(sync_db, FIRST_RUN_SUBMISSIONS, queries)
+
+    assert "submissionsConnection" not in queries[0]
+    assert "updatedSince" not in queries[1]
+    assert _grades(batch) == {"1": "B", "2": "C", "s1#a1#u3": None}
+
+
+@pytest.mark.unit
+def test_next_run_pulls_the_submissions_updated_since_the_mark(sync_db):
+    _run(sync_db, FIRST_RUN_SUBMISSIONS, [])
+    queries: List[str] = []
+
+    batch = _run(sync_db, SECOND_RUN_SUBMISSIONS, queries)
+
+    assert 'filter: {updatedSince: "2021-01-05T00:00:00Z"}' in queries[1]
+    assert _grades(batch) == {"1": "B", "2": "A", "s1#a1#u3": None}
+
+
+@pytest.mark.unit
+def test_marks_are_not_saved_when_the_batch_fails(sync_db):
+    _run(sync_db, FIRST_RUN_SUBMISSIONS, [], succeeds=False)
+    queries: List[str] = []
+
+    _run(sync_db, FIRST_RUN_SUBMISSIONS, queries)
+
+    assert "updatedSince" not in queries[1]
+
+
+@pytest.mark.unit
+def test_submissions_deleted_in_canvas_are_not_added_back(sync_db):
+    _run(sync_db, FIRST_RUN_SUBMISSIONS, [])
+    # Submission 1 is deleted in Canvas, and the course is pulled in full
+    _run(sync_db, FIRST_RUN_SUBMISSIONS[1:], [], full_sync_days=0)
+    queries: List[str] = []
+
+    batch = _run(sync_db, SECOND_RUN_SUBMISSIONS, queries)
+
+    assert "updatedSince" in queries[1]
+    assert _grades(batch) == {"2": "A", "s1#a1#u1": None, "s1#a1#u3": None}
+
+
+@pytest.mark.unit
+def test_marks_are_not_saved_when_the_files_cannot_be_written(sync_db, tmp_path):
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    arguments = MainArguments(
+        base_url="https://example.com",
+        access_token="1234567890",
+        log_level="INFO",
+        output_directory=str(not_a_directory),
+        start_date="2021-01-01",
+        end_date="2021-12-31",
+        sync_database_directory=str(tmp_path),
+    )
+    _run(
+        sync_db,
+        FIRST_RUN_SUBMISSIONS,
+        [],
+        write=partial(_write_submissions, arguments, sync_db),
+    )
+    queries: List[str] = []
+
+    _run(sync_db, FIRST_RUN_SUBMISSIONS, queries)
+
+    assert "updatedSince" not in queries[1]
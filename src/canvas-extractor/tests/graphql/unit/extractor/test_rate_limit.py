@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from threading import Thread
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+
+from edfi_canvas_extractor.graphql import rate_limit
+from edfi_canvas_extractor.graphql.extractor import GraphQLExtractor
+from edfi_canvas_extractor.graphql.rate_limit import RateLimitThrottle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def throttle() -> RateLimitThrottle:
+    return RateLimitThrottle(threshold=100, refill_per_second=10)
+
+
+@pytest.mark.unit
+def test_wait_does_not_block_before_the_first_response(clock, throttle):
+    throttle.wait()
+
+    assert clock.sleeps == []
+
+
+@pytest.mark.unit
+def test_wait_does_not_block_above_the_threshold(clock, throttle):
+    throttle.update({"X-Rate-Limit-Remaining": "500", "X-Request-Cost": "1"})
+
+    throttle.wait()
+
+    assert clock.sleeps == []
+
+
+@pytest.mark.unit
+def test_wait_blocks_until_the_bucket_refills_to_the_threshold(clock, throttle):
+    throttle.update({"X-Rate-Limit-Remaining": "40"})
+
+    throttle.wait()
+
+    assert clock.sleeps == [6.0]
+
+
+@pytest.mark.unit
+def test_wait_counts_the_refill_since_the_last_response(clock, throttle):
+    throttle.update({"X-Rate-Limit-Remaining": "40"})
+    clock.now += 5
+
+    throttle.wait()
+
+    assert clock.sleeps == [1.0]
+
+
+@pytest.mark.unit
+def test_wait_takes_the_request_cost_from_the_bucket(clock, throttle):
+    throttle.update({"X-Rate-Limit-Remaining": "110", "X-Request-Cost": "15"})
+
+    throttle.wait()
+    throttle.wait()
+
+    assert clock.sleeps == [0.5]
+
+
+@pytest.mark.unit
+def test_update_is_recorded_while_a_thread_is_waiting(clock, throttle, monkeypatch):
+    throttle.update({"X-Rate-Limit-Remaining": "40"})
+    updated: List[bool] = []
+    sleep = clock.sleep
+
+    def _sleep(seconds: float) -> None:
+        sleep(seconds)
+        if not updated:
+            updating = Thread(
+                target=throttle.update, args=({"X-Rate-Limit-Remaining": "20"},)
+            )
+            updating.start()
+            updating.join(timeout=1)
+            updated.append(not updating.is_alive())
+
+    monkeypatch.setattr(clock, "sleep", _sleep)
+
+    throttle.wait()
+
+    assert updated == [True]
+    assert clock.sleeps == [6.0, 8.0]
+
+
+@pytest.mark.unit
+def test_get_from_canvas_reuses_a_session_and_updates_the_throttle():
+    gql = GraphQLExtractor("https://example.com", "1234567890", "1", None, None)
+    response = MagicMock(status_code=200, content=b'{"data": {}}')
+    response.headers = {"X-Rate-Limit-Remaining": "650"}
+    gql.session.post = MagicMock(return_value=response)  # type: ignore
+
+    gql.get_from_canvas("{ query }")
+    gql.get_from_canvas("{ query }")
+
+    assert gql.session.post.call_count == 2  # type: ignore
+    assert gql.throttle._remaining == 650
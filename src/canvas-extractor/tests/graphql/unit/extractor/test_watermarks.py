@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import pytest
+import sqlalchemy
+
+from edfi_canvas_extractor.graphql.watermarks import WATERMARKS_TABLE_NAME, Watermarks
+from edfi_lms_extractor_lib.api.sync_db import get_sync_db_engine
+
+
+@pytest.fixture
+def sync_db(tmp_path) -> sqlalchemy.engine.base.Engine:
+    engine = get_sync_db_engine(str(tmp_path))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def watermarks(sync_db) -> Watermarks:
+    return Watermarks(sync_db, "Submissions", full_sync_days=7)
+
+
+@pytest.mark.unit
+def test_courses_without_a_mark_are_pulled_in_full(watermarks: Watermarks):
+    assert watermarks.updated_since(["1"]) == {}
+
+
+@pytest.mark.unit
+def test_courses_pulled_in_full_recently_are_pulled_incrementally(
+    watermarks: Watermarks,
+):
+    watermarks.save("1", "2021-02-01T00:00:00Z", full_sync=True)
+    watermarks.save("2", "2021-03-01T00:00:00Z", full_sync=True)
+
+    assert watermarks.updated_since(["1", "2", "3"]) == {
+        "1": "2021-02-01T00:00:00Z",
+        "2": "2021-03-01T00:00:00Z",
+    }
+
+
+@pytest.mark.unit
+def test_incremental_pulls_move_the_mark(watermarks: Watermarks):
+    watermarks.save("1", "2021-02-01T00:00:00Z", full_sync=True)
+    watermarks.save("1", "2021-02-05T00:00:00Z", full_sync=False)
+
+    assert watermarks.updated_since(["1"]) == {"1": "2021-02-05T00:00:00Z"}
+
+
+@pytest.mark.unit
+def test_pulls_without_nodes_keep_the_mark(watermarks: Watermarks):
+    watermarks.save("1", "2021-02-01T00:00:00Z", full_sync=True)
+    watermarks.save("1", None, full_sync=False)
+
+    assert watermarks.updated_since(["1"]) == {"1": "2021-02-01T00:00:00Z"}
+
+
+@pytest.mark.unit
+def test_courses_are_pulled_in_full_after_the_full_sync_days(
+    watermarks: Watermarks, sync_db
+):
+    watermarks.save("1", "2021-02-01T00:00:00Z", full_sync=True)
+    with sync_db.connect() as con:
+        con.execute(
+            f"UPDATE {WATERMARKS_TABLE_NAME} SET FullSyncAt = '2021-02-01T00:00:00'"
+        )
+
+    assert watermarks.updated_since(["1"]) == {}
+
+
+@pytest.mark.unit
+def test_zero_full_sync_days_always_pulls_in_full(sync_db):
+    watermarks = Watermarks(sync_db, "Submissions", full_sync_days=0)
+    watermarks.save("1", "2021-02-01T00:00:00Z", full_sync=True)
+
+    assert watermarks.updated_since(["1"]) == {}
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import json
+
+import pytest
+import sqlalchemy
+
+from edfi_canvas_extractor.graphql import submissions
+from edfi_canvas_extractor.graphql.submissions import (
+    COURSE_ID_EXPRESSION,
+    COURSE_ID_INDEX_NAME,
+    SUBMISSIONS_RESOURCE_NAME,
+    delete_missing_submissions,
+    submissions_synced_as_df,
+    synced_submissions,
+)
+from edfi_lms_extractor_lib.api.sync_db import get_sync_db_engine
+
+COURSES = 2000
+SUBMISSIONS_PER_COURSE = 50
+
+
+def _submission(course: int, number: int) -> dict:
+    return {
+        "id": f"{course}-{number}",
+        "course_id": str(course),
+        "user_id": str(number),
+        "grade": "A",
+    }
+
+
+@pytest.fixture
+def sync_db(tmp_path) -> sqlalchemy.engine.base.Engine:
+    engine = get_sync_db_engine(str(tmp_path))
+    # Creates the Submissions table the way the extractor does
+    submissions_synced_as_df([_submission(0, 0)], engine)
+
+    # Then fills it with a large history directly, which is much faster
+    with engine.connect() as con:
+        con.execute(
+            f"""
+            INSERT INTO {SUBMISSIONS_RESOURCE_NAME} (SourceId, Json, Hash, SyncNeeded)
+            VALUES (?, ?, '', 0)
+            """,
+            [
+                (f"{course}-{number}", json.dumps(_submission(course, number)))
+                for course in range(1, COURSES)
+                for number in range(SUBMISSIONS_PER_COURSE)
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+def test_synced_submissions_of_a_page_of_courses_are_returned(sync_db):
+    submissions = synced_submissions([str(course) for course in range(10)], sync_db)
+
+    assert sorted(submission["id"] for submission in submissions) == sorted(
+        [_submission(0, 0)["id"]]
+        + [
+            f"{course}-{number}"
+            for course in range(1, 10)
+            for number in range(SUBMISSIONS_PER_COURSE)
+        ]
+    )
+
+
+@pytest.mark.unit
+def test_synced_submissions_are_looked_up_with_the_course_id_index(sync_db):
+    synced_submissions(["1"], sync_db)
+
+    with sync_db.connect() as con:
+        plan = con.execute(
+            f"""
+            EXPLAIN QUERY PLAN
+            SELECT Json FROM {SUBMISSIONS_RESOURCE_NAME}
+            WHERE {COURSE_ID_EXPRESSION} IN (?, ?)
+            AND SourceId NOT LIKE '%#%'
+            """,
+            ("1", "2"),
+        ).fetchall()
+
+    details = " ".join(str(row[-1]) for row in plan)
+    assert f"USING INDEX {COURSE_ID_INDEX_NAME}" in details
+    assert "SCAN" not in details.replace("SCAN CONSTANT", "")
+
+
+@pytest.mark.unit
+def test_databases_synced_without_the_index_get_it(sync_db):
+    with sync_db.connect() as con:
+        con.execute(f"DROP INDEX {COURSE_ID_INDEX_NAME}")
+
+    synced_submissions(["1"], sync_db)
+
+    with sync_db.connect() as con:
+        index = con.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?",
+            (COURSE_ID_INDEX_NAME,),
+        ).fetchone()
+    assert index is not None
+
+
+@pytest.mark.unit
+def test_submissions_missing_from_a_full_pull_are_deleted(sync_db, monkeypatch):
+    monkeypatch.setattr(submissions, "DELETE_BATCH_SIZE", 7)
+
+    delete_missing_submissions("1", ["1-0", "1-1"], sync_db)
+
+    assert sorted(
+        submission["id"] for submission in synced_submissions(["1", "2"], sync_db)
+    ) == sorted(
+        ["1-0", "1-1"] + [f"2-{number}" for number in range(SUBMISSIONS_PER_COURSE)]
+    )
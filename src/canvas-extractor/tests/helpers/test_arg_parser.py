@@ -5,6 +5,9 @@
 
 import pytest
 
+from edfi_canvas_extractor.graphql.extractor import DEFAULT_MAX_CONCURRENCY
+from edfi_canvas_extractor.graphql.schema import DEFAULT_PAGE_SIZE
+from edfi_canvas_extractor.graphql.watermarks import DEFAULT_FULL_SYNC_DAYS
 from edfi_canvas_extractor.helpers.arg_parser import parse_main_arguments, MainArguments
 
 
@@ -56,6 +59,18 @@ def describe_when_parsing_arguments():
         def it_should_default_to_data_directory(result: MainArguments):
             assert result.output_directory == "data/"
 
+        def it_should_default_to_csv_output(result: MainArguments):
+            assert result.output_format == "csv"
+
+        def it_should_default_to_the_default_page_size(result: MainArguments):
+            assert result.page_size == DEFAULT_PAGE_SIZE
+
+        def it_should_default_to_the_default_concurrency(result: MainArguments):
+            assert result.max_concurrency == DEFAULT_MAX_CONCURRENCY
+
+        def it_should_default_to_the_default_full_sync_days(result: MainArguments):
+            assert result.full_sync_days == DEFAULT_FULL_SYNC_DAYS
+
         def it_should_load_the_start_date(result: MainArguments):
             assert result.start_date == TEST_START_DATE
 
@@ -114,3 +129,142 @@ def describe_when_parsing_arguments():
             assert result.extract_activities
             assert result.extract_assignments
             assert result.extract_attendance
+
+    def describe_given_parquet_output_format():
+        def it_should_load_the_output_format():
+            parameters = [
+                "-b",
+                TEST_BASE_URL,
+                "-a",
+                TEST_ACCESS_TOKEN,
+                "-s",
+                TEST_START_DATE,
+                "-e",
+                TEST_END_DATE,
+                "--output-format",
+                "parquet",
+            ]
+
+            result = parse_main_arguments(parameters)
+
+            assert result.output_format == "parquet"
+
+    def describe_given_parquet_output_format_without_pyarrow():
+        def it_should_show_an_error_message(capsys, monkeypatch):
+            monkeypatch.setattr(
+                "edfi_canvas_extractor.helpers.arg_parser.parquet_supported", lambda: False
+            )
+            parameters = [
+                "-b",
+                TEST_BASE_URL,
+                "-a",
+                TEST_ACCESS_TOKEN,
+                "-s",
+                TEST_START_DATE,
+                "-e",
+                TEST_END_DATE,
+                "--output-format",
+                "parquet",
+            ]
+
+            with pytest.raises(SystemExit):
+                parse_main_arguments(parameters)
+
+            assert_error_message(capsys)
+
+    def describe_given_a_page_size():
+        def it_should_load_the_page_size():
+            parameters = [
+                "-b",
+                TEST_BASE_URL,
+                "-a",
+                TEST_ACCESS_TOKEN,
+                "-s",
+                TEST_START_DATE,
+                "-e",
+                TEST_END_DATE,
+                "--page-size",
+                "50",
+            ]
+
+            result = parse_main_arguments(parameters)
+
+            assert result.page_size == 50
+
+    def describe_given_a_page_size_of_zero():
+        def it_should_show_an_error(capsys):
+            parameters = [
+                "-b",
+                TEST_BASE_URL,
+                "-a",
+                TEST_ACCESS_TOKEN,
+                "-s",
+                TEST_START_DATE,
+                "-e",
+                TEST_END_DATE,
+                "--page-size",
+                "0",
+            ]
+
+            with pytest.raises(SystemExit):
+                parse_main_arguments(parameters)
+
+            assert_error_message(capsys)
+
+    def describe_given_a_max_concurrency():
+        def it_should_load_the_max_concurrency():
+            parameters = [
+                "-b",
+                TEST_BASE_URL,
+                "-a",
+                TEST_ACCESS_TOKEN,
+                "-s",
+                TEST_START_DATE,
+                "-e",
+                TEST_END_DATE,
+                "--max-concurrency",
+                "8",
+            ]
+
+            result = parse_main_arguments(parameters)
+
+            assert result.max_concurrency == 8
+
+    def describe_given_full_sync_days_of_zero():
+        def it_should_load_the_full_sync_days():
+            parameters = [
+                "-b",
+                TEST_BASE_URL,
+                "-a",
+                TEST_ACCESS_TOKEN,
+                "-s",
+                TEST_START_DATE,
+                "-e",
+                TEST_END_DATE,
+                "--full-sync-days",
+                "0",
+            ]
+
+            result = parse_main_arguments(parameters)
+
+            assert result.full_sync_days == 0
+
+    def describe_given_negative_full_sync_days():
+        def it_should_show_an_error(capsys):
+            parameters = [
+                "-b",
+                TEST_BASE_URL,
+                "-a",
+                TEST_ACCESS_TOKEN,
+                "-s",
+                TEST_START_DATE,
+                "-e",
+                TEST_END_DATE,
+                "--full-sync-days",
+                "-1",
+            ]
+
+            with pytest.raises(SystemExit):
+                parse_main_arguments(parameters)
+
+            assert_error_message(capsys)
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Compares `resource_sync.add_hash_and_json_to` against the previous row at a
+time implementation, on a generated DataFrame shaped like a submissions pull,
+and checks that both produce identical Json and Hash values. Example:
+
+    poetry run python benchmarks/hash_json_benchmark.py --rows 1000000
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable, Tuple
+
+import numpy as np
+from pandas import DataFrame, Series
+import xxhash
+
+from edfi_lms_extractor_lib.api.resource_sync import add_hash_and_json_to
+
+
+def _row_by_row(df: DataFrame) -> DataFrame:
+    def _json_hash_encode(row: Series) -> Series:
+        json = row.to_json()
+        row["Json"] = json
+        row["Hash"] = xxhash.xxh64_hexdigest(json.encode("utf-8"))
+        return row
+
+    return df.apply(_json_hash_encode, axis=1)
+
+
+def _generate(rows: int) -> DataFrame:
+    ids = np.arange(rows)
+    return DataFrame(
+        {
+            "id": [f"submission-{i}" for i in ids],
+            "courseId": [f"course-{i % 100}" for i in ids],
+            "courseWorkId": [f"coursework-{i % 5000}" for i in ids],
+            "userId": [f"user-{i % 20000}" for i in ids],
+            "state": "TURNED_IN",
+            "late": ids % 7 == 0,
+            "assignedGrade": (ids % 100).astype(float),
+            "updateTime": "2021-01-01T00:00:00.000Z",
+        }
+    )
+
+
+def _time(operation: Callable[[], DataFrame]) -> Tuple[float, DataFrame]:
+    start = perf_counter()
+    result = operation()
+    return perf_counter() - start, result
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    df = _generate(args.rows)
+
+    row_seconds, expected = _time(lambda: _row_by_row(df.copy()))
+    batch_seconds, result = _time(lambda: add_hash_and_json_to(df.copy()))
+
+    identical = result["Json"].equals(expected["Json"]) and result["Hash"].equals(
+        expected["Hash"]
+    )
+
+    print(f"{'method':<14}{'rows':>10}{'seconds':>10}{'rows/s':>12}")
+    for name, seconds in (("row by row", row_seconds), ("batched", batch_seconds)):
+        rate = args.rows / seconds
+        print(f"{name:<14}{args.rows:>10}{seconds:>10.2f}{rate:>12,.0f}")
+    print(f"speedup: {row_seconds / batch_seconds:.1f}x, identical output: {identical}")
+
+
+if __name__ == "__main__":
+    main()
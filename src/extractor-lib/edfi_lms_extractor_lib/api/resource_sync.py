@@ -34,24 +34,37 @@ SYNC_COLUMNS_SQL = """
     """
 
 
-def _json_hash_encode(row: Series) -> Series:
+def _row_dtype(df: DataFrame):
     """
-    Take a DataFrame row, add serialized JSON and hash
+    The dtype of a Series holding one row of the DataFrame, which is the
+    common dtype of all of the columns. For example, integers become floats in a
+    row that also holds a float. Taken from the first row, so the DataFrame must
+    not be empty.
+    """
+    return df.iloc[0].dtype
+
+
+def _to_json_lines(df: DataFrame) -> List[str]:
+    """
+    Serialize each row of a DataFrame to JSON in a single pass. Each string is
+    identical to calling `Series.to_json` on the row, provided the DataFrame's
+    columns already have the row dtype.
 
     Parameters
     ----------
-    row: Series
-        a DataFrame row
+    df: DataFrame
+        a non-empty DataFrame
 
     Returns
     -------
-    Series
-        the row with the json and hash columns added
+    List[str]
+        one JSON object per row
     """
-    json = row.to_json()
-    row["Json"] = json
-    row["Hash"] = xxhash.xxh64_hexdigest(json.encode("utf-8"))
-    return row
+    # JSON escapes newlines inside strings, so each line is one row
+    lines = df.to_json(orient="records", lines=True).split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
 
 
 def add_hash_and_json_to(df: DataFrame) -> DataFrame:
@@ -59,6 +72,10 @@ def add_hash_and_json_to(df: DataFrame) -> DataFrame:
     Create Hash and Json columns for DataFrame.  Do this
     before adding any other columns e.g. SourceId
 
+    Produces the same values, including column data types, as serializing
+    each row with `Series.to_json` and hashing it with xxhash, so that
+    existing sync databases remain valid.
+
     Parameters
     ----------
     df: DataFrame
@@ -69,7 +86,21 @@ def add_hash_and_json_to(df: DataFrame) -> DataFrame:
     DataFrame
         a new DataFrame with the json and hash columns added
     """
-    return df.apply(_json_hash_encode, axis=1)
+    if df.empty:
+        return df.copy()
+
+    row_dtype = _row_dtype(df)
+    rows_df: DataFrame = df if row_dtype == object else df.astype(row_dtype)
+
+    json_lines = _to_json_lines(rows_df)
+
+    # Same data types as combining the row Series back into a DataFrame
+    result: DataFrame = rows_df.astype(object).infer_objects()
+    result["Json"] = json_lines
+    result["Hash"] = [
+        xxhash.xxh64_hexdigest(json.encode("utf-8")) for json in json_lines
+    ]
+    return result
 
 
 def add_sourceid_to(df: DataFrame, identity_columns: List[str]):
@@ -142,46 +173,47 @@ def _create_sync_table_from_resource_df(
     )
 
 
-def _ensure_main_table_exists(
+def _has_unique_source_id(
     resource_name: str,
     con: sqlalchemy.engine.base.Connection,
-):
+) -> bool:
     """
-    Ensure the main resource table exists, creating if necessary.
+    Check whether the main resource table has a unique index on SourceId alone,
+    as required for the ON CONFLICT clause of an upsert.
 
     Parameters
     ----------
     resource_name: str
         the name of the API resource, e.g. "Courses", to be used in SQL
-    table_columns_sql: str
-        the columns for the resource in the database, in SQL table creation form,
-            with dangling commas
     con: sqlalchemy.engine.base.Connection
         an open database connection, which will not be closed by this function
     """
-    con.execute(f"DROP INDEX IF EXISTS SYNCNEEDED_{resource_name}")
-    con.execute(
-        f"""
-        CREATE TABLE IF NOT EXISTS {resource_name} (
-            {SYNC_COLUMNS_SQL}
-        )
-        """
-    )
-    con.execute(
-        f"CREATE INDEX IF NOT EXISTS SYNCNEEDED_{resource_name} ON {resource_name}(SyncNeeded)"
-    )
+    # index_list columns are seq, name, unique, origin, partial
+    for index in con.execute(f"PRAGMA index_list({resource_name})").fetchall():
+        if not index[1] or not index[2]:
+            continue
+        # index_info columns are seqno, cid, name
+        columns = [
+            column[2]
+            for column in con.execute(f"PRAGMA index_info('{index[1]}')").fetchall()
+        ]
+        if columns == ["SourceId"]:
+            return True
+    return False
 
 
-def _create_unmatched_records_temp_table(
+def _ensure_main_table_exists(
     resource_name: str,
     con: sqlalchemy.engine.base.Connection,
 ):
     """
-    Select unmatched records into new temp table - differing by hash for same identity.
-    Single entry in result set if identity only exists in one table (meaning add or missing),
-        so SyncNeeded flag will indicate which table it's from.
-    Double entry in result set if identity exists in both (meaning update needed),
-        so SyncNeeded will show which row is from which table.
+    Ensure the main resource table exists, creating if necessary, and migrate
+    tables created by earlier versions of the sync process:
+
+    - a table without a unique SourceId is de-duplicated, keeping the most
+      recently inserted row, and given a unique index
+    - the SyncNeeded index and any leftover Unmatched table are dropped, as
+      the upsert no longer uses them
 
     Parameters
     ----------
@@ -190,132 +222,66 @@ def _create_unmatched_records_temp_table(
     con: sqlalchemy.engine.base.Connection
         an open database connection, which will not be closed by this function
     """
-    con.execute(f"DROP INDEX IF EXISTS ID_{resource_name}")
-    con.execute(f"DROP TABLE IF EXISTS Unmatched_{resource_name}")
     con.execute(
         f"""
-        CREATE TABLE Unmatched_{resource_name} AS
-        SELECT * FROM (
-            SELECT * FROM {resource_name}
-            UNION ALL
-            SELECT * FROM Sync_{resource_name}
+        CREATE TABLE IF NOT EXISTS {resource_name} (
+            {SYNC_COLUMNS_SQL}
         )
-        GROUP BY SourceId, Hash
-        HAVING COUNT(*) = 1
         """
     )
-    con.execute(
-        f"CREATE INDEX IF NOT EXISTS ID_{resource_name} ON Unmatched_{resource_name}(SourceId)"
-    )
-
 
-def _get_true_create_dates_for_unmatched_records(
-    resource_name: str,
-    con: sqlalchemy.engine.base.Connection,
-):
-    """
-    All rows start with CreateDate and LastModifiedDate initialized to "now",
-        but updated rows need the original CreateDate pulled from existing table.
-
-    Note: UPDATE-FROM is not available in sqlite until v3.33.0, thus the
-        double select goofiness.
-
-    Parameters
-    ----------
-    resource_name: str
-        the name of the API resource, e.g. "Courses", to be used in SQL
-    con: sqlalchemy.engine.base.Connection
-        an open database connection, which will not be closed by this function
-    """
-    con.execute(
-        f"""
-        UPDATE Unmatched_{resource_name}
-            SET CreateDate = (
-                SELECT c.CreateDate
-                FROM {resource_name} c
-                WHERE c.SourceId = Unmatched_{resource_name}.SourceId
+    if not _has_unique_source_id(resource_name, con):
+        logger.info(f"Adding a unique SourceId index to {resource_name}")
+        con.execute(
+            f"""
+            DELETE FROM {resource_name}
+            WHERE rowid NOT IN (
+                SELECT MAX(rowid) FROM {resource_name}
+                GROUP BY SourceId
             )
-            WHERE EXISTS (
-                SELECT *
-                FROM {resource_name} c
-                WHERE c.SourceId = Unmatched_{resource_name}.SourceId
-            ) AND SyncNeeded = 1
-        """
-    )
+            """
+        )
+        con.execute(
+            f"CREATE UNIQUE INDEX SOURCEID_{resource_name} ON {resource_name}(SourceId)"
+        )
+
+    con.execute(f"DROP INDEX IF EXISTS SYNCNEEDED_{resource_name}")
+    con.execute(f"DROP TABLE IF EXISTS Unmatched_{resource_name}")
 
 
-def _update_resource_table_with_changes(
+def _upsert_changes_into_resource_table(
     resource_name: str,
     con: sqlalchemy.engine.base.Connection,
 ):
     """
-    Update main resource table with new and updated records
+    Upsert the sync table into the main resource table in a single pass.
+    New records are inserted, and records whose hash differs are updated with
+    the new Json, Hash and LastModifiedDate while keeping their original
+    CreateDate. Unchanged records are left alone.
+
+    Each sync record is matched through the unique SourceId index, so the work
+    is proportional to the size of the sync table rather than the main table.
 
     Parameters
     ----------
     resource_name: str
         the name of the API resource, e.g. "Courses", to be used in SQL
-    primary_keys: str
-        a comma separated list of the primary key columns for the resource,
-        e.g. "id,courseId"
     con: sqlalchemy.engine.base.Connection
         an open database connection, which will not be closed by this function
     """
-    CHANGED_ROWS_CTE = f"""
-                        changedRows AS (
-                            SELECT * FROM Unmatched_{resource_name}
-                            WHERE (SourceId) IN (
-                                SELECT SourceId FROM Unmatched_{resource_name}
-                                GROUP BY SourceId
-                                HAVING COUNT(*) > 1
-                            ) AND SyncNeeded = 1
-                        )
-                        """
-
-    # delete obsolete data from regular table
-    con.execute(
-        # changed rows CTE (from SyncNeeded side only)
-        f"""
-        WITH
-        {CHANGED_ROWS_CTE}
-        DELETE FROM {resource_name}
-        WHERE (SourceId) IN (
-            SELECT SourceId from changedRows
-        )
-        """
-    )
-
-    # insert new and changed data into regular table
-    con.execute(
-        #    changed rows CTE (from SyncNeeded side only)
-        #    new rows CTE (also from SyncNeeded side)
-        f"""
-        WITH
-            {CHANGED_ROWS_CTE},
-            newRows AS (
-                SELECT * FROM Unmatched_{resource_name}
-                WHERE (SourceId) IN (
-                    SELECT SourceId FROM Unmatched_{resource_name}
-                    GROUP BY SourceId
-                    HAVING COUNT(*) = 1 AND SyncNeeded = 1
-                )
-            )
-        INSERT INTO {resource_name}
-            SELECT * FROM Unmatched_{resource_name}
-            WHERE (SourceId) IN (
-                SELECT SourceId FROM changedRows
-                UNION ALL
-                SELECT SourceId FROM newRows
-            ) AND SyncNeeded = 1
-        """
-    )
-
+    # "WHERE true" avoids a parsing ambiguity between the SELECT's join clause
+    # and the ON CONFLICT clause
     con.execute(
-        # reset SyncNeeded flag on main table
         f"""
-        UPDATE {resource_name}
-        SET SyncNeeded = 0
-        WHERE SyncNeeded != 0
+        INSERT INTO {resource_name} ({", ".join(SYNC_COLUMNS)})
+            SELECT SourceId, Json, Hash, CreateDate, LastModifiedDate, 0
+            FROM Sync_{resource_name}
+            WHERE true
+        ON CONFLICT(SourceId) DO UPDATE SET
+            Json = excluded.Json,
+            Hash = excluded.Hash,
+            LastModifiedDate = excluded.LastModifiedDate
+        WHERE {resource_name}.Hash != excluded.Hash
         """
     )
 
@@ -420,9 +386,7 @@ def sync_to_db_without_cleanup(
 
     with sync_db.connect() as con:
         _ensure_main_table_exists(resource_name, con)
-        _create_unmatched_records_temp_table(resource_name, con)
-        _get_true_create_dates_for_unmatched_records(resource_name, con)
-        _update_resource_table_with_changes(resource_name, con)
+        _upsert_changes_into_resource_table(resource_name, con)
         result_df: DataFrame = _update_dataframe_with_true_dates(
             resource_df, identity_columns, resource_name, con
         )
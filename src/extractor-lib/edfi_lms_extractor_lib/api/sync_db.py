@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import logging
+import os
+
+import sqlalchemy
+from sqlalchemy import create_engine
+
+logger = logging.getLogger(__name__)
+
+SYNC_DB_FILE_NAME = "sync.sqlite"
+
+
+def get_sync_db_engine(sync_database_directory: str) -> sqlalchemy.engine.base.Engine:
+    """
+    Create a SQL Alchemy Engine for the sync.sqlite file in a directory,
+    creating the directory if necessary.
+
+    Parameters
+    ----------
+    sync_database_directory: str
+        directory holding the sync database
+
+    Returns
+    -------
+    sqlalchemy.engine.base.Engine
+        a SQL Alchemy Engine
+    """
+    logger.debug(
+        "Ensuring database directory at %s", os.path.abspath(sync_database_directory)
+    )
+    os.makedirs(sync_database_directory, exist_ok=True)
+    return create_engine(
+        f"sqlite:///{os.path.join(sync_database_directory, SYNC_DB_FILE_NAME)}"
+    )
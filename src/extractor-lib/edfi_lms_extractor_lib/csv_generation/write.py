@@ -3,6 +3,7 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from importlib.util import find_spec
 import logging
 from typing import Dict, List, Tuple
 import os
@@ -19,18 +20,41 @@ GRADES_ROOT_DIRECTORY = ["section={id}", "grades"]
 SECTION_ACTIVITY_DIRECTORY = ["section={id}", "section-activities"]
 SYSTEM_ACTIVITY_ROOT_DIRECTORY = ["system-activities"]
 
+# Output file formats. Parquet requires the optional pyarrow package.
+CSV_FORMAT = "csv"
+PARQUET_FORMAT = "parquet"
+OUTPUT_FORMATS = [CSV_FORMAT, PARQUET_FORMAT]
+
 logger = logging.getLogger(__name__)
 
 
+def parquet_supported() -> bool:
+    """
+    Whether Parquet files can be written, which requires the optional pyarrow
+    package (the "parquet" extra).
+
+    Returns
+    -------
+    bool
+        True if pyarrow is installed
+    """
+    return find_spec("pyarrow") is not None
+
+
 def _normalized_directory_template(
     output_directory: str, additional_path: List[str]
 ) -> str:
     return os.path.join(os.path.normpath(output_directory), *additional_path)
 
 
-def _write_csv(df_to_write: DataFrame, output_date: datetime, directory: str):
+def _write_csv(
+    df_to_write: DataFrame,
+    output_date: datetime,
+    directory: str,
+    output_format: str = CSV_FORMAT,
+):
     """
-    Write a LMS UDM DataFrame to a CSV file
+    Write a LMS UDM DataFrame to a CSV (or Parquet) file
 
     Parameters
     ----------
@@ -40,24 +64,36 @@ def _write_csv(df_to_write: DataFrame, output_date: datetime, directory: str):
         is the timestamp for the filename
     directory: str
         is the directory the file will go in
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
+
+    Raises
+    ------
+    OSError
+        if the directory or the file cannot be written
     """
+    assert output_format in OUTPUT_FORMATS, f"Unknown output format {output_format}"
+
     filename: str = output_date.strftime("%Y-%m-%d-%H-%M-%S")
-    path = os.path.join(directory, f"{filename}.csv")
+    path = os.path.join(directory, f"{filename}.{output_format}")
 
-    try:
-        os.makedirs(directory, exist_ok=True)
+    os.makedirs(directory, exist_ok=True)
+    if output_format == PARQUET_FORMAT:
+        df_to_write.to_parquet(path, index=False)
+    else:
         df_to_write.to_csv(path, index=False)
 
-        logger.info(f"Generated file => {path}")
-    except Exception:
-        logger.exception("An exception occurred while writing file %s", path)
+    logger.info(f"Generated file => {path}")
 
 
 def _write_multi_csv(
-    dfs_to_write: Dict[str, DataFrame], output_date: datetime, directory_template: str
+    dfs_to_write: Dict[str, DataFrame],
+    output_date: datetime,
+    directory_template: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a series of LMS UDM DataFrames to CSV files
+    Write a series of LMS UDM DataFrames to CSV (or Parquet) files
 
     Parameters
     ----------
@@ -67,21 +103,24 @@ def _write_multi_csv(
         is the timestamp for the filename
     directory_template: str
         is the directory the file will go in, with an {id} placeholder
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     assert "{id}" in directory_template
 
     for id_placeholder, df_to_write in dfs_to_write.items():
         directory: str = directory_template.format(id=id_placeholder)
-        _write_csv(df_to_write, output_date, directory)
+        _write_csv(df_to_write, output_date, directory, output_format)
 
 
 def _write_multi_tuple_csv(
     dfs_to_write: Dict[Tuple[str, str], DataFrame],
     output_date: datetime,
     directory_template: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a series of LMS UDM DataFrames to CSV files
+    Write a series of LMS UDM DataFrames to CSV (or Parquet) files
 
     Parameters
     ----------
@@ -91,6 +130,8 @@ def _write_multi_tuple_csv(
         is the timestamp for the filename
     directory_template: str
         is the directory the file will go in, with an {id1} and an {id2} placeholder
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     assert "{id1}" in directory_template
     assert "{id2}" in directory_template
@@ -98,7 +139,7 @@ def _write_multi_tuple_csv(
     for id_tuple, df_to_write in dfs_to_write.items():
         (id1, id2) = id_tuple
         directory: str = directory_template.format(id1=id1, id2=id2)
-        _write_csv(df_to_write, output_date, directory)
+        _write_csv(df_to_write, output_date, directory, output_format)
 
 
 def _fill_in_missing_section_ids(
@@ -128,9 +169,14 @@ def _fill_in_missing_section_ids(
     return full_dfs_to_write
 
 
-def write_users(df_to_write: DataFrame, output_date: datetime, output_directory: str):
+def write_users(
+    df_to_write: DataFrame,
+    output_date: datetime,
+    output_directory: str,
+    output_format: str = CSV_FORMAT,
+):
     """
-    Write a LMS UDM Users DataFrame to a CSV file
+    Write a LMS UDM Users DataFrame to a CSV (or Parquet) file
 
     Parameters
     ----------
@@ -140,19 +186,25 @@ def write_users(df_to_write: DataFrame, output_date: datetime, output_directory:
         is the timestamp for the filename
     output_directory: str
         is the root output directory
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     _write_csv(
         df_to_write,
         output_date,
         _normalized_directory_template(output_directory, USERS_ROOT_DIRECTORY),
+        output_format,
     )
 
 
 def write_sections(
-    df_to_write: DataFrame, output_date: datetime, output_directory: str
+    df_to_write: DataFrame,
+    output_date: datetime,
+    output_directory: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a LMS UDM Sections DataFrame to a CSV file
+    Write a LMS UDM Sections DataFrame to a CSV (or Parquet) file
 
     Parameters
     ----------
@@ -162,11 +214,14 @@ def write_sections(
         is the timestamp for the filename
     output_directory: str
         is the root output directory
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     _write_csv(
         df_to_write,
         output_date,
         _normalized_directory_template(output_directory, SECTIONS_ROOT_DIRECTORY),
+        output_format,
     )
 
 
@@ -175,9 +230,10 @@ def write_section_associations(
     all_section_ids: List[str],
     output_date: datetime,
     output_directory: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a series of LMS UDM UserSectionAssociation DataFrames to CSV files
+    Write a series of LMS UDM UserSectionAssociation DataFrames to CSV (or Parquet) files
 
     Parameters
     ----------
@@ -189,6 +245,8 @@ def write_section_associations(
         is the timestamp for the filename
     output_directory: str
         is the root output directory
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     _write_multi_csv(
         _fill_in_missing_section_ids(dfs_to_write, all_section_ids),
@@ -196,6 +254,7 @@ def write_section_associations(
         _normalized_directory_template(
             output_directory, SECTION_ASSOCIATIONS_ROOT_DIRECTORY
         ),
+        output_format,
     )
 
 
@@ -204,9 +263,10 @@ def write_assignments(
     all_section_ids: List[str],
     output_date: datetime,
     output_directory: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a series of LMS UDM Assignments DataFrames to CSV files
+    Write a series of LMS UDM Assignments DataFrames to CSV (or Parquet) files
 
     Parameters
     ----------
@@ -218,12 +278,15 @@ def write_assignments(
         is the timestamp for the filename
     output_directory: str
         is the root output directory
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
 
     _write_multi_csv(
         _fill_in_missing_section_ids(dfs_to_write, all_section_ids),
         output_date,
         _normalized_directory_template(output_directory, ASSIGNMENT_ROOT_DIRECTORY),
+        output_format,
     )
 
 
@@ -231,9 +294,10 @@ def write_assignment_submissions(
     dfs_to_write: Dict[Tuple[str, str], DataFrame],
     output_date: datetime,
     output_directory: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a series of LMS UDM AssignmentSubmissions DataFrames to CSV files
+    Write a series of LMS UDM AssignmentSubmissions DataFrames to CSV (or Parquet) files
 
     Parameters
     ----------
@@ -243,11 +307,14 @@ def write_assignment_submissions(
         is the timestamp for the filename
     output_directory: str
         is the root output directory
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     _write_multi_tuple_csv(
         dfs_to_write,
         output_date,
         _normalized_directory_template(output_directory, SUBMISSION_ROOT_DIRECTORY),
+        output_format,
     )
 
 
@@ -256,9 +323,10 @@ def write_grades(
     all_section_ids: List[str],
     output_date: datetime,
     output_directory: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a series of LMS UDM Grades DataFrames to CSV files
+    Write a series of LMS UDM Grades DataFrames to CSV (or Parquet) files
 
     Parameters
     ----------
@@ -270,11 +338,14 @@ def write_grades(
         is the timestamp for the filename
     output_directory: str
         is the root output directory
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     _write_multi_csv(
         _fill_in_missing_section_ids(dfs_to_write, all_section_ids),
         output_date,
         _normalized_directory_template(output_directory, GRADES_ROOT_DIRECTORY),
+        output_format,
     )
 
 
@@ -283,9 +354,10 @@ def write_section_activities(
     all_section_ids: List[str],
     output_date: datetime,
     output_directory: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a series of LMS UDM SectionActivity DataFrames to CSV files
+    Write a series of LMS UDM SectionActivity DataFrames to CSV (or Parquet) files
 
     Parameters
     ----------
@@ -297,19 +369,25 @@ def write_section_activities(
         is the timestamp for the filename
     output_directory: str
         is the root output directory
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     _write_multi_csv(
         _fill_in_missing_section_ids(dfs_to_write, all_section_ids),
         output_date,
         _normalized_directory_template(output_directory, SECTION_ACTIVITY_DIRECTORY),
+        output_format,
     )
 
 
 def write_system_activities(
-    df_to_write: DataFrame, output_date: datetime, output_directory: str
+    df_to_write: DataFrame,
+    output_date: datetime,
+    output_directory: str,
+    output_format: str = CSV_FORMAT,
 ):
     """
-    Write a series of LMS UDM System Activities DataFrames to CSV files
+    Write a series of LMS UDM System Activities DataFrames to CSV (or Parquet) files
 
     Parameters
     ----------
@@ -319,6 +397,8 @@ def write_system_activities(
         is the timestamp for the filename
     output_directory: str
         is the root output directory
+    output_format: str
+        is the file format, either "csv" (default) or "parquet"
     """
     _write_csv(
         df_to_write,
@@ -330,4 +410,5 @@ def write_system_activities(
                 f"date={output_date.strftime('%Y-%m-%d')}",
             ],
         ),
+        output_format,
     )
@@ -7,7 +7,8 @@ from datetime import datetime
 from typing import List
 from pathlib import Path
 import pytest
-from pandas import read_sql_query, DataFrame
+from pandas import read_sql_query, DataFrame, Series, array, to_datetime
+import xxhash
 from sqlalchemy import create_engine
 from edfi_lms_extractor_lib.api.resource_sync import (
     SYNC_COLUMNS_SQL,
@@ -59,6 +60,8 @@ NEW_COURSE = [
 
 SYNC_DATA = [CHANGED_COURSE_AFTER, UNCHANGED_COURSE, NEW_COURSE]
 
+INITIAL_DATE = datetime(2020, 9, 14, 12, 0, 0)
+
 
 def prep_expected_sync_df(df: DataFrame, identity_columns: List[str]) -> DataFrame:
     result_df: DataFrame = add_hash_and_json_to(df)
@@ -74,6 +77,17 @@ def prep_from_sync_db_df(df: DataFrame, identity_columns: List[str]) -> DataFram
     return result_df
 
 
+def _read_dates(sync_db) -> DataFrame:
+    with sync_db.connect() as con:
+        dates_df = read_sql_query(
+            "SELECT SourceId, CreateDate, LastModifiedDate FROM Courses",
+            con,
+            index_col="SourceId",
+            parse_dates=["CreateDate", "LastModifiedDate"],
+        )
+    return dates_df
+
+
 @pytest.fixture
 def test_db_fixture():
     Path(DB_FILE).unlink(missing_ok=True)
@@ -94,10 +108,9 @@ def describe_when_testing_sync_with_new_and_missing_and_updated_rows():
         courses_initial_df = add_hash_and_json_to(courses_initial_df)
         add_sourceid_to(courses_initial_df, IDENTITY_COLUMNS)
 
-        dateToUse = datetime(2020, 9, 14, 12, 0, 0)
         courses_initial_df["SyncNeeded"] = 0
-        courses_initial_df["CreateDate"] = dateToUse
-        courses_initial_df["LastModifiedDate"] = dateToUse
+        courses_initial_df["CreateDate"] = INITIAL_DATE
+        courses_initial_df["LastModifiedDate"] = INITIAL_DATE
         courses_initial_df = courses_initial_df[SYNC_COLUMNS]
 
         courses_sync_df = DataFrame(SYNC_DATA, columns=COLUMNS)
@@ -131,9 +144,9 @@ def describe_when_testing_sync_with_new_and_missing_and_updated_rows():
         test_db_after_sync,
     ):
         EXPECTED_COURSE_DATA_AFTER_SYNC = [
+            CHANGED_COURSE_AFTER,
             UNCHANGED_COURSE,
             OMITTED_FROM_SYNC_COURSE,
-            CHANGED_COURSE_AFTER,
             NEW_COURSE,
         ]
         with test_db_after_sync.connect() as con:
@@ -168,26 +181,137 @@ def describe_when_testing_sync_with_new_and_missing_and_updated_rows():
 
             assert expected_sync_courses_df.to_csv() == sync_courses_from_db_df.to_csv()
 
-    def it_should_have_temporary_unmatched_table_with_correct_intermediate_rows(
+    def it_should_keep_create_date_and_update_last_modified_date_of_changed_row(
         test_db_after_sync,
     ):
-        EXPECTED_UNMATCHED_DATA_AFTER_SYNC = [
-            CHANGED_COURSE_BEFORE,
-            CHANGED_COURSE_AFTER,
-            OMITTED_FROM_SYNC_COURSE,
-            NEW_COURSE,
-        ]
+        dates_df = _read_dates(test_db_after_sync)
+
+        assert dates_df.loc["1", "CreateDate"] == INITIAL_DATE
+        assert dates_df.loc["1", "LastModifiedDate"] > INITIAL_DATE
+
+    def it_should_keep_dates_of_unchanged_and_omitted_rows(test_db_after_sync):
+        dates_df = _read_dates(test_db_after_sync)
+
+        assert (dates_df.loc[["2", "3"]] == INITIAL_DATE).all(axis=None)
+
+    def it_should_not_create_an_unmatched_table(test_db_after_sync):
         with test_db_after_sync.connect() as con:
-            expected_unmatched_df = prep_expected_sync_df(
-                DataFrame(EXPECTED_UNMATCHED_DATA_AFTER_SYNC, columns=COLUMNS).astype(
-                    "string"
-                ),
-                IDENTITY_COLUMNS,
+            assert not test_db_after_sync.dialect.has_table(con, "Unmatched_Courses")
+
+
+def describe_when_syncing_into_a_table_without_a_unique_source_id():
+    @pytest.fixture
+    def test_db_after_sync(test_db_fixture):
+        # arrange
+        with test_db_fixture.connect() as con:
+            con.execute(
+                """
+                CREATE TABLE Courses (
+                    SourceId TEXT, Json TEXT, Hash TEXT, CreateDate DATETIME,
+                    LastModifiedDate DATETIME, SyncNeeded BIGINT
+                )
+                """
+            )
+            con.execute("CREATE INDEX SYNCNEEDED_Courses ON Courses(SyncNeeded)")
+            con.execute("CREATE TABLE Unmatched_Courses (SourceId TEXT)")
+            con.execute(
+                """
+                INSERT INTO Courses VALUES
+                    ('1', 'old', 'old', '2020-09-14', '2020-09-14', 0),
+                    ('1', 'new', 'new', '2020-09-14', '2020-09-15', 0)
+                """
             )
 
-            unmatched_from_db_df = prep_from_sync_db_df(
-                read_sql_query("SELECT * from Unmatched_Courses", con).astype("string"),
-                IDENTITY_COLUMNS,
+        # act
+        sync_to_db_without_cleanup(
+            DataFrame([UNCHANGED_COURSE], columns=COLUMNS),
+            IDENTITY_COLUMNS,
+            "Courses",
+            test_db_fixture,
+        )
+
+        return test_db_fixture
+
+    def it_should_keep_the_latest_duplicate(test_db_after_sync):
+        with test_db_after_sync.connect() as con:
+            json_df = read_sql_query(
+                "SELECT SourceId, Json FROM Courses ORDER BY SourceId", con
+            )
+
+        assert json_df["SourceId"].tolist() == ["1", "2"]
+        assert json_df["Json"].iloc[0] == "new"
+
+    def it_should_add_a_unique_source_id_index(test_db_after_sync):
+        with test_db_after_sync.connect() as con:
+            indexes = read_sql_query("PRAGMA index_list(Courses)", con)
+
+        assert indexes[["name", "unique"]].values.tolist() == [["SOURCEID_Courses", 1]]
+
+    def it_should_drop_the_unmatched_table(test_db_after_sync):
+        with test_db_after_sync.connect() as con:
+            assert not test_db_after_sync.dialect.has_table(con, "Unmatched_Courses")
+
+
+def _row_by_row_hash_and_json(df: DataFrame) -> DataFrame:
+    # The original, row at a time, implementation of add_hash_and_json_to
+    def _encode(row: Series) -> Series:
+        json = row.to_json()
+        row["Json"] = json
+        row["Hash"] = xxhash.xxh64_hexdigest(json.encode("utf-8"))
+        return row
+
+    return df.apply(_encode, axis=1)
+
+
+def describe_when_adding_hash_and_json():
+    def describe_given_mixed_column_types():
+        @pytest.fixture
+        def result() -> DataFrame:
+            return add_hash_and_json_to(
+                DataFrame({"id": [1], "name": ["a\nb"], "score": [1.5]})
             )
 
-            assert expected_unmatched_df.to_csv() == unmatched_from_db_df.to_csv()
+        def it_should_serialize_the_row(result: DataFrame):
+            assert result["Json"].tolist() == ['{"id":1,"name":"a\\nb","score":1.5}']
+
+        def it_should_hash_the_json(result: DataFrame):
+            assert result["Hash"].tolist() == ["f58fb09983ee8b22"]
+
+    def describe_given_only_numeric_columns():
+        def it_should_serialize_integers_as_floats_like_a_row():
+            result = add_hash_and_json_to(DataFrame({"id": [1], "score": [1.5]}))
+
+            assert result["Json"].tolist() == ['{"id":1.0,"score":1.5}']
+            assert result["Hash"].tolist() == ["6fe54cd076b6725b"]
+
+    def describe_given_an_empty_DataFrame():
+        def it_should_return_it_unchanged():
+            df = DataFrame(columns=["id"])
+
+            assert add_hash_and_json_to(df).equals(df)
+
+    @pytest.mark.parametrize(
+        "df",
+        [
+            DataFrame(
+                {
+                    "id": ["1", "2", "3"],
+                    "count": [1, 2, 3],
+                    "score": [1.5, None, 1e20],
+                    "flag": [True, False, True],
+                    "nested": [{"a": [1, 2]}, {"b": None}, [1, "/x"]],
+                    "date": to_datetime(["2021-01-01", "2021-02-01 03:04:05", None]),
+                }
+            ),
+            DataFrame({"id": [1, 2], "score": [0.1 + 0.2, 1 / 3]}, index=[5, 3]),
+            DataFrame({"id": array([1, None], dtype="Int64"), "score": [1.0, 2.0]}),
+            DataFrame({"id": array(["1", None], dtype="string"), "unicode": ["é", "\u2028"]}),
+        ],
+    )
+    def it_should_match_row_by_row_serialization(df: DataFrame):
+        expected = _row_by_row_hash_and_json(df.copy())
+
+        result = add_hash_and_json_to(df.copy())
+
+        assert result.equals(expected)
+        assert result.dtypes.tolist() == expected.dtypes.tolist()
@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from pathlib import Path
+
+import pytest
+
+from edfi_lms_extractor_lib.api.sync_db import (
+    SYNC_DB_FILE_NAME,
+    get_sync_db_engine,
+)
+
+
+def describe_when_getting_the_sync_db_engine():
+    @pytest.fixture
+    def directory(tmp_path: Path) -> Path:
+        return tmp_path / "sync"
+
+    @pytest.fixture
+    def engine(directory: Path):
+        engine = get_sync_db_engine(str(directory))
+        yield engine
+        engine.dispose()
+
+    def it_should_create_the_database_in_the_directory(engine, directory: Path):
+        with engine.connect() as con:
+            con.execute("CREATE TABLE Test (id TEXT)")
+
+        assert (directory / SYNC_DB_FILE_NAME).exists()
@@ -4,13 +4,18 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 from datetime import datetime
+import os
 from typing import Dict, Tuple
 from unittest.mock import call, patch
-from pandas import DataFrame
+from pandas import DataFrame, read_parquet
+import pytest
 from edfi_lms_extractor_lib.csv_generation.write import (
+    CSV_FORMAT,
+    PARQUET_FORMAT,
     _write_multi_csv,
     _write_multi_tuple_csv,
-    _write_csv
+    _write_csv,
+    parquet_supported,
 )
 
 
@@ -36,7 +41,7 @@ def describe_when_calling_write_multi_csv_with_one_dataframe():
 
         # assert
         assert mock_write_csv.call_args_list == [
-            call(DF1_TO_WRITE, OUTPUT_DATE, ID1_VALUE)
+            call(DF1_TO_WRITE, OUTPUT_DATE, ID1_VALUE, CSV_FORMAT)
         ]
 
 
@@ -54,8 +59,8 @@ def describe_when_calling_write_multi_csv_with_two_dataframes():
 
         # assert
         assert mock_write_csv.call_args_list == [
-            call(DF1_TO_WRITE, OUTPUT_DATE, ID1_VALUE),
-            call(DF2_TO_WRITE, OUTPUT_DATE, ID2_VALUE),
+            call(DF1_TO_WRITE, OUTPUT_DATE, ID1_VALUE, CSV_FORMAT),
+            call(DF2_TO_WRITE, OUTPUT_DATE, ID2_VALUE, CSV_FORMAT),
         ]
 
 
@@ -72,7 +77,7 @@ def describe_when_calling_write_multi_tuple_csv_with_one_dataframe():
 
         # assert
         assert mock_write_csv.call_args_list == [
-            call(DF1_TO_WRITE, OUTPUT_DATE, f"{ID1_VALUE}{ID2_VALUE}")
+            call(DF1_TO_WRITE, OUTPUT_DATE, f"{ID1_VALUE}{ID2_VALUE}", CSV_FORMAT)
         ]
 
 
@@ -90,18 +95,39 @@ def describe_when_calling_write_multi_tuple_csv_with_two_dataframes():
 
         # assert
         assert mock_write_csv.call_args_list == [
-            call(DF1_TO_WRITE, OUTPUT_DATE, f"{ID1_VALUE}{ID2_VALUE}"),
-            call(DF2_TO_WRITE, OUTPUT_DATE, f"{ID2_VALUE}{ID1_VALUE}")
+            call(DF1_TO_WRITE, OUTPUT_DATE, f"{ID1_VALUE}{ID2_VALUE}", CSV_FORMAT),
+            call(DF2_TO_WRITE, OUTPUT_DATE, f"{ID2_VALUE}{ID1_VALUE}", CSV_FORMAT)
         ]
 
 
 def describe_when_writing_csv_to_file():
-    def it_should_handle_exceptions():
-        df_to_write = DF1_TO_WRITE
-        output_date = OUTPUT_DATE
-        directory = "this:is:invalid:will:cause:exception"
+    def it_should_raise_write_errors_to_the_caller(tmp_path):
+        not_a_directory = tmp_path / "file"
+        not_a_directory.write_text("")
 
-        _write_csv(df_to_write, output_date, directory)
+        with pytest.raises(OSError):
+            _write_csv(DF1_TO_WRITE, OUTPUT_DATE, str(not_a_directory / "users"))
 
-        # if we make it this far without an exception, then the exception caused
-        # by the bad directory must have been handled correctly.
+
+def describe_when_writing_parquet_to_file():
+    def it_should_write_a_parquet_file_with_the_same_name(tmp_path):
+        output_date = datetime(2021, 1, 2, 3, 4, 5)
+
+        _write_csv(DF1_TO_WRITE, output_date, str(tmp_path), PARQUET_FORMAT)
+
+        path = os.path.join(tmp_path, "2021-01-02-03-04-05.parquet")
+        assert read_parquet(path).equals(DF1_TO_WRITE)
+
+
+def describe_when_checking_for_parquet_support():
+    def it_should_be_supported_when_pyarrow_is_installed():
+        pytest.importorskip("pyarrow")
+
+        assert parquet_supported()
+
+    def it_should_not_be_supported_without_pyarrow(monkeypatch):
+        monkeypatch.setattr(
+            "edfi_lms_extractor_lib.csv_generation.write.find_spec", lambda name: None
+        )
+
+        assert not parquet_supported()
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Compares the file size, and the time to read with `file_reader`, of a generated
+submissions file written as CSV and as Parquet. Requires pyarrow. Example:
+
+    poetry run python benchmarks/parquet_benchmark.py --rows 1000000
+"""
+
+from argparse import ArgumentParser
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from edfi_lms_file_utils import file_reader
+
+FILE_NAME = "2021-01-01-00-00-00"
+
+
+def _generate(rows: int) -> pd.DataFrame:
+    dates = pd.Timestamp("2021-01-01") + pd.to_timedelta(
+        np.arange(rows) % 86400, unit="s"
+    )
+    return pd.DataFrame(
+        {
+            "SourceSystemIdentifier": [f"submission-{i}" for i in range(rows)],
+            "SourceSystem": "Benchmark",
+            "AssignmentSourceSystemIdentifier": [
+                f"assignment-{i % 50}" for i in range(rows)
+            ],
+            "LMSUserSourceSystemIdentifier": [
+                f"user-{i % 5000}" for i in range(rows)
+            ],
+            "SubmissionStatus": "on-time",
+            "SubmissionDateTime": dates,
+            "EarnedPoints": np.arange(rows) % 100,
+            "Grade": "A",
+            "SourceCreateDate": dates,
+            "SourceLastModifiedDate": dates,
+            "CreateDate": dates,
+            "LastModifiedDate": dates,
+        }
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    df = _generate(args.rows)
+
+    with TemporaryDirectory() as directory:
+        print(f"{'format':<10}{'rows':>10}{'size (MB)':>12}{'read (s)':>10}")
+        for extension, write in (
+            ("csv", lambda path: df.to_csv(path, index=False)),
+            ("parquet", lambda path: df.to_parquet(path, index=False)),
+        ):
+            path = os.path.join(directory, f"{FILE_NAME}.{extension}")
+            write(path)
+
+            start = perf_counter()
+            rows = file_reader.read_submissions_file(path).shape[0]
+            seconds = perf_counter() - start
+
+            size = os.path.getsize(path) / 1024 / 1024
+            print(f"{extension:<10}{rows:>10}{size:>12.1f}{seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Compares the time to read assignments files from many section directories with
+the previous approach, which concatenated each file onto the accumulated
+DataFrame, against `file_reader.get_all_assignments` with one and with several
+worker threads.
+
+Generates the section directories in a temporary directory. Example:
+
+    poetry run python benchmarks/section_reader_benchmark.py --sections 10000
+"""
+
+from argparse import ArgumentParser
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Tuple
+
+import pandas as pd
+
+from edfi_lms_file_utils import file_reader
+from edfi_lms_file_utils.directory_repository import get_assignments_directory
+
+FILE_NAME = "2021-01-01-00-00-00.csv"
+
+
+def _generate(base_directory: str, sections: int, rows: int) -> pd.DataFrame:
+    for section_id in range(sections):
+        directory = get_assignments_directory(base_directory, section_id)
+        os.makedirs(directory)
+
+        pd.DataFrame(
+            {
+                "SourceSystemIdentifier": [f"{section_id}-{i}" for i in range(rows)],
+                "SourceSystem": "Benchmark",
+                "LMSSectionSourceSystemIdentifier": section_id,
+                "Title": "Assignment",
+                "SourceCreateDate": "2021-01-01 00:00:00",
+                "SourceLastModifiedDate": "2021-01-01 00:00:00",
+                "CreateDate": "2021-01-01 00:00:00",
+                "LastModifiedDate": "2021-01-01 00:00:00",
+            }
+        ).to_csv(os.path.join(directory, FILE_NAME), index=False)
+
+    return pd.DataFrame({"SourceSystemIdentifier": range(sections)})
+
+
+def _quadratic_concat(base_directory: str, sections: pd.DataFrame) -> pd.DataFrame:
+    """The accumulation loop previously used by the `get_all_*` functions."""
+    df = pd.DataFrame()
+    for section_id in sections["SourceSystemIdentifier"].values:
+        s = file_reader.get_assignments(base_directory, section_id)
+
+        if not s.empty:
+            df = pd.concat([df, s])
+
+    return df
+
+
+def _time(operation: Callable[[], pd.DataFrame]) -> Tuple[float, int]:
+    start = perf_counter()
+    df = operation()
+    return perf_counter() - start, df.shape[0]
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--sections", type=int, default=10000)
+    parser.add_argument("--rows", type=int, default=5, help="rows per file")
+    parser.add_argument("--max-workers", type=int, default=8)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as base_directory:
+        sections = _generate(base_directory, args.sections, args.rows)
+
+        cases = [
+            ("quadratic concat", lambda: _quadratic_concat(base_directory, sections)),
+            ("streaming, 1 worker", lambda: file_reader.get_all_assignments(base_directory, sections)),
+            (
+                f"streaming, {args.max_workers} workers",
+                lambda: file_reader.get_all_assignments(
+                    base_directory, sections, max_workers=args.max_workers
+                ),
+            ),
+        ]
+
+        print(f"{'method':<28}{'rows':>10}{'seconds':>10}")
+        for name, operation in cases:
+            seconds, rows = _time(operation)
+            print(f"{name:<28}{rows:>10}{seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
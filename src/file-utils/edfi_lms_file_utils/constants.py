@@ -18,6 +18,13 @@ class Resources:
     USERS = "users"
 
 
+# File extensions written by the extractors. Parquet requires the optional
+# pyarrow package.
+class FileExtensions:
+    CSV = ".csv"
+    PARQUET = ".parquet"
+
+
 # Keys
 class Keys:
     LMS_SECTION_SOURCE_SYSTEM_IDENTIFIER = "LMSSectionSourceSystemIdentifier"
@@ -41,3 +48,44 @@ class DataTypes:
         "Name": "string",
         "EmailAddress": "string"
     }
+    SYSTEM_ACTIVITIES = {
+        "LMSUserSourceSystemIdentifier": "string",
+        "ActivityType": "string",
+        "ActivityStatus": "string",
+        "ParentSourceSystemIdentifier": "string",
+        "ActivityTimeInMinutes": "Int64",
+    }
+    SECTION_ASSOCIATIONS = {
+        "EnrollmentStatus": "string",
+        "LMSSectionSourceSystemIdentifier": "string",
+        "LMSUserSourceSystemIdentifier": "string",
+    }
+    SECTION_ACTIVITIES = {
+        "LMSSectionSourceSystemIdentifier": "string",
+        "LMSUserSourceSystemIdentifier": "string",
+        "ActivityType": "string",
+        "ActivityStatus": "string",
+        "ParentSourceSystemIdentifier": "string",
+        "ActivityTimeInMinutes": "Int64",
+    }
+    SUBMISSIONS = {
+        "Grade": "string",
+        "AssignmentSourceSystemIdentifier": "string",
+        "LMSUserSourceSystemIdentifier": "string",
+        "SubmissionStatus": "string",
+        "EarnedPoints": "Int64",
+    }
+    ATTENDANCE_EVENTS = {
+        "LMSUserSourceSystemIdentifier": "string",
+        "LMSSectionSourceSystemIdentifier": "string",
+        "AttendanceStatus": "string",
+    }
+
+
+# Date columns, beyond the standard create and modified dates, for dataframes
+
+class DateColumns:
+    SYSTEM_ACTIVITIES = ["ActivityDateTime"]
+    SECTION_ACTIVITIES = ["ActivityDateTime"]
+    SUBMISSIONS = ["SubmissionDateTime"]
+    ATTENDANCE_EVENTS = ["EventDate"]
@@ -3,21 +3,103 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
-from typing import Callable, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import pandas as pd  # type: ignore
 
 import edfi_lms_file_utils.file_repository as fr
-from edfi_lms_file_utils.constants import DataTypes, Keys
+from edfi_lms_file_utils.constants import (
+    DataTypes,
+    DateColumns,
+    FileExtensions,
+    Keys,
+    Resources,
+)
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def _default() -> pd.DataFrame:
     return pd.DataFrame()
 
 
+def collect(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates a stream of DataFrame chunks, such as those yielded by the
+    `iter_all_*` functions, into a single DataFrame in one operation.
+
+    Parameters
+    ----------
+    chunks: Iterable[pd.DataFrame]
+        The DataFrames to combine.
+
+    Returns
+    -------
+    pd.DataFrame
+        All of the chunks combined, or an empty DataFrame if there were none.
+    """
+    df_list = [df for df in chunks if not df.empty]
+
+    if len(df_list) == 0:
+        return _default()
+
+    return pd.concat(df_list)
+
+
+def _read_all(
+    items: Iterable[T],
+    read: Callable[[T], pd.DataFrame],
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Applies `read` to each item, yielding the resulting non-empty DataFrames in
+    the order of the items. With more than one worker, the reads run
+    concurrently on a thread pool, which helps with many small files. At most
+    twice as many reads as workers run ahead of the caller, so that memory use
+    stays bounded however slowly the DataFrames are consumed.
+    """
+    assert max_workers > 0, "Argument `max_workers` must be greater than zero"
+
+    if max_workers == 1:
+        results: Iterable[pd.DataFrame] = map(read, items)
+        for df in results:
+            if not df.empty:
+                yield df
+        return
+
+    remaining = iter(items)
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in remaining:
+            pending.append(executor.submit(read, item))
+            if len(pending) == max_workers * 2:
+                break
+
+        while pending:
+            df = pending.popleft().result()
+            for item in remaining:
+                pending.append(executor.submit(read, item))
+                break
+            if not df.empty:
+                yield df
+
+
 def _read_csv(
     file: str,
     nrows: Optional[int] = None,
@@ -25,7 +107,8 @@ def _read_csv(
     extra_date_columns: List[str] = list(),
 ) -> pd.DataFrame:
     """
-    Loads a CSV file into a DataFrame.
+    Loads a CSV file, or a Parquet file written by the extractors, into a
+    DataFrame.
 
     Parameters
     ----------
@@ -49,33 +132,157 @@ def _read_csv(
 
     logger.debug(f"Reading file: {file}")
     if file:
-
-        dates = [
-            "SourceCreateDate",
-            "SourceLastModifiedDate",
-            "CreateDate",
-            "LastModifiedDate",
-            *extra_date_columns,
-        ]
-
-        dtype = {
-            "SourceSystemIdentifier": "string",
-            "SourceSystem": "string",
-            **data_types,
-        }
+        if file.endswith(FileExtensions.PARQUET):
+            return _read_parquet(file, nrows, data_types, extra_date_columns)
 
         return pd.read_csv(
-            file,
-            engine="c",
-            parse_dates=dates,
-            infer_datetime_format=True,
-            nrows=nrows,
-            dtype=dtype,
+            file, nrows=nrows, **_read_csv_options(data_types, extra_date_columns)
         )
 
     return _default()
 
 
+def _read_csv_options(
+    data_types: Dict[str, str], extra_date_columns: List[str]
+) -> Dict[str, Any]:
+    dates = [
+        "SourceCreateDate",
+        "SourceLastModifiedDate",
+        "CreateDate",
+        "LastModifiedDate",
+        *extra_date_columns,
+    ]
+
+    dtype = {
+        "SourceSystemIdentifier": "string",
+        "SourceSystem": "string",
+        **data_types,
+    }
+
+    return {
+        "engine": "c",
+        "parse_dates": dates,
+        "infer_datetime_format": True,
+        "dtype": dtype,
+    }
+
+
+def _apply_types(
+    df: pd.DataFrame, data_types: Dict[str, str], extra_date_columns: List[str]
+) -> pd.DataFrame:
+    """
+    Gives a DataFrame read from a Parquet file the same data types as one read
+    from the equivalent CSV file. Parquet files keep their column types, so
+    date columns are only parsed when they were written as text.
+    """
+    options = _read_csv_options(data_types, extra_date_columns)
+
+    dtype = {k: v for k, v in options["dtype"].items() if k in df.columns}
+    df = df.astype(dtype)
+
+    for column in options["parse_dates"]:
+        if column in df.columns and df[column].dtype == "object":
+            try:
+                df[column] = pd.to_datetime(df[column], infer_datetime_format=True)
+            except (ValueError, TypeError):
+                # Same as read_csv: leave unparseable columns as they are
+                pass
+
+    return df
+
+
+def _read_parquet(
+    file: str,
+    nrows: Optional[int],
+    data_types: Dict[str, str],
+    extra_date_columns: List[str],
+) -> pd.DataFrame:
+    df = pd.read_parquet(file, memory_map=True)
+    if nrows is not None:
+        df = df.head(nrows)
+
+    return _apply_types(df, data_types, extra_date_columns)
+
+
+def _read_parquet_in_chunks(
+    file: str,
+    chunksize: int,
+    data_types: Dict[str, str],
+    extra_date_columns: List[str],
+) -> Iterator[pd.DataFrame]:
+    import pyarrow.parquet as pq  # type: ignore
+
+    parquet_file = pq.ParquetFile(file, memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=chunksize):
+        yield _apply_types(batch.to_pandas(), data_types, extra_date_columns)
+
+
+# Data types and extra date columns for each resource's files
+_FILE_TYPES: Dict[str, Tuple[Dict[str, str], List[str]]] = {
+    Resources.USERS: (DataTypes.USERS, []),
+    Resources.SECTIONS: (DataTypes.SECTIONS, []),
+    Resources.SYSTEM_ACTIVITIES: (
+        DataTypes.SYSTEM_ACTIVITIES,
+        DateColumns.SYSTEM_ACTIVITIES,
+    ),
+    Resources.SECTION_ASSOCIATIONS: (DataTypes.SECTION_ASSOCIATIONS, []),
+    Resources.SECTION_ACTIVITIES: (
+        DataTypes.SECTION_ACTIVITIES,
+        DateColumns.SECTION_ACTIVITIES,
+    ),
+    Resources.ASSIGNMENTS: (dict(), []),
+    Resources.SUBMISSIONS: (DataTypes.SUBMISSIONS, DateColumns.SUBMISSIONS),
+    Resources.GRADES: (dict(), []),
+    Resources.ATTENDANCE_EVENTS: (
+        DataTypes.ATTENDANCE_EVENTS,
+        DateColumns.ATTENDANCE_EVENTS,
+    ),
+}
+
+
+def read_file_in_chunks(
+    resource_name: str, full_path: str, chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads the CSV file for the given path as a sequence of Pandas DataFrames
+    of at most `chunksize` rows each, so that only one chunk of a large file
+    needs to be in memory at a time. Each chunk has the same data types as
+    the DataFrame returned by the resource's `read_*_file` function. Reads
+    either CSV or Parquet files.
+
+    Parameters
+    ----------
+    resource_name: str
+        The resource the file belongs to, as defined in `constants.Resources`
+        (e.g. "users" or "submissions").
+    full_path: str
+        The full path of the file.
+    chunksize: int
+        Maximum number of rows in each DataFrame.
+
+    Returns
+    -------
+    Iterator of Pandas DataFrames with columns matching the model definition / CSV file.
+    """
+    assert chunksize > 0, "Argument `chunksize` must be greater than zero"
+
+    data_types, extra_date_columns = _FILE_TYPES[resource_name]
+
+    logger.debug(f"Reading file in chunks of {chunksize} rows: {full_path}")
+    if full_path.endswith(FileExtensions.PARQUET):
+        yield from _read_parquet_in_chunks(
+            full_path, chunksize, data_types, extra_date_columns
+        )
+        return
+
+    with pd.read_csv(
+        full_path,
+        chunksize=chunksize,
+        **_read_csv_options(data_types, extra_date_columns),
+    ) as reader:
+        yield from reader
+
+
 def get_all_users(base_directory: str, nrows: Optional[int] = None) -> pd.DataFrame:
     """
     Reads the most recent users file into a Pandas DataFrame.
@@ -120,7 +327,7 @@ def read_users_file(full_path: str, nrows: Optional[int] = None) -> pd.DataFrame
 
 
 def get_all_system_activities(
-    base_directory: str, nrows: Optional[int] = None
+    base_directory: str, nrows: Optional[int] = None, max_workers: int = 1
 ) -> pd.DataFrame:
     """
     Reads the most recent system activities files into a Pandas DataFrame.
@@ -134,24 +341,45 @@ def get_all_system_activities(
     nrows: int or None
         (Optional) number of rows to read from the file - useful for testing
         without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
 
     Returns
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    files = fr.get_system_activities_files(base_directory)
+    df = collect(iter_all_system_activities(base_directory, nrows, max_workers))
+    df.drop_duplicates(inplace=True)
 
-    if files is None or len(files) == 0:
-        return _default()
+    return df  # type: ignore
 
-    df_list = list()
-    for f in files:
-        df_list.append(read_system_activities_file(f, nrows))
 
-    df = pd.concat(df_list)
-    df.drop_duplicates(inplace=True)
+def iter_all_system_activities(
+    base_directory: str, nrows: Optional[int] = None, max_workers: int = 1
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams the system activities files into Pandas DataFrames, one per
+    non-empty file. Duplicates are not removed.
 
-    return df  # type: ignore
+    Parameters
+    ----------
+    base_directory: str
+        The base / parent directory for LMS extractor files.
+    nrows: int or None
+        (Optional) number of rows to read from each file - useful for testing
+        without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
+
+    Returns
+    -------
+    Iterator of Pandas DataFrames with columns matching the model definition / CSV file.
+    """
+    files = fr.get_system_activities_files(base_directory) or []
+
+    return _read_all(
+        files, lambda file: read_system_activities_file(file, nrows), max_workers
+    )
 
 
 def read_system_activities_file(
@@ -172,21 +400,8 @@ def read_system_activities_file(
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    data_types = {
-        "LMSUserSourceSystemIdentifier": "string",
-        "ActivityType": "string",
-        "ActivityStatus": "string",
-        "ParentSourceSystemIdentifier": "string",
-        "ActivityTimeInMinutes": "Int64",
-    }
-
-    extra_date_columns = ["ActivityDateTime"]
-
     return _read_csv(
-        full_path,
-        nrows,
-        data_types=data_types,
-        extra_date_columns=extra_date_columns,
+        full_path, nrows, DataTypes.SYSTEM_ACTIVITIES, DateColumns.SYSTEM_ACTIVITIES
     )
 
 
@@ -280,40 +495,34 @@ def read_section_associations_file(
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    data_types = {
-        "EnrollmentStatus": "string",
-        "LMSSectionSourceSystemIdentifier": "string",
-        "LMSUserSourceSystemIdentifier": "string",
-    }
+    return _read_csv(full_path, nrows, DataTypes.SECTION_ASSOCIATIONS)
 
-    return _read_csv(full_path, nrows, data_types=data_types)
 
-
-def _get_data_for_section(
+def _iter_data_for_section(
     base_directory: str,
     sections: pd.DataFrame,
     callback: Callable[[str, int, Optional[int]], pd.DataFrame],
     nrows: Optional[int] = None,
-) -> pd.DataFrame:
-    df = pd.DataFrame()
-
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
     if sections.empty:
         logger.info(
             "No sections have been loaded, therefore no section sub-files can be read."
         )
-        return _default()
-
-    for _, section_id in sections[[Keys.SOURCE_SYSTEM_IDENTIFIER]].itertuples():
-        sa = callback(base_directory, section_id, nrows)
-
-        if not sa.empty:
-            df = pd.concat([df, sa])
+        return iter([])
 
-    return df
+    return _read_all(
+        sections[Keys.SOURCE_SYSTEM_IDENTIFIER],
+        lambda section_id: callback(base_directory, section_id, nrows),
+        max_workers,
+    )
 
 
 def get_all_section_associations(
-    base_directory: str, sections: pd.DataFrame, nrows: Optional[int] = None
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Reads the most recent section associations files for all given sections into
@@ -328,13 +537,46 @@ def get_all_section_associations(
     nrows: int or None
         (Optional) number of rows to read from the file - useful for testing
         without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
 
     Returns
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    return _get_data_for_section(
-        base_directory, sections, get_section_associations, nrows
+    return collect(
+        iter_all_section_associations(base_directory, sections, nrows, max_workers)
+    )
+
+
+def iter_all_section_associations(
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams the most recent section associations files for all given sections into
+    Pandas DataFrames, one per non-empty file.
+
+    Parameters
+    ----------
+    base_directory: str
+        The base / parent directory for LMS extractor files.
+    sections: pd.DataFrame
+        DataFrame containing sections read from a sections file.
+    nrows: int or None
+        (Optional) number of rows to read from the file - useful for testing
+        without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
+
+    Returns
+    -------
+    Iterator of Pandas DataFrames with columns matching the model definition / CSV file.
+    """
+    return _iter_data_for_section(
+        base_directory, sections, get_section_associations, nrows, max_workers
     )
 
 
@@ -385,27 +627,16 @@ def read_section_activities_file(
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    data_types = {
-        "LMSSectionSourceSystemIdentifier": "string",
-        "LMSUserSourceSystemIdentifier": "string",
-        "ActivityType": "string",
-        "ActivityStatus": "string",
-        "ParentSourceSystemIdentifier": "string",
-        "ActivityTimeInMinutes": "Int64",
-    }
-
-    extra_date_columns = ["ActivityDateTime"]
-
     return _read_csv(
-        full_path,
-        nrows,
-        data_types=data_types,
-        extra_date_columns=extra_date_columns,
+        full_path, nrows, DataTypes.SECTION_ACTIVITIES, DateColumns.SECTION_ACTIVITIES
     )
 
 
 def get_all_section_activities(
-    base_directory: str, sections: pd.DataFrame, nrows: Optional[int] = None
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Reads the most recent section activities files for all given sections into
@@ -420,13 +651,46 @@ def get_all_section_activities(
     nrows: int or None
         (Optional) number of rows to read from the file - useful for testing
         without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
 
     Returns
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    return _get_data_for_section(
-        base_directory, sections, get_section_activities, nrows
+    return collect(
+        iter_all_section_activities(base_directory, sections, nrows, max_workers)
+    )
+
+
+def iter_all_section_activities(
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams the most recent section activities files for all given sections into
+    Pandas DataFrames, one per non-empty file.
+
+    Parameters
+    ----------
+    base_directory: str
+        The base / parent directory for LMS extractor files.
+    sections: pd.DataFrame
+        DataFrame containing sections read from a sections file.
+    nrows: int or None
+        (Optional) number of rows to read from the file - useful for testing
+        without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
+
+    Returns
+    -------
+    Iterator of Pandas DataFrames with columns matching the model definition / CSV file.
+    """
+    return _iter_data_for_section(
+        base_directory, sections, get_section_activities, nrows, max_workers
     )
 
 
@@ -479,7 +743,10 @@ def read_assignments_file(full_path: str, nrows: Optional[int] = None) -> pd.Dat
 
 
 def get_all_assignments(
-    base_directory: str, sections: pd.DataFrame, nrows: Optional[int] = None
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Reads the most recent assignments files for all given sections into
@@ -494,12 +761,47 @@ def get_all_assignments(
     nrows: int or None
         (Optional) number of rows to read from the file - useful for testing
         without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
 
     Returns
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    return _get_data_for_section(base_directory, sections, get_assignments, nrows)
+    return collect(
+        iter_all_assignments(base_directory, sections, nrows, max_workers)
+    )
+
+
+def iter_all_assignments(
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams the most recent assignments files for all given sections into
+    Pandas DataFrames, one per non-empty file.
+
+    Parameters
+    ----------
+    base_directory: str
+        The base / parent directory for LMS extractor files.
+    sections: pd.DataFrame
+        DataFrame containing sections read from a sections file.
+    nrows: int or None
+        (Optional) number of rows to read from the file - useful for testing
+        without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
+
+    Returns
+    -------
+    Iterator of Pandas DataFrames with columns matching the model definition / CSV file.
+    """
+    return _iter_data_for_section(
+        base_directory, sections, get_assignments, nrows, max_workers
+    )
 
 
 def get_submissions(
@@ -552,29 +854,19 @@ def read_submissions_file(full_path: str, nrows: Optional[int] = None) -> pd.Dat
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    data_types = {
-        "Grade": "string",
-        "AssignmentSourceSystemIdentifier": "string",
-        "LMSUserSourceSystemIdentifier": "string",
-        "SubmissionStatus": "string",
-        "EarnedPoints": "Int64",
-    }
-
-    extra_date_columns = ["SubmissionDateTime"]
-
     return _read_csv(
-        full_path,
-        nrows,
-        data_types=data_types,
-        extra_date_columns=extra_date_columns,
+        full_path, nrows, DataTypes.SUBMISSIONS, DateColumns.SUBMISSIONS
     )
 
 
 def get_all_submissions(
-    base_directory: str, assignments: pd.DataFrame, nrows: Optional[int] = None
+    base_directory: str,
+    assignments: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
-    Reads the most recent section associations files for all given sections into
+    Reads the most recent submissions files for all given assignments into
     a Pandas DataFrame.
 
     Parameters
@@ -586,27 +878,58 @@ def get_all_submissions(
     nrows: int or None
         (Optional) number of rows to read from the file - useful for testing
         without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
 
     Returns
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
+    return collect(
+        iter_all_submissions(base_directory, assignments, nrows, max_workers)
+    )
+
+
+def iter_all_submissions(
+    base_directory: str,
+    assignments: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams the most recent submissions files for all given assignments into
+    Pandas DataFrames, one per non-empty file.
+
+    Parameters
+    ----------
+    base_directory: str
+        The base / parent directory for LMS extractor files.
+    assignments: pd.DataFrame
+        DataFrame containing assignments read from an assignments file.
+    nrows: int or None
+        (Optional) number of rows to read from the file - useful for testing
+        without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
 
+    Returns
+    -------
+    Iterator of Pandas DataFrames with columns matching the model definition / CSV file.
+    """
     if assignments.empty:
         logger.info(
             "No assignments have been loaded, therefore no submission files can be read."
         )
-        return _default()
+        return iter([])
 
-    df = pd.DataFrame()
     columns = [Keys.SOURCE_SYSTEM_IDENTIFIER, Keys.LMS_SECTION_SOURCE_SYSTEM_IDENTIFIER]
-    for _, assignment_id, section_id in assignments[columns].itertuples():
-        s = get_submissions(base_directory, section_id, assignment_id, nrows)
+    keys = assignments[columns].itertuples(index=False)
 
-        if not s.empty:
-            df = pd.concat([df, s])
-
-    return df
+    return _read_all(
+        keys,
+        lambda key: get_submissions(base_directory, key[1], key[0], nrows),
+        max_workers,
+    )
 
 
 def get_grades(
@@ -658,7 +981,10 @@ def read_grades_file(full_path: str, nrows: Optional[int] = None) -> pd.DataFram
 
 
 def get_all_grades(
-    base_directory: str, sections: pd.DataFrame, nrows: Optional[int] = None
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Reads the most recent grades files for all given sections into
@@ -673,12 +999,47 @@ def get_all_grades(
     nrows: int or None
         (Optional) number of rows to read from the file - useful for testing
         without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
 
     Returns
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    return _get_data_for_section(base_directory, sections, get_grades, nrows)
+    return collect(
+        iter_all_grades(base_directory, sections, nrows, max_workers)
+    )
+
+
+def iter_all_grades(
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams the most recent grades files for all given sections into
+    Pandas DataFrames, one per non-empty file.
+
+    Parameters
+    ----------
+    base_directory: str
+        The base / parent directory for LMS extractor files.
+    sections: pd.DataFrame
+        DataFrame containing sections read from a sections file.
+    nrows: int or None
+        (Optional) number of rows to read from the file - useful for testing
+        without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
+
+    Returns
+    -------
+    Iterator of Pandas DataFrames with columns matching the model definition / CSV file.
+    """
+    return _iter_data_for_section(
+        base_directory, sections, get_grades, nrows, max_workers
+    )
 
 
 def get_attendance_events(
@@ -729,19 +1090,16 @@ def read_attendance_events_file(
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
 
-    data_types = {
-        "LMSUserSourceSystemIdentifier": "string",
-        "LMSSectionSourceSystemIdentifier": "string",
-        "AttendanceStatus": "string",
-    }
-
-    extra_date_columns = ["EventDate"]
-
-    return _read_csv(full_path, nrows, data_types, extra_date_columns)
+    return _read_csv(
+        full_path, nrows, DataTypes.ATTENDANCE_EVENTS, DateColumns.ATTENDANCE_EVENTS
+    )
 
 
 def get_all_attendance_events(
-    base_directory: str, sections: pd.DataFrame, nrows: Optional[int] = None
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """
     Reads the most recent attendance events files for all given sections into
@@ -756,9 +1114,44 @@ def get_all_attendance_events(
     nrows: int or None
         (Optional) number of rows to read from the file - useful for testing
         without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
 
     Returns
     -------
     Pandas DataFrame with columns matching the model definition / CSV file.
     """
-    return _get_data_for_section(base_directory, sections, get_attendance_events, nrows)
+    return collect(
+        iter_all_attendance_events(base_directory, sections, nrows, max_workers)
+    )
+
+
+def iter_all_attendance_events(
+    base_directory: str,
+    sections: pd.DataFrame,
+    nrows: Optional[int] = None,
+    max_workers: int = 1,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams the most recent attendance events files for all given sections into
+    Pandas DataFrames, one per non-empty file.
+
+    Parameters
+    ----------
+    base_directory: str
+        The base / parent directory for LMS extractor files.
+    sections: pd.DataFrame
+        DataFrame containing sections read from a sections file.
+    nrows: int or None
+        (Optional) number of rows to read from the file - useful for testing
+        without reading the entirety of a large file.
+    max_workers: int
+        (Optional) number of files to read concurrently. Defaults to 1.
+
+    Returns
+    -------
+    Iterator of Pandas DataFrames with columns matching the model definition / CSV file.
+    """
+    return _iter_data_for_section(
+        base_directory, sections, get_attendance_events, nrows, max_workers
+    )
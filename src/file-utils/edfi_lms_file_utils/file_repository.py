@@ -9,6 +9,7 @@ from dataclasses import dataclass
 
 
 import edfi_lms_file_utils.directory_repository as dr
+from edfi_lms_file_utils.constants import FileExtensions
 
 
 @dataclass
@@ -20,12 +21,18 @@ class FileInfo:
     def has_contents(self) -> bool:
         """
         Determines if a file has contents beyond a couple of line breaks; this situation occurs when
-        `pandas.DataFrame.to_csv` writes a file with value "\n\n" for an empty DataFrame.
+        `pandas.DataFrame.to_csv` writes a file with value "\n\n" for an empty DataFrame. For a
+        Parquet file, reads the row count from the file's metadata.
 
             Returns
             ---------
             bool
         """
+        if self.name.endswith(FileExtensions.PARQUET):
+            import pyarrow.parquet as pq  # type: ignore
+
+            return pq.read_metadata(self.path).num_rows > 0
+
         return self.size > 4
 
 
@@ -36,7 +43,7 @@ def _scan_files(directory: str) -> List[FileInfo]:
     files = [
         FileInfo(f.path, str(f.name), int(str(f.stat().st_size)))
         for f in os.scandir(directory)
-        if f.name.endswith(".csv")
+        if f.name.endswith((FileExtensions.CSV, FileExtensions.PARQUET))
     ]
     return sorted(files, key=lambda x: x.name, reverse=False)
 
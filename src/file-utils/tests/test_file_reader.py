@@ -3,13 +3,16 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+import time
 from typing import Callable, List
 import pandas as pd
 from unittest.mock import Mock
 import pytest
 
 from edfi_lms_file_utils.file_reader import (
+    _read_all,
     _read_csv,
+    collect,
     get_all_users,
     get_all_sections,
     get_all_section_associations,
@@ -28,8 +31,10 @@ from edfi_lms_file_utils.file_reader import (
     read_submissions_file,
     read_system_activities_file,
     read_users_file,
+    iter_all_assignments,
+    read_file_in_chunks,
 )
-from edfi_lms_file_utils.constants import DataTypes
+from edfi_lms_file_utils.constants import DataTypes, Resources
 from .constants import BASE_DIRECTORY
 
 SECTIONS = "sections"
@@ -56,6 +61,9 @@ SECTION_ACTIVITIES_FILE = (
 )
 SYSTEM_ACTIVITIES_FILE = "base_dir/system-activities/2020-11-19/2020-11-19-04-05-06.csv"
 
+# Other tests replace pd.read_csv with a mock
+READ_CSV = pd.read_csv
+
 INPUT_DF = pd.DataFrame(
     [{"SourceSystemIdentifier": 1, "LMSSectionSourceSystemIdentifier": 2}]
 )
@@ -174,6 +182,21 @@ def describe_given_files_exist() -> None:
 
             assert df.iloc[0][ASSIGNMENTS] == 1
 
+        def describe_given_multiple_workers() -> None:
+            def it_should_read_file_into_DataFrame(mocker, fixture) -> None:
+
+                df = get_all_assignments(BASE_DIRECTORY, INPUT_DF, max_workers=4)
+
+                assert df.iloc[0][ASSIGNMENTS] == 1
+
+        def describe_given_streaming() -> None:
+            def it_should_yield_one_DataFrame_per_section(mocker, fixture) -> None:
+                sections = pd.concat([INPUT_DF, INPUT_DF])
+
+                frames = list(iter_all_assignments(BASE_DIRECTORY, sections))
+
+                assert len(frames) == 2
+
         def describe_given_empty_section_list() -> None:
             def it_should_return_empty_data_frame(mocker, fixture) -> None:
                 df = get_all_assignments(BASE_DIRECTORY, pd.DataFrame())
@@ -357,3 +380,130 @@ def describe_when_reading_files_from_path():
             for count in range(len(methods_to_test)):
                 methods_to_test[count]("")
             assert mock_read_csv.call_count == len(methods_to_test)
+
+
+def describe_when_reading_files_concurrently():
+    def _read(started: List[int]) -> Callable[[int], pd.DataFrame]:
+        def read(item: int) -> pd.DataFrame:
+            started.append(item)
+            return pd.DataFrame({"item": [item]}) if item % 3 else pd.DataFrame()
+
+        return read
+
+    def it_should_yield_the_non_empty_DataFrames_in_order():
+        result = _read_all(range(20), _read([]), max_workers=4)
+
+        assert [df["item"][0] for df in result] == [
+            item for item in range(20) if item % 3
+        ]
+
+    def it_should_not_read_ahead_of_the_consumer():
+        started: List[int] = []
+        result = _read_all(range(100), _read(started), max_workers=2)
+
+        next(result)
+        # Gives the workers time to run ahead, if they could
+        time.sleep(0.2)
+
+        assert len(started) <= 2 + 2 * 2
+
+        result.close()
+
+
+def describe_when_collecting_DataFrames():
+    def describe_given_no_DataFrames():
+        def it_should_return_empty_DataFrame():
+            assert collect(iter([])).empty
+
+    def describe_given_some_DataFrames_are_empty():
+        @pytest.fixture
+        def result() -> pd.DataFrame:
+            return collect(
+                iter(
+                    [
+                        pd.DataFrame([{"a": 1}]),
+                        pd.DataFrame(),
+                        pd.DataFrame([{"a": 2}, {"a": 3}]),
+                    ]
+                )
+            )
+
+        def it_should_keep_all_rows_in_order(result: pd.DataFrame):
+            assert result["a"].tolist() == [1, 2, 3]
+
+        def it_should_keep_the_original_index(result: pd.DataFrame):
+            assert result.index.tolist() == [0, 0, 1]
+
+
+def describe_when_reading_a_file_in_chunks():
+    @pytest.fixture
+    def chunks(mocker, tmp_path) -> List[pd.DataFrame]:
+        mocker.patch("pandas.read_csv", READ_CSV)
+
+        file = tmp_path / "2020-11-19-04-05-06.csv"
+        dates = ",".join(["2020-11-19 04:05:06"] * 5)
+        file.write_text(
+            "SourceSystemIdentifier,SourceSystem,EarnedPoints,SubmissionDateTime,"
+            "SourceCreateDate,SourceLastModifiedDate,CreateDate,LastModifiedDate\n"
+            f"1,Canvas,10,{dates}\n"
+            f"2,Canvas,,{dates}\n"
+            f"3,Canvas,30,{dates}\n"
+        )
+
+        return list(read_file_in_chunks(Resources.SUBMISSIONS, str(file), 2))
+
+    def it_should_read_at_most_chunksize_rows_at_a_time(chunks):
+        assert [c.shape[0] for c in chunks] == [2, 1]
+
+    def it_should_read_all_rows(chunks):
+        assert pd.concat(chunks)["SourceSystemIdentifier"].tolist() == ["1", "2", "3"]
+
+    def it_should_apply_the_resource_data_types(chunks):
+        assert chunks[0]["EarnedPoints"].dtype == "Int64"
+
+    def it_should_parse_the_resource_date_columns(chunks):
+        assert str(chunks[0]["SubmissionDateTime"].dtype) == "datetime64[ns]"
+
+
+def describe_when_reading_a_parquet_file():
+    @pytest.fixture
+    def file(tmp_path) -> str:
+        path = str(tmp_path / "2020-11-19-04-05-06.parquet")
+        pd.DataFrame(
+            {
+                "SourceSystemIdentifier": [1, 2, 3],
+                "SourceSystem": "Canvas",
+                "EarnedPoints": [10.0, None, 30.0],
+                "SubmissionDateTime": "2020-11-19 04:05:06",
+                "CreateDate": pd.Timestamp("2020-11-19 04:05:06"),
+            }
+        ).to_parquet(path, index=False)
+        return path
+
+    def describe_given_the_whole_file():
+        @pytest.fixture
+        def df(file) -> pd.DataFrame:
+            return read_submissions_file(file)
+
+        def it_should_read_all_rows(df):
+            assert df["SourceSystemIdentifier"].tolist() == ["1", "2", "3"]
+
+        def it_should_apply_the_resource_data_types(df):
+            assert df["EarnedPoints"].dtype == "Int64"
+
+        def it_should_parse_date_columns_written_as_text(df):
+            assert str(df["SubmissionDateTime"].dtype) == "datetime64[ns]"
+
+        def it_should_keep_date_columns_written_as_dates(df):
+            assert str(df["CreateDate"].dtype) == "datetime64[ns]"
+
+    def describe_given_nrows():
+        def it_should_read_only_that_many_rows(file):
+            assert read_submissions_file(file, 2).shape[0] == 2
+
+    def describe_given_chunks():
+        def it_should_read_at_most_chunksize_rows_at_a_time(file):
+            chunks = list(read_file_in_chunks(Resources.SUBMISSIONS, file, 2))
+
+            assert [c.shape[0] for c in chunks] == [2, 1]
+            assert chunks[0]["EarnedPoints"].dtype == "Int64"
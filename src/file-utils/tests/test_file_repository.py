@@ -4,6 +4,7 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 
+import pandas as pd
 import pytest
 
 from edfi_lms_file_utils.file_repository import (
@@ -451,3 +452,23 @@ def describe_when_getting_file_paths():
         def it_returns_the_valid_paths(init_fs):
             result = _get_file_paths(f"{BASE_DIRECTORY}/sections")
             assert len(result) == 2
+
+
+def describe_given_parquet_files() -> None:
+    def describe_when_getting_newest_file() -> None:
+        def it_should_skip_a_newer_file_without_rows(tmp_path) -> None:
+            older = str(tmp_path / "2020-11-18-04-05-06.parquet")
+            newer = str(tmp_path / "2020-11-19-04-05-06.parquet")
+            pd.DataFrame([{"a": 1}]).to_parquet(older)
+            pd.DataFrame(columns=["a"]).to_parquet(newer)
+
+            assert _get_newest_file(str(tmp_path)) == older
+
+    def describe_when_getting_file_paths() -> None:
+        def it_should_include_csv_and_parquet_files(tmp_path) -> None:
+            csv = tmp_path / "2020-11-18-04-05-06.csv"
+            csv.write_text("a\n1\n2\n")
+            parquet = str(tmp_path / "2020-11-19-04-05-06.parquet")
+            pd.DataFrame([{"a": 1}]).to_parquet(parquet)
+
+            assert _get_file_paths(str(tmp_path)) == [str(csv), parquet]
@@ -0,0 +1,189 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Compares the response bytes and the processing time of the Classroom list
+calls with and without the `fields` masks, on generated responses holding
+every field the API returns by default. Processing covers parsing the JSON,
+building the API DataFrame, syncing it to a new sync database and mapping it
+to the LMS UDM. Run from the package directory, for example:
+
+    poetry run python benchmarks/fields_benchmark.py --courses 50 --students 30 \\
+        --coursework 20
+"""
+
+from argparse import ArgumentParser
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from pandas import DataFrame, json_normalize
+from sqlalchemy import create_engine
+
+from edfi_google_classroom_extractor.api import (
+    courses,
+    coursework,
+    students,
+    submissions,
+    teachers,
+)
+from edfi_google_classroom_extractor.mapping.assignment_submissions import (
+    submissions_to_assignment_submissions_dfs,
+)
+from edfi_google_classroom_extractor.mapping.assignments import (
+    coursework_to_assignments_dfs,
+)
+from edfi_google_classroom_extractor.mapping.sections import courses_to_sections_df
+from edfi_google_classroom_extractor.mapping.users import (
+    students_and_teachers_to_users_df,
+)
+from tests.api.api_helper import (
+    apply_fields,
+    full_course,
+    full_coursework,
+    full_submission,
+    full_user,
+)
+
+# Items per page, as returned by the Classroom API by default
+PAGE_SIZE = 30
+
+
+def _pages(response_property: str, items: List[Dict], fields: str) -> List[bytes]:
+    pages = [
+        {response_property: items[start:start + PAGE_SIZE], "nextPageToken": "t"}
+        for start in range(0, len(items), PAGE_SIZE)
+    ]
+    if fields:
+        pages = [apply_fields(page, fields) for page in pages]
+    return [json.dumps(page).encode() for page in pages]
+
+
+def _api_df(
+    pages: List[bytes], response_property: str, required_columns: Sequence = ()
+) -> DataFrame:
+    items: List[Dict[str, Any]] = []
+    for page in pages:
+        items.extend(json.loads(page).get(response_property, []))
+    df: DataFrame = json_normalize(items).astype("string")
+    return df.reindex(
+        df.columns.union(required_columns, sort=False), axis=1, fill_value=""  # type: ignore
+    )
+
+
+class Stopwatch:
+    def __init__(self):
+        self.elapsed: Dict[str, float] = {}
+
+    def time(self, stage: str, function: Callable, *args) -> Any:
+        started = perf_counter()
+        result = function(*args)
+        self.elapsed[stage] = self.elapsed.get(stage, 0.0) + perf_counter() - started
+        return result
+
+
+def _run(responses: Dict[str, List[bytes]], sync_directory: str) -> Dict[str, float]:
+    sync_db = create_engine(f"sqlite:///{Path(sync_directory) / 'sync.sqlite'}")
+    watch = Stopwatch()
+
+    courses_df = watch.time("parse", _api_df, responses["courses"], "courses")
+    courses_df["alias"] = ""
+    courses_df = watch.time("sync", courses._sync_without_cleanup, courses_df, sync_db)
+    watch.time("map", courses_to_sections_df, courses_df)
+
+    students_df = watch.time("parse", _api_df, responses["students"], "students")
+    students_df = watch.time(
+        "sync", students._sync_without_cleanup, students_df, sync_db
+    )
+    teachers_df = watch.time("parse", _api_df, responses["teachers"], "teachers")
+    teachers_df = watch.time(
+        "sync", teachers._sync_without_cleanup, teachers_df, sync_db
+    )
+    watch.time("map", students_and_teachers_to_users_df, students_df, teachers_df)
+
+    coursework_df = watch.time(
+        "parse",
+        _api_df,
+        responses["courseWork"],
+        "courseWork",
+        coursework.REQUIRED_COLUMNS,
+    )
+    coursework_df = watch.time(
+        "sync", coursework._sync_without_cleanup, coursework_df, sync_db
+    )
+    watch.time("map", coursework_to_assignments_dfs, coursework_df)
+
+    submissions_df = watch.time(
+        "parse",
+        _api_df,
+        responses["studentSubmissions"],
+        "studentSubmissions",
+        submissions.REQUIRED_COLUMNS,
+    )
+    submissions_df = watch.time(
+        "sync", submissions._sync_without_cleanup, submissions_df, sync_db
+    )
+    watch.time("map", submissions_to_assignment_submissions_dfs, submissions_df)
+
+    return watch.elapsed
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--courses", type=int, default=50)
+    parser.add_argument("--students", type=int, default=30)
+    parser.add_argument("--coursework", type=int, default=20)
+    args = parser.parse_args()
+
+    course_ids = [str(course) for course in range(args.courses)]
+    student_ids = [str(1000 + student) for student in range(args.students)]
+    coursework_ids = [str(2000 + work) for work in range(args.coursework)]
+    items: Dict[str, Tuple[List[Dict], str]] = {
+        "courses": (
+            [full_course(course_id) for course_id in course_ids],
+            courses.COURSES_FIELDS,
+        ),
+        "students": (
+            [full_user(c, s) for c in course_ids for s in student_ids],
+            students.STUDENTS_FIELDS,
+        ),
+        "teachers": (
+            [full_user(c, "100") for c in course_ids],
+            teachers.TEACHERS_FIELDS,
+        ),
+        "courseWork": (
+            [full_coursework(c, w) for c in course_ids for w in coursework_ids],
+            coursework.COURSEWORK_FIELDS,
+        ),
+        "studentSubmissions": (
+            [
+                full_submission(c, w, s)
+                for c in course_ids
+                for w in coursework_ids
+                for s in student_ids
+            ],
+            submissions.SUBMISSIONS_FIELDS,
+        ),
+    }
+
+    for label, masked in [("full", False), ("fields", True)]:
+        responses = {
+            name: _pages(name, resource_items, fields if masked else "")
+            for name, (resource_items, fields) in items.items()
+        }
+        size = sum(len(page) for pages in responses.values() for page in pages)
+        with TemporaryDirectory() as sync_directory:
+            elapsed = _run(responses, sync_directory)
+        stages = ", ".join(f"{stage} {time:.2f}s" for stage, time in elapsed.items())
+        print(
+            f"{label:>6}: {size / 2**20:.1f} MiB of responses, "
+            f"{sum(elapsed.values()):.2f}s ({stages})"
+        )
+
+
+if __name__ == "__main__":
+    main()
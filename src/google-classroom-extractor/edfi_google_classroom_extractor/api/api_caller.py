@@ -4,13 +4,25 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 import socket
 import logging
 import os
-from typing import List, Dict, Optional, Callable, cast
+from threading import Lock
+import time
+from typing import (
+    Any,
+    List,
+    Dict,
+    Optional,
+    Callable,
+    Iterable,
+    Iterator,
+    Tuple,
+    TypeVar,
+)
 from requests import RequestException
 from opnieuw import retry
-from tail_recursive import tail_recursive
 from googleapiclient.errors import Error as GoogleApiError
 
 ResourceType = namedtuple("ResourceType", ["courses", "userUsageReport"])
@@ -20,15 +32,62 @@ RETRY_WINDOW_AFTER_FIRST_CALL_IN_SECONDS = int(
     os.environ.get("REQUEST_RETRY_TIMEOUT_SECONDS") or 60
 )
 
+# Default number of concurrent API calls made by the extractor. The request
+# functions themselves default to one call at a time, as a Resource is only
+# safe to share between threads when built with a per-thread transport
+DEFAULT_MAX_CONCURRENCY = 4
+
+# API calls made per second, across all threads, to stay under the
+# per-user Classroom API quota
+MAX_CALLS_PER_SECOND = 40
+
+# API calls packed into one batch request, the most the Classroom API accepts
+MAX_BATCH_SIZE = 50
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RateLimiter(object):
+    """
+    Spaces calls evenly so that no more than `calls_per_second` start in any
+    second, across all the threads that share the limiter.
+    """
+
+    def __init__(self, calls_per_second: float):
+        self.interval = 1.0 / calls_per_second
+        self._next_call = 0.0
+        self._lock = Lock()
+
+    def wait(self, calls: int = 1) -> None:
+        """
+        Block until the next call slot, and take it along with the slots of
+        any further calls made at the same time.
+
+        Parameters
+        ----------
+        calls: int
+            is the number of calls about to be made, such as in a batch request
+        """
+        with self._lock:
+            now = time.monotonic()
+            call_at = max(now, self._next_call)
+            self._next_call = call_at + self.interval * calls
+        if call_at > now:
+            time.sleep(call_at - now)
+
+
+_rate_limiter = RateLimiter(MAX_CALLS_PER_SECOND)
+
 
 @retry(
     retry_on_exceptions=(IOError, RequestException, GoogleApiError, socket.timeout, socket.error),
     max_calls_total=MAX_TOTAL_CALLS,
     retry_window_after_first_call_in_seconds=RETRY_WINDOW_AFTER_FIRST_CALL_IN_SECONDS,
 )
-def _execute(executable_resource):
+def _execute(executable_resource, calls: int = 1):
     """
     Invoke a get/list Google Classroom SDK function,
     retrying if there are errors.
@@ -37,6 +96,8 @@ def _execute(executable_resource):
     ----------
     executable_resource: function
         is the get/list Google Classroom SDK function to call
+    calls: int
+        is the number of API calls made, which is more than one for a batch
 
     Returns
     -------
@@ -51,54 +112,42 @@ def _execute(executable_resource):
         if there is a RequestException after retrying
     """
     assert hasattr(executable_resource, "execute")
+    _rate_limiter.wait(calls)
     return executable_resource.execute()
 
 
-@tail_recursive
-def _call_api_recursive(
+def iter_api_pages(
     resource_method: Callable,
     resource_parameters: Dict[str, str],
     response_property: str,
-    results: Optional[List[Dict[str, str]]] = None,
-) -> List[Dict[str, str]]:
+) -> Iterator[List[Dict[str, str]]]:
     """
-    Call a Google Classroom/Admin SDK API
+    Call a Google Classroom/Admin SDK API, yielding each page of the response
+    as it arrives
 
     Parameters
     ----------
     resource_method: function
         is the get/list SDK function to call
     resource_parameters: dict
-        is the parameters for get/list
+        is the parameters for get/list, which are left unchanged
     response_property: string
         is the property in the API response we want
-    results: list
-        is the list of dicts of the API response accumulated across pages
 
     Returns
     -------
-    list
-        a list of dicts of the API response property requested
+    Iterator
+        for each page, a list of dicts of the API response property requested
     """
+    parameters: Dict[str, str] = dict(resource_parameters)
+    while True:
+        response = _execute(resource_method(**parameters))
+        yield response.get(response_property, [])
 
-    current_results: List[Dict[str, str]] = [] if results is None else results
-    response = _execute(resource_method(**resource_parameters))
-    try:
-        current_results.extend(response.get(response_property, []))
-    except (IOError, RequestException, GoogleApiError):
-        logger.exception("Error during API call after retries.  Will try to continue.")
-        return current_results
-
-    next_page_token = response.get("nextPageToken", None)
-    if not next_page_token:
-        return current_results
-    resource_parameters["pageToken"] = next_page_token
-    return cast(
-        List[Dict[str, str]],
-        _call_api_recursive.tail_call(
-            resource_method, resource_parameters, response_property, current_results
-        ),
-    )
+        next_page_token = response.get("nextPageToken", None)
+        if not next_page_token:
+            return
+        parameters["pageToken"] = next_page_token
 
 
 def call_api(
@@ -126,5 +175,190 @@ def call_api(
     list
         a list of dicts of the API response property requested
     """
+    current_results: List[Dict[str, str]] = [] if results is None else results
+    for page in iter_api_pages(resource_method, resource_parameters, response_property):
+        current_results.extend(page)
+    return current_results
+
+
+def _call_api_batch(
+    resource: Any,
+    resource_method: Callable,
+    resource_parameters: List[Dict[str, str]],
+    response_property: str,
+) -> List[List[Dict[str, str]]]:
+    """
+    Call a Google Classroom SDK API once for each set of parameters, packing
+    the calls into one batch request per page
+
+    Parameters
+    ----------
+    resource: Resource
+        is the Google Classroom SDK Resource that makes the batch requests
+    resource_method: function
+        is the list SDK function to call
+    resource_parameters: list
+        is the parameters for each list call, no more than MAX_BATCH_SIZE
+    response_property: string
+        is the property in the API response we want
+
+    Returns
+    -------
+    list
+        for each set of parameters, a list of dicts of the API response
+        property requested, accumulated across pages
+    """
+    results: List[List[Dict[str, str]]] = [[] for _ in resource_parameters]
+    pending: Dict[str, Dict[str, str]] = {
+        str(index): dict(parameters) for index, parameters in enumerate(resource_parameters)
+    }
+
+    while pending:
+        responses: Dict[str, Tuple[Optional[Dict], Optional[Exception]]] = {}
+
+        def callback(request_id: str, response: Optional[Dict], exception):
+            responses[request_id] = (response, exception)
+
+        batch = resource.new_batch_http_request(callback=callback)
+        for request_id, parameters in pending.items():
+            batch.add(resource_method(**parameters), request_id=request_id)
+        _execute(batch, len(pending))
+
+        for request_id, parameters in list(pending.items()):
+            index = int(request_id)
+            response, exception = responses.get(request_id, (None, None))
+            if response is None:
+                # Each call of a batch fails on its own, so only failed calls
+                # are retried, one at a time from their current page
+                logger.debug(
+                    "Batched call %s failed, retrying alone: %s", parameters, exception
+                )
+                del pending[request_id]
+                results[index] = call_api(
+                    resource_method, parameters, response_property, results[index]
+                )
+                continue
+
+            results[index].extend(response.get(response_property, []))
+            next_page_token = response.get("nextPageToken", None)
+            if next_page_token:
+                parameters["pageToken"] = next_page_token
+            else:
+                del pending[request_id]
+
+    return results
+
+
+def call_api_batched(
+    resource: Any,
+    resource_method: Callable,
+    resource_parameters: List[Dict[str, str]],
+    response_property: str,
+    max_concurrency: int = 1,
+) -> List[List[Dict[str, str]]]:
+    """
+    Call a Google Classroom SDK API once for each set of parameters, such as
+    for each course id, in batch requests of up to MAX_BATCH_SIZE calls. The
+    next pages of the calls are requested together in the same way, until
+    every call has returned all of its pages.
+
+    Parameters
+    ----------
+    resource: Resource
+        is the Google Classroom SDK Resource that makes the batch requests
+    resource_method: function
+        is the list SDK function to call
+    resource_parameters: list
+        is the parameters for each list call
+    response_property: string
+        is the property in the API response we want
+    max_concurrency: int
+        is the maximum number of batch requests to make at once
+
+    Returns
+    -------
+    list
+        for each set of parameters, in order, a list of dicts of the API
+        response property requested
+    """
+    chunks: List[List[Dict[str, str]]] = [
+        resource_parameters[start:start + MAX_BATCH_SIZE]
+        for start in range(0, len(resource_parameters), MAX_BATCH_SIZE)
+    ]
+    results: List[List[Dict[str, str]]] = []
+    for chunk_results in map_concurrently(
+        lambda chunk: _call_api_batch(
+            resource, resource_method, chunk, response_property
+        ),
+        chunks,
+        max_concurrency,
+    ):
+        results.extend(chunk_results)
+    return results
+
+
+def iter_concurrently(
+    function: Callable[[T], R], items: Iterable[T], max_concurrency: int = 1
+) -> Iterator[R]:
+    """
+    Apply a function to each item, such as a request for each date, with up
+    to `max_concurrency` calls running at once on a thread pool, yielding each
+    result in the order of the items as soon as it and those before it are
+    done.
+
+    Parameters
+    ----------
+    function: Callable
+        is the function to apply, which must be safe to call from many threads
+        when `max_concurrency` is more than one
+    items: Iterable
+        is the items to apply the function to
+    max_concurrency: int
+        is the maximum number of concurrent calls
+
+    Returns
+    -------
+    Iterator
+        the results of the function, in the order of the items
+
+    Notes
+    -----
+    Calls that have not started are cancelled when a call fails or the
+    iteration is stopped early.
+    """
+    items = list(items)
+    if max_concurrency <= 1 or len(items) <= 1:
+        for item in items:
+            yield function(item)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(items)))
+    try:
+        yield from executor.map(function, items)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def map_concurrently(
+    function: Callable[[T], R], items: Iterable[T], max_concurrency: int = 1
+) -> List[R]:
+    """
+    Apply a function to each item, such as a request for each course id, with
+    up to `max_concurrency` calls running at once on a thread pool.
 
-    return _call_api_recursive(resource_method, resource_parameters, response_property, results)  # type: ignore
+    Parameters
+    ----------
+    function: Callable
+        is the function to apply, which must be safe to call from many threads
+        when `max_concurrency` is more than one
+    items: Iterable
+        is the items to apply the function to
+    max_concurrency: int
+        is the maximum number of concurrent calls
+
+    Returns
+    -------
+    list
+        the results of the function, in the order of the items
+    """
+    return list(iter_concurrently(function, items, max_concurrency))
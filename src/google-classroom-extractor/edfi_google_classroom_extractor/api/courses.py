@@ -5,10 +5,14 @@
 
 import logging
 from typing import List, Dict, cast
-from pandas import DataFrame, Series, json_normalize
+from pandas import DataFrame, json_normalize
 import sqlalchemy
 from googleapiclient.discovery import Resource
-from edfi_google_classroom_extractor.api.api_caller import call_api, ResourceType
+from edfi_google_classroom_extractor.api.api_caller import (
+    call_api,
+    call_api_batched,
+    ResourceType,
+)
 from edfi_lms_extractor_lib.api.resource_sync import (
     cleanup_after_sync,
     sync_to_db_without_cleanup,
@@ -18,6 +22,13 @@ from edfi_lms_extractor_lib.api.resource_sync import (
 COURSES_RESOURCE_NAME = "Courses"
 EDFI_LMS_PREFIX = "EdFiLMS."
 
+# The parts of the responses used by the section mapping
+COURSES_FIELDS = (
+    "nextPageToken,courses(id,name,descriptionHeading,courseState,creationTime,"
+    "updateTime)"
+)
+ALIASES_FIELDS = "nextPageToken,aliases(alias)"
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,7 +51,7 @@ def request_course_aliases(resource: Resource, course_id: str) -> List[Dict[str,
     """
     return call_api(
         cast(ResourceType, resource).courses().aliases().list,
-        {"courseId": course_id},
+        {"courseId": course_id, "fields": ALIASES_FIELDS},
         "aliases",
     )
 
@@ -153,23 +164,20 @@ def _select_alias(aliases: List[str]) -> str:
     return ""
 
 
-def _derive_alias(resource: Resource, row: Series) -> str:
+def _derive_alias(course_aliases: List[Dict[str, str]]) -> str:
     """
-    Derives a single alias for a course dataframe row, from a fetch of CourseAliases
+    Derives a single alias for a course, from a fetch of CourseAliases
 
     Parameters
     ----------
-    resource: Optional[Resource]
-        a Google Classroom SDK Resource
-    row: Series
-        a Pandas Series row for a single Google Classroom course
+    course_aliases: List[Dict[str, str]]
+        the Google Classroom CourseAliases of a course
 
     Returns
     -------
     str
         a (possibly empty) string representing the most relevant alias for the course.
     """
-    course_aliases: List[Dict[str, str]] = request_course_aliases(resource, row["id"])
     alias_strings: List[str] = [
         course_alias["alias"] for course_alias in course_aliases
     ]
@@ -193,12 +201,14 @@ def request_courses(resource: Resource) -> List[Dict[str, str]]:
     """
     return call_api(
         cast(ResourceType, resource).courses().list,
-        {"courseStates": "ACTIVE"},
+        {"courseStates": "ACTIVE", "fields": COURSES_FIELDS},
         "courses",
     )
 
 
-def request_latest_courses_as_df(resource: Resource) -> DataFrame:
+def request_latest_courses_as_df(
+    resource: Resource, max_concurrency: int = 1
+) -> DataFrame:
     """
     Fetch Course API data for all courses and return a Courses API DataFrame
 
@@ -206,6 +216,8 @@ def request_latest_courses_as_df(resource: Resource) -> DataFrame:
     ----------
     resource: Optional[Resource]
         a Google Classroom SDK Resource
+    max_concurrency: int
+        the maximum number of batch requests for course aliases to make at once
 
     Returns
     -------
@@ -217,34 +229,37 @@ def request_latest_courses_as_df(resource: Resource) -> DataFrame:
     DataFrame columns are:
         id: Identifier for this course assigned by Classroom
         name: Name of the course
-        section: Section of the course
         descriptionHeading: Optional heading for the description
-        description: Optional description
-        room: Optional room location
-        ownerId: The identifier of the owner of a course
         creationTime: Creation time of the course
         updateTime: Time of the most recent update to this course
-        enrollmentCode: Enrollment code to use when joining this course
         courseState: State of the course
-        alternateLink: Absolute link to this course in the Classroom web UI
-        teacherGroupEmail: The email address of a Google group containing all teachers of the course
-        courseGroupEmail: The email address of a Google group containing all members of the course
-        guardiansEnabled: Whether or not guardian notifications are enabled for this course
-        calendarId: The Calendar ID for a calendar that all course members can see
         alias: A course alias selected from the available aliases for the course
     """
 
     logger.info("Pulling course data")
     courses: List[Dict[str, str]] = request_courses(resource)
     courses_df: DataFrame = json_normalize(courses)
-    courses_df["alias"] = courses_df.apply(
-        lambda row: _derive_alias(resource, row), axis=1
-    )
+    course_ids: List[str] = courses_df["id"].tolist() if "id" in courses_df else []
+    courses_df["alias"] = [
+        _derive_alias(course_aliases)
+        for course_aliases in call_api_batched(
+            resource,
+            cast(ResourceType, resource).courses().aliases().list,
+            [
+                {"courseId": course_id, "fields": ALIASES_FIELDS}
+                for course_id in course_ids
+            ],
+            "aliases",
+            max_concurrency,
+        )
+    ]
     return courses_df
 
 
 def request_all_courses_as_df(
-    resource: Resource, sync_db: sqlalchemy.engine.base.Engine
+    resource: Resource,
+    sync_db: sqlalchemy.engine.base.Engine,
+    max_concurrency: int = 1,
 ) -> DataFrame:
     """
     Fetch Course API data for all courses and return a Courses API DataFrame
@@ -255,6 +270,8 @@ def request_all_courses_as_df(
         a Google Classroom SDK Resource
     sync_db: sqlalchemy.engine.base.Engine
         an Engine instance for creating database connections
+    max_concurrency: int
+        the maximum number of batch requests for course aliases to make at once
 
     Returns
     -------
@@ -266,29 +283,19 @@ def request_all_courses_as_df(
     DataFrame columns are:
         id: Identifier for this course assigned by Classroom
         name: Name of the course
-        section: Section of the course
         descriptionHeading: Optional heading for the description
-        description: Optional description
-        room: Optional room location
-        ownerId: The identifier of the owner of a course
         creationTime: Creation time of the course
         updateTime: Time of the most recent update to this course
-        enrollmentCode: Enrollment code to use when joining this course
         courseState: State of the course
-        alternateLink: Absolute link to this course in the Classroom web UI
-        teacherGroupEmail: The email address of a Google group containing all teachers of the course
-        courseGroupEmail: The email address of a Google group containing all members of the course
         teacherFolder.id: The identifier of the teacher folder
         teacherFolder.title: The identifier of the teacher folder,
         teacherFolder.alternateLink: Absolute link to the teacher folder in the Classroom web UI
-        guardiansEnabled: Whether or not guardian notifications are enabled for this course
-        calendarId: The Calendar ID for a calendar that all course members can see
         alias: A course alias selected from the available aliases for the course
         CreateDate: Date this record was created by the extractor
         LastModifiedDate: Date this record was last updated by the extractor
     """
 
-    courses_df = request_latest_courses_as_df(resource)
+    courses_df = request_latest_courses_as_df(resource, max_concurrency)
     courses_df = _sync_without_cleanup(courses_df, sync_db)
     cleanup_after_sync(COURSES_RESOURCE_NAME, sync_db)
 
@@ -8,7 +8,7 @@ from typing import List, Dict, Optional, cast
 from pandas import DataFrame, json_normalize
 import sqlalchemy
 from googleapiclient.discovery import Resource
-from .api_caller import call_api, ResourceType
+from .api_caller import call_api, call_api_batched, ResourceType
 from edfi_lms_extractor_lib.api.resource_sync import (
     cleanup_after_sync,
     sync_to_db_without_cleanup,
@@ -39,6 +39,13 @@ REQUIRED_COLUMNS = [
 
 ASSIGNMENTS_RESOURCE_NAME = "Assignmments"
 
+# The parts of a response used by the assignment mapping. Other
+# REQUIRED_COLUMNS are left empty
+COURSEWORK_FIELDS = (
+    "nextPageToken,courseWork(courseId,id,title,description,creationTime,"
+    "updateTime,maxPoints,workType,dueDate,dueTime,scheduledTime)"
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,13 +73,13 @@ def request_coursework(
 
     return call_api(
         cast(ResourceType, resource).courses().courseWork().list,
-        {"courseId": course_id},
+        {"courseId": course_id, "fields": COURSEWORK_FIELDS},
         "courseWork",
     )
 
 
 def request_latest_coursework_as_df(
-    resource: Optional[Resource], course_ids: List[str]
+    resource: Optional[Resource], course_ids: List[str], max_concurrency: int = 1
 ) -> DataFrame:
     """
     Fetch Coursework API data for the given courses
@@ -84,6 +91,8 @@ def request_latest_coursework_as_df(
         a Google Classroom SDK Resource
     course_ids: List[str]
         a list of course ids to retrieve coursework for
+    max_concurrency: int
+        the maximum number of batch requests to make at once
 
     Returns
     -------
@@ -118,8 +127,18 @@ def request_latest_coursework_as_df(
 
     logger.info("Pulling coursework data")
     coursework: List[Dict[str, str]] = []
-    for course_id in course_ids:
-        coursework.extend(request_coursework(resource, course_id))
+    if resource is not None:
+        for course_coursework in call_api_batched(
+            resource,
+            cast(ResourceType, resource).courses().courseWork().list,
+            [
+                {"courseId": course_id, "fields": COURSEWORK_FIELDS}
+                for course_id in course_ids
+            ],
+            "courseWork",
+            max_concurrency,
+        ):
+            coursework.extend(course_coursework)
 
     json_df: DataFrame = json_normalize(coursework).astype("string")
     return json_df.reindex(
@@ -131,6 +150,7 @@ def request_all_coursework_as_df(
     resource: Optional[Resource],
     course_ids: List[str],
     sync_db: sqlalchemy.engine.base.Engine,
+    max_concurrency: int = 1,
 ) -> DataFrame:
     """
     Fetch Coursework API data for all courses and return a Coursework API DataFrame
@@ -143,6 +163,8 @@ def request_all_coursework_as_df(
         a list of course ids to retrieve coursework for
     sync_db: sqlalchemy.engine.base.Engine
         an Engine instance for creating database connections
+    max_concurrency: int
+        the maximum number of batch requests to make at once
 
     Returns
     -------
@@ -177,7 +199,9 @@ def request_all_coursework_as_df(
         LastModifiedDate: Date this record was last updated by the extractor
     """
 
-    coursework_df: DataFrame = request_latest_coursework_as_df(resource, course_ids)
+    coursework_df: DataFrame = request_latest_coursework_as_df(
+        resource, course_ids, max_concurrency
+    )
     coursework_df = _sync_without_cleanup(coursework_df, sync_db)
     cleanup_after_sync(ASSIGNMENTS_RESOURCE_NAME, sync_db)
 
@@ -8,7 +8,11 @@ from typing import List, Dict, Optional, cast
 from pandas import DataFrame, json_normalize
 import sqlalchemy
 from googleapiclient.discovery import Resource
-from edfi_google_classroom_extractor.api.api_caller import call_api, ResourceType
+from edfi_google_classroom_extractor.api.api_caller import (
+    call_api,
+    call_api_batched,
+    ResourceType,
+)
 from edfi_lms_extractor_lib.api.resource_sync import (
     cleanup_after_sync,
     sync_to_db_without_cleanup,
@@ -16,6 +20,11 @@ from edfi_lms_extractor_lib.api.resource_sync import (
 
 STUDENTS_RESOURCE_NAME = "Students"
 
+# The parts of a response used by the user and section association mappings
+STUDENTS_FIELDS = (
+    "nextPageToken,students(courseId,userId,profile(name/fullName,emailAddress))"
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,13 +53,13 @@ def request_students(
 
     return call_api(
         cast(ResourceType, resource).courses().students().list,
-        {"courseId": course_id},
+        {"courseId": course_id, "fields": STUDENTS_FIELDS},
         "students",
     )
 
 
 def request_latest_students_as_df(
-    resource: Optional[Resource], course_ids: List[str]
+    resource: Optional[Resource], course_ids: List[str], max_concurrency: int = 1
 ) -> DataFrame:
     """
     Fetch Students API data for a range of courses and return a Students API DataFrame
@@ -61,6 +70,8 @@ def request_latest_students_as_df(
         a Google Classroom SDK Resource or None
     course_ids: List[str]
         a list of Google Classroom course ids as a string array
+    max_concurrency: int
+        the maximum number of batch requests to make at once
 
     Returns
     -------
@@ -72,17 +83,24 @@ def request_latest_students_as_df(
     DataFrame columns are:
         courseId: Identifier of the course
         userId: Identifier of the user
-        profile.id: Identifier of the user
-        profile.name.givenName: The user's first name
-        profile.name.familyName: The user's last name
         profile.name.fullName: The user's full name formed by concatenating the first and last name values
         profile.emailAddress: Email address of the user
     """
 
     logger.info("Pulling student data")
     students: List[Dict[str, str]] = []
-    for course_id in course_ids:
-        students.extend(request_students(resource, course_id))
+    if resource is not None:
+        for course_students in call_api_batched(
+            resource,
+            cast(ResourceType, resource).courses().students().list,
+            [
+                {"courseId": course_id, "fields": STUDENTS_FIELDS}
+                for course_id in course_ids
+            ],
+            "students",
+            max_concurrency,
+        ):
+            students.extend(course_students)
 
     return json_normalize(students).astype("string")
 
@@ -91,6 +109,7 @@ def request_all_students_as_df(
     resource: Optional[Resource],
     course_ids: List[str],
     sync_db: sqlalchemy.engine.base.Engine,
+    max_concurrency: int = 1,
 ) -> DataFrame:
     """
     Fetch Students API data for a range of courses and return a Students API DataFrame
@@ -104,6 +123,8 @@ def request_all_students_as_df(
         a list of Google Classroom course ids as a string array
     sync_db: sqlalchemy.engine.base.Engine
         an Engine instance for creating database connections
+    max_concurrency: int
+        the maximum number of batch requests to make at once
 
     Returns
     -------
@@ -115,14 +136,13 @@ def request_all_students_as_df(
     DataFrame columns are:
         courseId: Identifier of the course
         userId: Identifier of the user
-        profile.id: Identifier of the user
-        profile.name.givenName: The user's first name
-        profile.name.familyName: The user's last name
         profile.name.fullName: The user's full name formed by concatenating the first and last name values
         profile.emailAddress: Email address of the user
     """
 
-    students_df: DataFrame = request_latest_students_as_df(resource, course_ids)
+    students_df: DataFrame = request_latest_students_as_df(
+        resource, course_ids, max_concurrency
+    )
     students_df = _sync_without_cleanup(students_df, sync_db)
     cleanup_after_sync(STUDENTS_RESOURCE_NAME, sync_db)
 
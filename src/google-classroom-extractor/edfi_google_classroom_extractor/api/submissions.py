@@ -8,7 +8,7 @@ from typing import List, Dict, Optional, cast
 from pandas import DataFrame, json_normalize
 import sqlalchemy
 from googleapiclient.discovery import Resource
-from .api_caller import call_api, ResourceType
+from .api_caller import call_api, call_api_batched, ResourceType
 from edfi_lms_extractor_lib.api.resource_sync import (
     cleanup_after_sync,
     sync_to_db_without_cleanup,
@@ -33,6 +33,14 @@ REQUIRED_COLUMNS = [
 
 SUBMISSIONS_RESOURCE_NAME = "StudentSubmissions"
 
+# The parts of a response used by the assignment submission and submission
+# activity mappings. Other REQUIRED_COLUMNS are left empty
+SUBMISSIONS_FIELDS = (
+    "nextPageToken,studentSubmissions(courseId,courseWorkId,id,userId,"
+    "creationTime,updateTime,state,late,assignedGrade,submissionHistory("
+    "stateHistory,gradeHistory(gradeTimestamp,gradeChangeType,actorUserId)))"
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,13 +68,13 @@ def request_submissions(
 
     return call_api(
         cast(ResourceType, resource).courses().courseWork().studentSubmissions().list,
-        {"courseId": course_id, "courseWorkId": "-"},
+        {"courseId": course_id, "courseWorkId": "-", "fields": SUBMISSIONS_FIELDS},
         "studentSubmissions",
     )
 
 
 def request_latest_submissions_as_df(
-    resource: Optional[Resource], course_ids: List[str]
+    resource: Optional[Resource], course_ids: List[str], max_concurrency: int = 1
 ) -> DataFrame:
     """
     Fetch StudentSubmissions API data for the given coursework
@@ -78,6 +86,8 @@ def request_latest_submissions_as_df(
         a Google Classroom SDK Resource
     course_ids: List[str]
         a list of course ids to retrieve coursework for
+    max_concurrency: int
+        the maximum number of batch requests to make at once
 
     Returns
     -------
@@ -111,8 +121,22 @@ def request_latest_submissions_as_df(
 
     logger.info("Pulling student submission data")
     submissions: List[Dict[str, str]] = []
-    for course_id in course_ids:
-        submissions.extend(request_submissions(resource, course_id))
+    if resource is not None:
+        for course_submissions in call_api_batched(
+            resource,
+            cast(ResourceType, resource).courses().courseWork().studentSubmissions().list,
+            [
+                {
+                    "courseId": course_id,
+                    "courseWorkId": "-",
+                    "fields": SUBMISSIONS_FIELDS,
+                }
+                for course_id in course_ids
+            ],
+            "studentSubmissions",
+            max_concurrency,
+        ):
+            submissions.extend(course_submissions)
 
     json_df: DataFrame = json_normalize(submissions).astype("string")
     return json_df.reindex(
@@ -124,6 +148,7 @@ def request_all_submissions_as_df(
     resource: Optional[Resource],
     course_ids: List[str],
     sync_db: sqlalchemy.engine.base.Engine,
+    max_concurrency: int = 1,
 ) -> DataFrame:
     """
     Fetch StudentSubmissions API data for the given coursework
@@ -135,6 +160,8 @@ def request_all_submissions_as_df(
         a Google Classroom SDK Resource
     course_ids: List[str]
         a list of course ids to retrieve coursework for
+    max_concurrency: int
+        the maximum number of batch requests to make at once
 
     Returns
     -------
@@ -167,7 +194,7 @@ def request_all_submissions_as_df(
     """
 
     submissions_df: DataFrame = request_latest_submissions_as_df(
-        resource, course_ids
+        resource, course_ids, max_concurrency
     )
 
     submissions_df = _sync_without_cleanup(submissions_df, sync_db)
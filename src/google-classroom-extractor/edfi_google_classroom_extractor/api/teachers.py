@@ -8,7 +8,11 @@ from typing import List, Dict, Optional, cast
 from pandas import DataFrame, json_normalize
 import sqlalchemy
 from googleapiclient.discovery import Resource
-from edfi_google_classroom_extractor.api.api_caller import call_api, ResourceType
+from edfi_google_classroom_extractor.api.api_caller import (
+    call_api,
+    call_api_batched,
+    ResourceType,
+)
 from edfi_lms_extractor_lib.api.resource_sync import (
     cleanup_after_sync,
     sync_to_db_without_cleanup,
@@ -17,6 +21,11 @@ from edfi_lms_extractor_lib.api.resource_sync import (
 
 TEACHERS_RESOURCE_NAME = "Teachers"
 
+# The parts of a response used by the user and section association mappings
+TEACHERS_FIELDS = (
+    "nextPageToken,teachers(courseId,userId,profile(name/fullName,emailAddress))"
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,13 +54,13 @@ def request_teachers(
 
     return call_api(
         cast(ResourceType, resource).courses().teachers().list,
-        {"courseId": course_id},
+        {"courseId": course_id, "fields": TEACHERS_FIELDS},
         "teachers",
     )
 
 
 def request_latest_teachers_as_df(
-    resource: Optional[Resource], course_ids: List[str]
+    resource: Optional[Resource], course_ids: List[str], max_concurrency: int = 1
 ) -> DataFrame:
     """
     Fetch Teachers API data for a range of courses and return a Teachers API DataFrame
@@ -62,6 +71,8 @@ def request_latest_teachers_as_df(
         a Google Classroom SDK Resource or None
     course_ids: List[str]
         a list of Google Classroom course ids as a string array
+    max_concurrency: int
+        the maximum number of batch requests to make at once
 
     Returns
     -------
@@ -73,17 +84,24 @@ def request_latest_teachers_as_df(
     DataFrame columns are:
         courseId: Identifier of the course
         userId: Identifier of the user
-        profile.id: Identifier of the user
-        profile.name.givenName: The user's first name
-        profile.name.familyName: The user's last name
         profile.name.fullName: The user's full name formed by concatenating the first and last name values
         profile.emailAddress: Email address of the user
     """
 
     logger.info("Pulling teacher data")
     teachers: List[Dict[str, str]] = []
-    for course_id in course_ids:
-        teachers.extend(request_teachers(resource, course_id))
+    if resource is not None:
+        for course_teachers in call_api_batched(
+            resource,
+            cast(ResourceType, resource).courses().teachers().list,
+            [
+                {"courseId": course_id, "fields": TEACHERS_FIELDS}
+                for course_id in course_ids
+            ],
+            "teachers",
+            max_concurrency,
+        ):
+            teachers.extend(course_teachers)
 
     return json_normalize(teachers).astype("string")
 
@@ -92,6 +110,7 @@ def request_all_teachers_as_df(
     resource: Optional[Resource],
     course_ids: List[str],
     sync_db: sqlalchemy.engine.base.Engine,
+    max_concurrency: int = 1,
 ) -> DataFrame:
     """
     Fetch Teachers API data for a range of courses and return a Teachers API DataFrame
@@ -105,6 +124,8 @@ def request_all_teachers_as_df(
         a list of Google Classroom course ids as a string array
     sync_db: sqlalchemy.engine.base.Engine
         an Engine instance for creating database connections
+    max_concurrency: int
+        the maximum number of batch requests to make at once
 
     Returns
     -------
@@ -116,14 +137,13 @@ def request_all_teachers_as_df(
     DataFrame columns are:
         courseId: Identifier of the course
         userId: Identifier of the user
-        profile.id: Identifier of the user
-        profile.name.givenName: The user's first name
-        profile.name.familyName: The user's last name
         profile.name.fullName: The user's full name formed by concatenating the first and last name values
         profile.emailAddress: Email address of the user
     """
 
-    teachers_df: DataFrame = request_latest_teachers_as_df(resource, course_ids)
+    teachers_df: DataFrame = request_latest_teachers_as_df(
+        resource, course_ids, max_concurrency
+    )
     teachers_df = _sync_without_cleanup(teachers_df, sync_db)
     cleanup_after_sync(TEACHERS_RESOURCE_NAME, sync_db)
 
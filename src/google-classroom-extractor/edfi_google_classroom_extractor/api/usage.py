@@ -5,13 +5,15 @@
 
 from datetime import datetime, timedelta
 import logging
-from typing import List, Dict, Optional, Any, cast
+from typing import Any, Iterator, List, Dict, Optional, cast
 from dateutil.parser import parse as date_parse
-from pandas import DataFrame, json_normalize, read_sql, date_range
+from pandas import DataFrame, concat, json_normalize, read_sql, date_range
 from sqlalchemy.exc import OperationalError
 import sqlalchemy
 from googleapiclient.discovery import Resource
-from .api_caller import call_api, ResourceType
+from .api_caller import call_api, iter_api_pages, iter_concurrently, ResourceType
+
+USAGE_PARAMETERS = "classroom:timestamp_last_interaction,classroom:num_posts_created,accounts:timestamp_last_login"
 
 logger = logging.getLogger(__name__)
 
@@ -23,22 +25,49 @@ def request_usage(resource: Optional[Resource], date: str) -> List[Dict[str, str
 
     return call_api(
         cast(ResourceType, resource).userUsageReport().get,
-        {
-            "userKey": "all",
-            "date": date,
-            "parameters": "classroom:timestamp_last_interaction,classroom:num_posts_created,accounts:timestamp_last_login",
-        },
+        {"userKey": "all", "date": date, "parameters": USAGE_PARAMETERS},
+        "usageReports",
+    )
+
+
+def _request_usage_pages(
+    resource: Optional[Resource], date: str
+) -> Iterator[List[Dict[str, str]]]:
+    if resource is None:
+        return iter(())
+
+    return iter_api_pages(
+        cast(ResourceType, resource).userUsageReport().get,
+        {"userKey": "all", "date": date, "parameters": USAGE_PARAMETERS},
         "usageReports",
     )
 
 
+def _usage_row(report: Any) -> Dict[str, str]:
+    row: Dict[str, str] = {}
+    row["email"] = report.get("entity").get("userEmail")
+    row["asOfDate"] = report.get("date")
+    row["importDate"] = datetime.today().strftime("%Y-%m-%d")
+
+    for parameter in report.get("parameters"):
+        if parameter.get("name") == "classroom:num_posts_created":
+            row["numberOfPosts"] = parameter.get("intValue")
+
+        if parameter.get("name") == "classroom:last_interaction_time":
+            row["lastInteractionTime"] = parameter.get("datetimeValue")
+
+        if parameter.get("name") == "accounts:last_login_time":
+            row["lastLoginTime"] = parameter.get("datetimeValue")
+    return row
+
+
 def last_sync_date(sync_db: sqlalchemy.engine.base.Engine) -> Optional[datetime]:
     with sync_db.connect() as con:
         try:
             usage_df = read_sql("SELECT asOfDate FROM Usage", con)
             if usage_df["asOfDate"].count() == 0:
                 return None
-            return date_parse(usage_df["asOfDate"].max())  # type: ignore
+            return date_parse(usage_df["asOfDate"].max())
         except OperationalError:
             logger.debug("No Usage table yet")
             return None
@@ -59,36 +88,7 @@ def end_date(env_end_date: str) -> datetime:
     return date_parse(env_end_date)
 
 
-def request_latest_usage_as_df(
-    resource: Optional[Resource], start: datetime, end: datetime
-) -> DataFrame:
-    logger.info("Pulling usage data")
-
-    if end < start:
-        logger.info("Usage data end time is before start time.")
-
-    reports: List[Any] = []
-    for date in date_range(start=start, end=end):
-        reports.extend(request_usage(resource, date.strftime("%Y-%m-%d")))
-
-    usage: List[Dict[str, str]] = []
-    for response in reports:
-        row: Dict[str, str] = {}
-        row["email"] = response.get("entity").get("userEmail")
-        row["asOfDate"] = response.get("date")
-        row["importDate"] = datetime.today().strftime("%Y-%m-%d")
-
-        for parameter in response.get("parameters"):
-            if parameter.get("name") == "classroom:num_posts_created":
-                row["numberOfPosts"] = parameter.get("intValue")
-
-            if parameter.get("name") == "classroom:last_interaction_time":
-                row["lastInteractionTime"] = parameter.get("datetimeValue")
-
-            if parameter.get("name") == "accounts:last_login_time":
-                row["lastLoginTime"] = parameter.get("datetimeValue")
-        usage.append(row)
-
+def _usage_df(usage: List[Dict[str, str]]) -> DataFrame:
     usage_df: DataFrame = json_normalize(usage)
     if usage_df.empty:
         return usage_df
@@ -111,26 +111,122 @@ def request_latest_usage_as_df(
     return usage_df
 
 
-def request_all_usage_as_df(
+def _request_usage_day_df(resource: Optional[Resource], date: str) -> DataFrame:
+    # Reports are mapped page by page, so that only the rows are kept
+    usage: List[Dict[str, str]] = []
+    for reports in _request_usage_pages(resource, date):
+        usage.extend(_usage_row(report) for report in reports)
+    return _usage_df(usage)
+
+
+def request_usage_by_day(
     resource: Optional[Resource],
-    sync_db: sqlalchemy.engine.base.Engine,
-    env_start_date: str,
-    env_end_date: str,
-) -> DataFrame:
-    usage_df: DataFrame = request_latest_usage_as_df(
-        resource, start_date(sync_db, env_start_date), end_date(env_end_date)
+    start: datetime,
+    end: datetime,
+    max_concurrency: int = 1,
+) -> Iterator[DataFrame]:
+    """
+    Fetch Usage API data for each day of a date range, up to `max_concurrency`
+    days at once, and yield a Usage DataFrame for each day in date order as
+    soon as it and the days before it are done
+
+    Parameters
+    ----------
+    resource: Optional[Resource]
+        a Google Admin Reports SDK Resource or None
+    start: datetime
+        the first day to fetch
+    end: datetime
+        the last day to fetch
+    max_concurrency: int
+        the maximum number of days to request at once
+
+    Returns
+    -------
+    Iterator[DataFrame]
+        a Usage DataFrame for each day, which is empty for days without reports
+    """
+    if end < start:
+        logger.info("Usage data end time is before start time.")
+
+    return iter_concurrently(
+        lambda date: _request_usage_day_df(resource, date.strftime("%Y-%m-%d")),
+        date_range(start=start, end=end),
+        max_concurrency,
     )
-    if usage_df.empty:
-        return usage_df
+
+
+def request_latest_usage_as_df(
+    resource: Optional[Resource],
+    start: datetime,
+    end: datetime,
+    max_concurrency: int = 1,
+) -> DataFrame:
+    logger.info("Pulling usage data")
+
+    usage_dfs: List[DataFrame] = [
+        usage_df
+        for usage_df in request_usage_by_day(resource, start, end, max_concurrency)
+        if not usage_df.empty
+    ]
+    if not usage_dfs:
+        return DataFrame()
+
+    return concat(usage_dfs, ignore_index=True)
+
+
+def _save_usage(usage_df: DataFrame, sync_db: sqlalchemy.engine.base.Engine) -> None:
+    with sync_db.connect() as con:
+        try:
+            last_rowid = con.execute("SELECT max(rowid) FROM Usage").scalar() or 0
+        except OperationalError:
+            last_rowid = 0
 
     usage_df.to_sql("Usage", sync_db, if_exists="append", index=False, chunksize=500)
-    # remove duplicates - leave only the most recent
+    # remove duplicates - leave only the most recent. Earlier rows are already
+    # unique, so only the keys of the new rows are looked up
     with sync_db.connect() as con:
         con.execute(
-            "DELETE from Usage "
-            "WHERE rowid not in (select max(rowid) "
-            "FROM Usage "
-            "GROUP BY email, asOfDate)"
+            "CREATE INDEX IF NOT EXISTS IX_Usage_Email_AsOfDate "
+            "ON Usage (email, asOfDate)"
+        )
+        con.execute(
+            "DELETE FROM Usage "
+            "WHERE rowid IN (SELECT earlier.rowid "
+            "FROM Usage AS later "
+            "JOIN Usage AS earlier "
+            "ON earlier.email = later.email "
+            "AND earlier.asOfDate = later.asOfDate "
+            "AND earlier.rowid < later.rowid "
+            "WHERE later.rowid > ?)",
+            (last_rowid,),
         )
 
-    return usage_df
+
+def request_all_usage_as_df(
+    resource: Optional[Resource],
+    sync_db: sqlalchemy.engine.base.Engine,
+    env_start_date: str,
+    env_end_date: str,
+    max_concurrency: int = 1,
+) -> DataFrame:
+    logger.info("Pulling usage data")
+
+    # Each day is saved once it and the days before it are done, so that an
+    # interrupted pull resumes after the last saved day
+    usage_dfs: List[DataFrame] = []
+    for usage_df in request_usage_by_day(
+        resource,
+        start_date(sync_db, env_start_date),
+        end_date(env_end_date),
+        max_concurrency,
+    ):
+        if usage_df.empty:
+            continue
+        _save_usage(usage_df, sync_db)
+        usage_dfs.append(usage_df)
+
+    if not usage_dfs:
+        return DataFrame()
+
+    return concat(usage_dfs, ignore_index=True)
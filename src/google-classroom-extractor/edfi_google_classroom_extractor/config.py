@@ -5,10 +5,15 @@
 
 import logging
 import os
+import threading
 
 from google.oauth2 import service_account
-from sqlalchemy import create_engine
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, Resource
+from googleapiclient.http import HttpRequest
+import httplib2
 import sqlalchemy
+from edfi_lms_extractor_lib.api import sync_db
 
 
 logger = logging.getLogger(__name__)
@@ -38,9 +43,7 @@ def get_sync_db_engine(sync_database_directory: str) -> sqlalchemy.engine.base.E
     """
     running_in_notebook: bool = _is_running_in_notebook()
     logger.debug("Running in Jupyter Notebook: %s", running_in_notebook)
-    logger.debug("Ensuring database directory at %s", os.path.abspath(sync_database_directory))
-    os.makedirs(sync_database_directory, exist_ok=True)
-    return create_engine(f"sqlite:///{sync_database_directory}/sync.sqlite")
+    return sync_db.get_sync_db_engine(sync_database_directory)
 
 
 def get_credentials(classroom_account: str) -> service_account.Credentials:
@@ -72,3 +75,41 @@ def get_credentials(classroom_account: str) -> service_account.Credentials:
     return service_account.Credentials.from_service_account_file(
         filename, scopes=scopes, subject=classroom_account
     )
+
+
+def build_resource(
+    service_name: str, version: str, credentials: service_account.Credentials
+) -> Resource:
+    """
+    Create a Google SDK Resource that can be shared between threads. The
+    transport of the SDK is not thread-safe, so each thread sends its requests
+    through its own authorized HTTP connection.
+
+    Parameters
+    ----------
+    service_name: str
+        the name of the API, e.g. "classroom"
+    version: str
+        the version of the API, e.g. "v1"
+    credentials: Credentials
+        a Google OAuth Credentials object
+
+    Returns
+    -------
+    Resource
+        a Google SDK Resource
+    """
+    local = threading.local()
+
+    def build_request(http, *args, **kwargs) -> HttpRequest:
+        if not hasattr(local, "http"):
+            local.http = AuthorizedHttp(credentials, http=httplib2.Http())
+        return HttpRequest(local.http, *args, **kwargs)
+
+    return build(
+        service_name,
+        version,
+        credentials=credentials,
+        requestBuilder=build_request,
+        cache_discovery=False,
+    )
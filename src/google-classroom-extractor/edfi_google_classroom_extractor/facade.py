@@ -8,7 +8,7 @@ import logging
 from typing import Any, Dict, List
 import sys
 
-from googleapiclient.discovery import build, Resource
+from googleapiclient.discovery import Resource
 from google.oauth2 import service_account
 from pandas import DataFrame
 import sqlalchemy
@@ -22,7 +22,11 @@ from edfi_google_classroom_extractor.api.submissions import (
     request_all_submissions_as_df,
 )
 from edfi_google_classroom_extractor.helpers.arg_parser import MainArguments
-from edfi_google_classroom_extractor.config import get_credentials, get_sync_db_engine
+from edfi_google_classroom_extractor.config import (
+    build_resource,
+    get_credentials,
+    get_sync_db_engine,
+)
 from edfi_google_classroom_extractor.mapping.users import (
     students_and_teachers_to_users_df,
 )
@@ -71,8 +75,12 @@ def _get_courses(
     classroom_resource: Resource,
     sync_db: sqlalchemy.engine.base.Engine,
     output_directory: str,
+    output_format: str,
+    max_concurrency: int,
 ):
-    courses_df: DataFrame = request_all_courses_as_df(classroom_resource, sync_db)
+    courses_df: DataFrame = request_all_courses_as_df(
+        classroom_resource, sync_db, max_concurrency
+    )
     result_bucket["course_ids"] = courses_df["id"].tolist()
 
     logger.info("Writing LMS UDM Sections to CSV file")
@@ -82,6 +90,7 @@ def _get_courses(
         sections_df,
         now,
         output_directory,
+        output_format,
     )
 
 
@@ -90,11 +99,17 @@ def _get_users(
     classroom_resource: Resource,
     sync_db: sqlalchemy.engine.base.Engine,
     output_directory: str,
+    output_format: str,
+    max_concurrency: int,
 ):
     course_ids: List[str] = result_bucket["course_ids"]
 
-    students = request_all_students_as_df(classroom_resource, course_ids, sync_db)
-    teachers = request_all_teachers_as_df(classroom_resource, course_ids, sync_db)
+    students = request_all_students_as_df(
+        classroom_resource, course_ids, sync_db, max_concurrency
+    )
+    teachers = request_all_teachers_as_df(
+        classroom_resource, course_ids, sync_db, max_concurrency
+    )
     result_bucket["students_df"] = students
     result_bucket["teachers_df"] = teachers
 
@@ -103,11 +118,14 @@ def _get_users(
         students_and_teachers_to_users_df(students, teachers),
         now,
         output_directory,
+        output_format,
     )
 
 
 @catch_exceptions
-def _get_section_associations(classroom_resource: Resource, output_directory: str):
+def _get_section_associations(
+    classroom_resource: Resource, output_directory: str, output_format: str
+):
     logger.info("Writing LMS UDM UserSectionAssociations to CSV files")
 
     students_df = result_bucket["students_df"]
@@ -121,6 +139,7 @@ def _get_section_associations(classroom_resource: Resource, output_directory: st
         all_section_ids,
         now,
         output_directory,
+        output_format,
     )
 
 
@@ -129,13 +148,15 @@ def _get_assignments(
     classroom_resource: Resource,
     sync_db: sqlalchemy.engine.base.Engine,
     output_directory: str,
+    output_format: str,
+    max_concurrency: int,
 ):
     logger.info("Writing LMS UDM Assignments to CSV files")
 
     course_ids: List[str] = result_bucket["course_ids"]
     all_section_ids = result_bucket["section_ids"]
     courseworks_df = request_all_coursework_as_df(
-        classroom_resource, course_ids, sync_db
+        classroom_resource, course_ids, sync_db, max_concurrency
     )
 
     write_assignments(
@@ -143,6 +164,7 @@ def _get_assignments(
         all_section_ids,
         now,
         output_directory,
+        output_format,
     )
 
 
@@ -151,12 +173,14 @@ def _get_assignment_submissions(
     classroom_resource: Resource,
     sync_db: sqlalchemy.engine.base.Engine,
     output_directory: str,
+    output_format: str,
+    max_concurrency: int,
 ):
     logger.info("Writing LMS UDM AssignmentSubmissions to CSV files")
 
     course_ids: List[str] = result_bucket["course_ids"]
     submissions_df = request_all_submissions_as_df(
-        classroom_resource, course_ids, sync_db
+        classroom_resource, course_ids, sync_db, max_concurrency
     )
     result_bucket["submissions_df"] = submissions_df
 
@@ -164,11 +188,12 @@ def _get_assignment_submissions(
         submissions_to_assignment_submissions_dfs(submissions_df),
         now,
         output_directory,
+        output_format,
     )
 
 
 @catch_exceptions
-def _get_section_activities(output_directory: str):
+def _get_section_activities(output_directory: str, output_format: str):
     logger.info("Writing LMS UDM Section Activities to CSV files")
 
     submissions_df: DataFrame = result_bucket["submissions_df"]
@@ -178,22 +203,24 @@ def _get_section_activities(output_directory: str):
         all_section_ids,
         now,
         output_directory,
+        output_format,
     )
 
 
 @catch_exceptions
-def _get_system_activities(output_directory: str):
+def _get_system_activities(output_directory: str, output_format: str):
     logger.info("Writing empty LMS UDM SystemActivities to CSV file")
 
     write_system_activities(
         DataFrame(),
         now,
         output_directory,
+        output_format,
     )
 
 
 @catch_exceptions
-def _get_grades(output_directory: str):
+def _get_grades(output_directory: str, output_format: str):
     logger.info("Writing empty LMS UDM Grades to CSV files")
 
     all_section_ids = result_bucket["section_ids"]
@@ -202,6 +229,7 @@ def _get_grades(output_directory: str):
         all_section_ids,
         now,
         output_directory,
+        output_format,
     )
 
 
@@ -210,43 +238,59 @@ def run(arguments: MainArguments):
     credentials: service_account.Credentials = get_credentials(
         arguments.classroom_account
     )
-    classroom_resource: Resource = build(
-        "classroom", "v1", credentials=credentials, cache_discovery=False
-    )
+    classroom_resource: Resource = build_resource("classroom", "v1", credentials)
     sync_db: sqlalchemy.engine.base.Engine = get_sync_db_engine(
         arguments.sync_database_directory
     )
 
     succeeded: bool = False
 
-    succeeded = _get_courses(classroom_resource, sync_db, arguments.output_directory)
+    output_directory = arguments.output_directory
+    output_format = arguments.output_format
+    max_concurrency = arguments.max_concurrency
+
+    succeeded = _get_courses(
+        classroom_resource, sync_db, output_directory, output_format, max_concurrency
+    )
     if not succeeded:
         _break_execution("Sections")
 
-    succeeded = _get_users(classroom_resource, sync_db, arguments.output_directory)
+    succeeded = _get_users(
+        classroom_resource, sync_db, output_directory, output_format, max_concurrency
+    )
     if not succeeded:
         _break_execution("Users")
 
-    succeeded = _get_section_associations(classroom_resource, arguments.output_directory)
+    succeeded = _get_section_associations(
+        classroom_resource, output_directory, output_format
+    )
     if not succeeded:
         _break_execution("Section Associations")
 
     if arguments.extract_assignments:
         succeeded = _get_assignments(
-            classroom_resource, sync_db, arguments.output_directory
+            classroom_resource,
+            sync_db,
+            output_directory,
+            output_format,
+            max_concurrency,
         )
         if not succeeded:
             _break_execution("Assignments")
 
         _get_assignment_submissions(
-            classroom_resource, sync_db, arguments.output_directory
+            classroom_resource,
+            sync_db,
+            output_directory,
+            output_format,
+            max_concurrency,
         )
 
     if arguments.extract_activities:
-        _get_section_activities(arguments.output_directory)
-        _get_system_activities(arguments.output_directory)
+        _get_section_activities(output_directory, output_format)
+        _get_system_activities(output_directory, output_format)
 
     if arguments.extract_grades:
-        _get_grades(arguments.output_directory)
+        _get_grades(output_directory, output_format)
 
     logger.info("Finishing Ed-Fi LMS Google Classroom Extractor")
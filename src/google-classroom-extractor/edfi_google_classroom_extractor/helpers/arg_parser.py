@@ -1,9 +1,19 @@
 
+from argparse import ArgumentTypeError
 from dataclasses import dataclass
 from typing import List
 
 from configargparse import ArgParser
 
+from edfi_lms_extractor_lib.csv_generation.write import (
+    CSV_FORMAT,
+    OUTPUT_FORMATS,
+    PARQUET_FORMAT,
+    parquet_supported,
+)
+
+from edfi_google_classroom_extractor.api.api_caller import DEFAULT_MAX_CONCURRENCY
+
 from . import constants
 
 
@@ -22,6 +32,23 @@ class MainArguments:
     extract_assignments: bool = False
     extract_attendance: bool = False
     extract_grades: bool = False
+    output_format: str = CSV_FORMAT
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def _output_format(value: str) -> str:
+    if value == PARQUET_FORMAT and not parquet_supported():
+        raise ArgumentTypeError(
+            "parquet output requires the pyarrow package, from the parquet extra"
+        )
+    return value
 
 
 def parse_main_arguments(args_in: List[str]) -> MainArguments:
@@ -114,6 +141,25 @@ def parse_main_arguments(args_in: List[str]) -> MainArguments:
         env_var="FEATURE",
     )
 
+    parser.add(  # type: ignore
+        "--output-format",
+        required=False,
+        help="The format of the generated files. Parquet files are smaller and faster for the LMS Data Store Loader to read.",
+        type=_output_format,
+        choices=OUTPUT_FORMATS,
+        default=CSV_FORMAT,
+        env_var="OUTPUT_FORMAT",
+    )
+
+    parser.add(  # type: ignore
+        "--max-concurrency",
+        required=False,
+        help="The maximum number of batch requests to make to the API at once.",
+        type=_positive_int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        env_var="MAX_CONCURRENCY",
+    )
+
     args_parsed = parser.parse_args(args_in)
 
     assert isinstance(
@@ -131,6 +177,8 @@ def parse_main_arguments(args_in: List[str]) -> MainArguments:
         extract_assignments=constants.Features.Assignments in args_parsed.feature,
         extract_attendance=constants.Features.Attendance in args_parsed.feature,
         extract_grades=constants.Features.Grades in args_parsed.feature,
+        output_format=args_parsed.output_format,
+        max_concurrency=args_parsed.max_concurrency,
     )
 
     return arguments
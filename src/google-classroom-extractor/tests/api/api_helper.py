@@ -2,7 +2,7 @@
 # Licensed to the Ed-Fi Alliance under one or more agreements.
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from pandas import DataFrame
 import pook
 from pathlib import Path
@@ -122,3 +122,224 @@ def setup_fake_classroom_api(suffix_response_pairs: List[Tuple[str, str]]) -> Re
             reply=200,
         )
     return build("classroom", "v1", credentials=fake_credentials, cache_discovery=False)
+
+
+def _parse_fields(fields: str, position: int = 0) -> Tuple[Dict[str, Any], int]:
+    tree: Dict[str, Any] = {}
+    name = ""
+    while position < len(fields):
+        character = fields[position]
+        position += 1
+        if character == "(":
+            tree[name], position = _parse_fields(fields, position)
+            name = ""
+        elif character == ")":
+            break
+        elif character == ",":
+            name = ""
+        else:
+            name += character
+            if position == len(fields) or fields[position] in ",)":
+                node = tree
+                *parents, leaf = name.split("/")
+                for parent in parents:
+                    node = node.setdefault(parent, {})
+                node[leaf] = None
+    return (tree, position)
+
+
+def _project(value: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [_project(item, tree) for item in value]
+    return {
+        name: _project(value[name], subtree)
+        for name, subtree in tree.items()
+        if name in value
+    }
+
+
+def apply_fields(response: Dict[str, Any], fields: str) -> Dict[str, Any]:
+    """
+    Apply a Google API `fields` partial response mask to a full response, as
+    the API would
+
+    Parameters
+    ----------
+    response: Dict[str, Any]
+        is a full API response
+    fields: str
+        is a mask such as "nextPageToken,students(userId,profile/emailAddress)"
+
+    Returns
+    -------
+    Dict[str, Any]
+        the parts of the response selected by the mask
+    """
+    return _project(response, _parse_fields(fields)[0])
+
+
+def full_course(course_id: str) -> Dict[str, Any]:
+    """
+    A Course resource with every field the Classroom API returns by default
+    """
+    folder = {"id": f"f{course_id}", "title": "Folder", "alternateLink": "https://x"}
+    return {
+        "id": course_id,
+        "name": f"Course {course_id}",
+        "section": "Period 1",
+        "descriptionHeading": f"Heading {course_id}",
+        "description": "A course description that is often a few sentences long.",
+        "room": "101",
+        "ownerId": "100",
+        "creationTime": "2020-08-01T10:00:00.000Z",
+        "updateTime": "2020-08-02T10:00:00.000Z",
+        "enrollmentCode": "abc123",
+        "courseState": "ACTIVE",
+        "alternateLink": f"https://classroom.google.com/c/{course_id}",
+        "teacherGroupEmail": f"teachers_{course_id}@example.com",
+        "courseGroupEmail": f"course_{course_id}@example.com",
+        "teacherFolder": folder,
+        "guardiansEnabled": False,
+        "calendarId": f"classroom{course_id}@group.calendar.google.com",
+        "gradebookSettings": {
+            "calculationType": "TOTAL_POINTS",
+            "displaySetting": "HIDE_OVERALL_GRADE",
+        },
+    }
+
+
+def full_user(course_id: str, user_id: str) -> Dict[str, Any]:
+    """
+    A Student or Teacher resource with every field the Classroom API returns
+    by default
+    """
+    return {
+        "courseId": course_id,
+        "userId": user_id,
+        "profile": {
+            "id": user_id,
+            "name": {
+                "givenName": "Given",
+                "familyName": f"Family{user_id}",
+                "fullName": f"Given Family{user_id}",
+            },
+            "emailAddress": f"user{user_id}@example.com",
+            "photoUrl": f"https://lh3.googleusercontent.com/a/{user_id}",
+            "permissions": [{"permission": "CREATE_COURSE"}],
+            "verifiedTeacher": False,
+        },
+        "studentWorkFolder": {
+            "id": f"f{user_id}",
+            "title": "Work",
+            "alternateLink": "https://drive.google.com/x",
+        },
+    }
+
+
+def full_coursework(course_id: str, coursework_id: str) -> Dict[str, Any]:
+    """
+    A CourseWork resource with every field the Classroom API returns by default
+    """
+    return {
+        "courseId": course_id,
+        "id": coursework_id,
+        "title": f"Assignment {coursework_id}",
+        "description": "Instructions for the assignment, often a paragraph long.",
+        "materials": [
+            {
+                "driveFile": {
+                    "driveFile": {
+                        "id": f"d{coursework_id}",
+                        "title": "Worksheet",
+                        "alternateLink": "https://drive.google.com/x",
+                        "thumbnailUrl": "https://drive.google.com/thumbnail",
+                    },
+                    "shareMode": "VIEW",
+                }
+            }
+        ],
+        "state": "PUBLISHED",
+        "alternateLink": f"https://classroom.google.com/c/{course_id}/a/{coursework_id}",
+        "creationTime": "2020-08-03T10:00:00.000Z",
+        "updateTime": "2020-08-04T10:00:00.000Z",
+        "dueDate": {"year": 2020, "month": 9, "day": 1},
+        "dueTime": {"hours": 23, "minutes": 59},
+        "scheduledTime": "2020-08-05T10:00:00.000Z",
+        "maxPoints": 100,
+        "workType": "ASSIGNMENT",
+        "associatedWithDeveloper": False,
+        "assigneeMode": "ALL_STUDENTS",
+        "submissionModificationMode": "MODIFIABLE_UNTIL_TURNED_IN",
+        "creatorUserId": "100",
+        "topicId": "200",
+        "assignment": {
+            "studentWorkFolder": {
+                "id": f"w{coursework_id}",
+                "title": "Work",
+                "alternateLink": "https://drive.google.com/x",
+            }
+        },
+    }
+
+
+def full_submission(
+    course_id: str, coursework_id: str, user_id: str
+) -> Dict[str, Any]:
+    """
+    A StudentSubmission resource with every field the Classroom API returns by
+    default
+    """
+    return {
+        "courseId": course_id,
+        "courseWorkId": coursework_id,
+        "id": f"s{coursework_id}-{user_id}",
+        "userId": user_id,
+        "creationTime": "2020-08-05T10:00:00.000Z",
+        "updateTime": "2020-08-06T10:00:00.000Z",
+        "state": "TURNED_IN",
+        "late": True,
+        "draftGrade": 90,
+        "assignedGrade": 90,
+        "alternateLink": f"https://classroom.google.com/c/{course_id}/a/{coursework_id}",
+        "courseWorkType": "ASSIGNMENT",
+        "associatedWithDeveloper": False,
+        "submissionHistory": [
+            {
+                "stateHistory": {
+                    "state": "CREATED",
+                    "stateTimestamp": "2020-08-05T10:00:00.000Z",
+                    "actorUserId": user_id,
+                }
+            },
+            {
+                "stateHistory": {
+                    "state": "TURNED_IN",
+                    "stateTimestamp": "2020-08-06T10:00:00.000Z",
+                    "actorUserId": user_id,
+                }
+            },
+            {
+                "gradeHistory": {
+                    "pointsEarned": 90,
+                    "maxPoints": 100,
+                    "gradeTimestamp": "2020-08-07T10:00:00.000Z",
+                    "actorUserId": "100",
+                    "gradeChangeType": "ASSIGNED_GRADE_POINTS_EARNED_CHANGE",
+                }
+            },
+        ],
+        "assignmentSubmission": {
+            "attachments": [
+                {
+                    "driveFile": {
+                        "id": f"a{user_id}",
+                        "title": "My work",
+                        "alternateLink": "https://drive.google.com/x",
+                        "thumbnailUrl": "https://drive.google.com/thumbnail",
+                    }
+                }
+            ]
+        },
+    }
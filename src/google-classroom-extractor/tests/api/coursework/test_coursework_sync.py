@@ -179,8 +179,8 @@ def describe_when_testing_sync_with_new_and_missing_and_updated_rows():
         test_db_after_sync,
     ):
         EXPECTED_COURSEWORKS_DATA_AFTER_SYNC = [
-            UNCHANGED_COURSEWORK,
             CHANGED_COURSEWORK_AFTER,
+            UNCHANGED_COURSEWORK,
             NEW_COURSEWORK,
         ]
         with test_db_after_sync.connect() as con:
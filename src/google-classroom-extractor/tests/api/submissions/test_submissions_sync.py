@@ -149,8 +149,8 @@ def describe_when_testing_sync_with_new_and_missing_and_updated_rows():
         test_db_after_sync,
     ):
         EXPECTED_SUBMISSIONS_DATA_AFTER_SYNC = [
-            UNCHANGED_SUBMISSION,
             CHANGED_SUBMISSION_AFTER,
+            UNCHANGED_SUBMISSION,
             NEW_SUBMISSION,
         ]
         with test_db_after_sync.connect() as con:
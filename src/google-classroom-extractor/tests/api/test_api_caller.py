@@ -0,0 +1,247 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from threading import Barrier
+import time
+from typing import Callable, Dict, List, Set
+
+import pytest
+
+from edfi_google_classroom_extractor.api import api_caller
+from edfi_google_classroom_extractor.api.api_caller import (
+    RateLimiter,
+    call_api_batched,
+    iter_api_pages,
+    iter_concurrently,
+    map_concurrently,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeRequest:
+    def __init__(self, pages: Dict[str, List[Dict]], parameters: Dict[str, str]):
+        self.pages = pages
+        self.parameters = parameters
+
+    def execute(self) -> Dict:
+        course_pages = self.pages[self.parameters["courseId"]]
+        page = int(self.parameters.get("pageToken", 0))
+        response: Dict = {"items": course_pages[page]}
+        if page + 1 < len(course_pages):
+            response["nextPageToken"] = str(page + 1)
+        return response
+
+
+class FakeBatch:
+    def __init__(self, callback: Callable, failing_course_ids: Set[str]):
+        self.callback = callback
+        self.failing_course_ids = failing_course_ids
+        self.requests: Dict[str, FakeRequest] = {}
+
+    def add(self, request: FakeRequest, request_id: str) -> None:
+        self.requests[request_id] = request
+
+    def execute(self) -> None:
+        for request_id, request in self.requests.items():
+            if request.parameters["courseId"] in self.failing_course_ids:
+                self.callback(request_id, None, IOError("failed in batch"))
+            else:
+                self.callback(request_id, request.execute(), None)
+
+
+class FakeResource:
+    """
+    Serves list pages of fake items by course id, alone or in batches.
+    """
+
+    def __init__(self, pages: Dict[str, List[Dict]], failing_course_ids=None):
+        self.pages = pages
+        self.failing_course_ids: Set[str] = failing_course_ids or set()
+        self.batches: List[FakeBatch] = []
+        self.requested: List[Dict[str, str]] = []
+
+    def list(self, **parameters) -> FakeRequest:
+        self.requested.append(dict(parameters))
+        return FakeRequest(self.pages, dict(parameters))
+
+    def new_batch_http_request(self, callback: Callable) -> FakeBatch:
+        batch = FakeBatch(callback, self.failing_course_ids)
+        self.batches.append(batch)
+        return batch
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(api_caller, "_rate_limiter", RateLimiter(10 ** 9))
+
+
+def _call(resource: FakeResource, course_ids: List[str], max_concurrency=1):
+    return call_api_batched(
+        resource,
+        resource.list,
+        [{"courseId": course_id} for course_id in course_ids],
+        "items",
+        max_concurrency,
+    )
+
+
+def describe_when_iterating_over_api_pages():
+    def it_should_yield_each_page_before_requesting_the_next():
+        resource = FakeResource({"1": [["a", "b"], ["c"]]})
+
+        pages = iter_api_pages(resource.list, {"courseId": "1"}, "items")
+
+        assert next(pages) == ["a", "b"]
+        assert len(resource.requested) == 1
+        assert next(pages) == ["c"]
+        assert resource.requested[1] == {"courseId": "1", "pageToken": "1"}
+        assert next(pages, None) is None
+
+    def it_should_leave_the_parameters_unchanged():
+        resource = FakeResource({"1": [["a"], ["b"]]})
+        parameters = {"courseId": "1"}
+
+        assert list(iter_api_pages(resource.list, parameters, "items")) == [
+            ["a"],
+            ["b"],
+        ]
+        assert parameters == {"courseId": "1"}
+
+
+def describe_when_calling_the_api_in_batches():
+    def it_should_return_the_items_of_each_call_in_order():
+        resource = FakeResource({"1": [["a"]], "2": [["b", "c"]], "3": [[]]})
+
+        assert _call(resource, ["1", "2", "3"]) == [["a"], ["b", "c"], []]
+
+    def it_should_make_one_batch_request_per_page():
+        resource = FakeResource({"1": [["a"], ["b"], ["c"]], "2": [["d"]]})
+
+        result = _call(resource, ["1", "2"])
+
+        assert result == [["a", "b", "c"], ["d"]]
+        assert [len(batch.requests) for batch in resource.batches] == [2, 1, 1]
+
+    def it_should_split_the_calls_into_batches_of_fifty():
+        course_ids = [str(id) for id in range(120)]
+        resource = FakeResource({id: [[id]] for id in course_ids})
+
+        result = _call(resource, course_ids, max_concurrency=3)
+
+        assert result == [[id] for id in course_ids]
+        assert sorted(len(batch.requests) for batch in resource.batches) == [
+            20,
+            50,
+            50,
+        ]
+
+    def it_should_retry_a_failed_call_alone():
+        resource = FakeResource(
+            {"1": [["a"]], "2": [["b"], ["c"]]}, failing_course_ids={"2"}
+        )
+
+        result = _call(resource, ["1", "2"])
+
+        assert result == [["a"], ["b", "c"]]
+        assert [len(batch.requests) for batch in resource.batches] == [2]
+
+
+def describe_when_mapping_concurrently():
+    def it_should_keep_the_order_of_the_items():
+        result = map_concurrently(lambda item: item * 2, [3, 1, 2], max_concurrency=3)
+
+        assert result == [6, 2, 4]
+
+    def it_should_run_the_calls_at_the_same_time():
+        # Both calls must be in flight together for the barrier to open
+        barrier = Barrier(2, timeout=5)
+
+        result = map_concurrently(lambda item: barrier.wait() >= 0, [1, 2], 2)
+
+        assert result == [True, True]
+
+    def it_should_run_one_call_at_a_time_by_default():
+        in_flight: List[int] = []
+
+        def call(item: int) -> int:
+            in_flight.append(item)
+            assert len(in_flight) == 1
+            in_flight.remove(item)
+            return item
+
+        assert map_concurrently(call, [1, 2, 3]) == [1, 2, 3]
+
+
+def describe_when_iterating_concurrently():
+    def it_should_yield_the_results_in_order():
+        results = iter_concurrently(lambda item: item * 2, [3, 1, 2], 2)
+
+        assert list(results) == [6, 2, 4]
+
+    def it_should_not_start_more_calls_after_a_failure():
+        started: List[int] = []
+
+        def call(item: int) -> int:
+            started.append(item)
+            if item == 0:
+                raise IOError("failed")
+            time.sleep(0.05)
+            return item
+
+        with pytest.raises(IOError):
+            list(iter_concurrently(call, range(20), max_concurrency=2))
+
+        assert len(started) < 20
+
+
+def describe_when_rate_limiting():
+    @pytest.fixture
+    def clock(monkeypatch) -> FakeClock:
+        clock = FakeClock()
+        monkeypatch.setattr(api_caller, "time", clock)
+        return clock
+
+    def it_should_not_wait_for_the_first_call(clock: FakeClock):
+        RateLimiter(calls_per_second=4).wait()
+
+        assert clock.sleeps == []
+
+    def it_should_space_the_following_calls(clock: FakeClock):
+        limiter = RateLimiter(calls_per_second=4)
+
+        limiter.wait()
+        limiter.wait()
+        limiter.wait()
+
+        assert clock.sleeps == [0.25, 0.25]
+
+    def it_should_reserve_slots_for_a_batch(clock: FakeClock):
+        limiter = RateLimiter(calls_per_second=4)
+
+        limiter.wait(calls=3)
+        limiter.wait()
+
+        assert clock.sleeps == [0.75]
+
+    def it_should_not_wait_after_a_pause(clock: FakeClock):
+        limiter = RateLimiter(calls_per_second=4)
+
+        limiter.wait()
+        clock.now += 1
+        limiter.wait()
+
+        assert clock.sleeps == []
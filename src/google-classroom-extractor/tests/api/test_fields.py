@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import Any, Callable, Dict, List, Sequence
+
+from pandas import DataFrame, json_normalize
+from pandas.testing import assert_frame_equal
+
+from edfi_google_classroom_extractor.api import (
+    courses,
+    coursework,
+    students,
+    submissions,
+    teachers,
+)
+from edfi_google_classroom_extractor.mapping.assignment_submissions import (
+    submissions_to_assignment_submissions_dfs,
+)
+from edfi_google_classroom_extractor.mapping.assignments import (
+    coursework_to_assignments_dfs,
+)
+from edfi_google_classroom_extractor.mapping.sections import courses_to_sections_df
+from edfi_google_classroom_extractor.mapping.user_section_associations import (
+    students_and_teachers_to_user_section_associations_dfs,
+)
+from edfi_google_classroom_extractor.mapping.user_submission_activities import (
+    submissions_to_user_submission_activities_dfs,
+)
+from edfi_google_classroom_extractor.mapping.users import (
+    students_and_teachers_to_users_df,
+)
+from tests.api.api_helper import (
+    apply_fields,
+    full_course,
+    full_coursework,
+    full_submission,
+    full_user,
+)
+
+
+def _masked(
+    items: List[Dict[str, Any]], response_property: str, fields: str
+) -> List[Dict[str, Any]]:
+    return apply_fields({response_property: items}, fields)[response_property]
+
+
+def _api_df(items: List[Dict[str, Any]], required_columns: Sequence = ()) -> DataFrame:
+    # As built by the request functions and the sync
+    df: DataFrame = json_normalize(items).astype("string")
+    df = df.reindex(
+        df.columns.union(required_columns, sort=False), axis=1, fill_value=""  # type: ignore
+    )
+    df["CreateDate"] = "2020-01-01"
+    df["LastModifiedDate"] = "2020-01-02"
+    return df
+
+
+def _assert_same_output(full: Any, masked: Any) -> None:
+    if isinstance(full, tuple):
+        for full_part, masked_part in zip(full, masked):
+            _assert_same_output(full_part, masked_part)
+    elif isinstance(full, dict):
+        assert full.keys() == masked.keys()
+        for key in full:
+            _assert_same_output(full[key], masked[key])
+    elif isinstance(full, DataFrame):
+        assert_frame_equal(full, masked)
+    else:
+        assert full == masked
+
+
+def _assert_mapping_unchanged(map: Callable, full_dfs: List, masked_dfs: List):
+    _assert_same_output(map(*full_dfs), map(*masked_dfs))
+
+
+def describe_when_masking_response_fields():
+    def it_should_keep_what_the_section_mapping_uses():
+        items = [full_course("1"), full_course("2")]
+
+        def courses_df(course_items):
+            df = _api_df(course_items)
+            df["alias"] = "alias"
+            return df
+
+        _assert_mapping_unchanged(
+            courses_to_sections_df,
+            [courses_df(items)],
+            [courses_df(_masked(items, "courses", courses.COURSES_FIELDS))],
+        )
+
+    def it_should_keep_the_course_aliases():
+        items = [{"courseId": "1", "alias": "d:EdFiLMS.1"}]
+
+        assert _masked(items, "aliases", courses.ALIASES_FIELDS) == [
+            {"alias": "d:EdFiLMS.1"}
+        ]
+
+    def it_should_keep_what_the_user_mappings_use():
+        student_items = [full_user("1", "10"), full_user("1", "11")]
+        teacher_items = [full_user("1", "100")]
+        full_dfs = [_api_df(student_items), _api_df(teacher_items)]
+        masked_dfs = [
+            _api_df(_masked(student_items, "students", students.STUDENTS_FIELDS)),
+            _api_df(_masked(teacher_items, "teachers", teachers.TEACHERS_FIELDS)),
+        ]
+
+        _assert_mapping_unchanged(
+            students_and_teachers_to_users_df, full_dfs, masked_dfs
+        )
+        _assert_mapping_unchanged(
+            students_and_teachers_to_user_section_associations_dfs,
+            full_dfs,
+            masked_dfs,
+        )
+
+    def it_should_keep_what_the_assignment_mapping_uses():
+        items = [full_coursework("1", "20"), full_coursework("1", "21")]
+        masked_items = _masked(items, "courseWork", coursework.COURSEWORK_FIELDS)
+
+        _assert_mapping_unchanged(
+            coursework_to_assignments_dfs,
+            [_api_df(items, coursework.REQUIRED_COLUMNS)],
+            [_api_df(masked_items, coursework.REQUIRED_COLUMNS)],
+        )
+
+    def it_should_keep_what_the_submission_mappings_use():
+        items = [full_submission("1", "20", "10"), full_submission("1", "20", "11")]
+        masked_items = _masked(
+            items, "studentSubmissions", submissions.SUBMISSIONS_FIELDS
+        )
+
+        for map in [
+            submissions_to_assignment_submissions_dfs,
+            submissions_to_user_submission_activities_dfs,
+        ]:
+            _assert_mapping_unchanged(
+                map,
+                [_api_df(items, submissions.REQUIRED_COLUMNS)],
+                [_api_df(masked_items, submissions.REQUIRED_COLUMNS)],
+            )
+
+    def it_should_drop_the_fields_no_mapping_uses():
+        masked = _masked([full_user("1", "10")], "students", students.STUDENTS_FIELDS)
+
+        assert masked == [
+            {
+                "courseId": "1",
+                "userId": "10",
+                "profile": {
+                    "name": {"fullName": "Given Family10"},
+                    "emailAddress": "user10@example.com",
+                },
+            }
+        ]
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import List
+
+import pytest
+from pandas import DataFrame
+
+from edfi_google_classroom_extractor.api import usage
+from edfi_google_classroom_extractor.api.usage import request_all_usage_as_df
+
+START_DATE = "2020-09-01"
+END_DATE = "2020-09-05"
+FAILING_DATE = "2020-09-04"
+
+
+def _day_df(date: str) -> DataFrame:
+    return usage._usage_df(
+        [
+            {
+                "email": "april.vaughan@example.com",
+                "asOfDate": date,
+                "importDate": "2020-09-15",
+                "numberOfPosts": "1",
+                "lastInteractionTime": date,
+                "lastLoginTime": date,
+            }
+        ]
+    )
+
+
+def _saved_days(test_db) -> List[str]:
+    return [
+        row[0][:10]
+        for row in test_db.execute("SELECT asOfDate FROM Usage ORDER BY asOfDate")
+    ]
+
+
+def describe_when_a_usage_pull_is_interrupted():
+    @pytest.fixture
+    def requested_dates(monkeypatch, test_db_fixture) -> List[str]:
+        requested: List[str] = []
+
+        def fail_on(failing_date: str):
+            def request_usage_day_df(resource, date: str) -> DataFrame:
+                requested.append(date)
+                if date == failing_date:
+                    raise IOError("Quota exceeded")
+                return _day_df(date)
+
+            return request_usage_day_df
+
+        monkeypatch.setattr(usage, "_request_usage_day_df", fail_on(FAILING_DATE))
+        with pytest.raises(IOError):
+            request_all_usage_as_df(
+                None, test_db_fixture, START_DATE, END_DATE, max_concurrency=2
+            )
+
+        requested.clear()
+        monkeypatch.setattr(usage, "_request_usage_day_df", fail_on(""))
+        request_all_usage_as_df(
+            None, test_db_fixture, START_DATE, END_DATE, max_concurrency=2
+        )
+        return requested
+
+    def it_should_resume_from_the_failed_day(requested_dates: List[str]):
+        assert sorted(requested_dates) == ["2020-09-04", "2020-09-05"]
+
+    def it_should_save_every_day_once(requested_dates: List[str], test_db_fixture):
+        assert _saved_days(test_db_fixture) == [
+            "2020-09-01",
+            "2020-09-02",
+            "2020-09-03",
+            "2020-09-04",
+            "2020-09-05",
+        ]
@@ -35,12 +35,12 @@ def db_posts_by_name_date(test_db, name_date) -> int:
 
 
 def describe_when_overlap_removal_is_needed():
-    @patch("edfi_google_classroom_extractor.api.usage.request_latest_usage_as_df")
+    @patch("edfi_google_classroom_extractor.api.usage.request_usage_by_day")
     def it_should_load_three_pulls_in_a_row_with_overlap_correctly(
-        mock_latest_usage_df, test_db_fixture
+        mock_usage_by_day, test_db_fixture
     ):
         # 1st pull: 17 rows
-        mock_latest_usage_df.return_value = read_csv("tests/api/usage/usage-1st.csv")
+        mock_usage_by_day.return_value = [read_csv("tests/api/usage/usage-1st.csv")]
         first_usage_df = request_all_usage_as_df(
             None, test_db_fixture, ENV_START_DATE, ENV_END_DATE
         )
@@ -49,9 +49,9 @@ def describe_when_overlap_removal_is_needed():
         assert db_ending_email(test_db_fixture) == "luislopez@conrad-turner.com"
 
         # 2nd pull: 49 rows, overlaps 7
-        mock_latest_usage_df.return_value = read_csv(
-            "tests/api/usage/usage-2nd-overlaps-1st.csv"
-        )
+        mock_usage_by_day.return_value = [
+            read_csv("tests/api/usage/usage-2nd-overlaps-1st.csv")
+        ]
         second_usage_df = request_all_usage_as_df(
             None, test_db_fixture, ENV_START_DATE, ENV_END_DATE
         )
@@ -62,9 +62,9 @@ def describe_when_overlap_removal_is_needed():
         assert db_ending_email(test_db_fixture) == "xavierlopez@hotmail.com"
 
         # 3rd pull: 98 rows, overlaps 49
-        mock_latest_usage_df.return_value = read_csv(
-            "tests/api/usage/usage-3rd-overlaps-1st-and-2nd.csv"
-        )
+        mock_usage_by_day.return_value = [
+            read_csv("tests/api/usage/usage-3rd-overlaps-1st-and-2nd.csv")
+        ]
         third_usage_df = request_all_usage_as_df(
             None, test_db_fixture, ENV_START_DATE, ENV_END_DATE
         )
@@ -91,13 +91,15 @@ def describe_when_pulls_of_same_usage_data_differ_in_number_of_posts():
     initial_posts = "3"
     update_posts = "5"
 
-    @patch("edfi_google_classroom_extractor.api.usage.request_latest_usage_as_df")
+    @patch("edfi_google_classroom_extractor.api.usage.request_usage_by_day")
     def it_should_replace_old_post_count_with_new(
-        mock_latest_usage_df, test_db_fixture
+        mock_usage_by_day, test_db_fixture
     ):
-        mock_latest_usage_df.return_value = DataFrame.from_dict(
-            [merged_dict(consistent_rows, {"numberOfPosts": initial_posts})]
-        )
+        mock_usage_by_day.return_value = [
+            DataFrame.from_dict(
+                [merged_dict(consistent_rows, {"numberOfPosts": initial_posts})]
+            )
+        ]
 
         # initial pull
         first_usage_df = request_all_usage_as_df(
@@ -108,9 +110,11 @@ def describe_when_pulls_of_same_usage_data_differ_in_number_of_posts():
         assert db_posts_by_name_date(test_db_fixture, name_date) == initial_posts
 
         # same student, with email updated
-        mock_latest_usage_df.return_value = DataFrame.from_dict(
-            [merged_dict(consistent_rows, {"numberOfPosts": update_posts})]
-        )
+        mock_usage_by_day.return_value = [
+            DataFrame.from_dict(
+                [merged_dict(consistent_rows, {"numberOfPosts": update_posts})]
+            )
+        ]
 
         # overwrite pull
         overwrite_usage_df = request_all_usage_as_df(
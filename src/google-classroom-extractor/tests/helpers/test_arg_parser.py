@@ -45,12 +45,18 @@ def describe_when_parsing_arguments():
         def it_should_default_to_current_directory(result: MainArguments):
             assert result.output_directory == "data/"
 
+        def it_should_default_to_csv_output(result: MainArguments):
+            assert result.output_format == "csv"
+
         def it_should_load_the_start_date(result: MainArguments):
             assert result.usage_start_date == ""
 
         def it_should_load_the_end_date(result: MainArguments):
             assert result.usage_end_date == ""
 
+        def it_should_default_to_four_concurrent_requests(result: MainArguments):
+            assert result.max_concurrency == 4
+
     def describe_given_optional_parameters():
         @pytest.fixture
         def result() -> MainArguments:
@@ -95,3 +101,39 @@ def describe_when_parsing_arguments():
             assert result.extract_activities
             assert result.extract_assignments
             assert result.extract_attendance
+
+    def describe_given_parquet_output_format():
+        def it_should_load_the_output_format():
+            parameters = ["-a", "test_account", "--output-format", "parquet"]
+
+            result = parse_main_arguments(parameters)
+
+            assert result.output_format == "parquet"
+
+    def describe_given_parquet_output_format_without_pyarrow():
+        def it_should_show_an_error_message(capsys, monkeypatch):
+            monkeypatch.setattr(
+                "edfi_google_classroom_extractor.helpers.arg_parser.parquet_supported", lambda: False
+            )
+            parameters = ["-a", "test_account", "--output-format", "parquet"]
+
+            with pytest.raises(SystemExit):
+                parse_main_arguments(parameters)
+
+            assert_error_message(capsys)
+
+    def describe_given_max_concurrency():
+        def it_should_load_the_max_concurrency():
+            parameters = ["-a", "test_account", "--max-concurrency", "8"]
+
+            result = parse_main_arguments(parameters)
+
+            assert result.max_concurrency == 8
+
+        def it_should_reject_zero(capsys):
+            parameters = ["-a", "test_account", "--max-concurrency", "0"]
+
+            with pytest.raises(SystemExit):
+                parse_main_arguments(parameters)
+
+            assert_error_message(capsys)
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from google.oauth2.service_account import Credentials
+from googleapiclient.discovery import build_from_document, Resource
+
+from edfi_google_classroom_extractor import config
+from edfi_google_classroom_extractor.config import build_resource
+
+DISCOVERY_DOCUMENT = Path("tests/api/fake-classroom-discovery-endpoint.json")
+
+
+def describe_when_building_a_resource():
+    @pytest.fixture
+    def resource(monkeypatch) -> Resource:
+        def build(service_name, version, cache_discovery, **kwargs):
+            return build_from_document(DISCOVERY_DOCUMENT.read_text(), **kwargs)
+
+        monkeypatch.setattr(config, "build", build)
+        credentials: Credentials = Credentials.from_service_account_file(
+            "tests/api/fake-service-account.json", scopes=[]
+        )
+        return build_resource("classroom", "v1", credentials)
+
+    def _transport(resource: Resource):
+        return resource.courses().list().http
+
+    def it_should_reuse_the_transport_within_a_thread(resource: Resource):
+        assert _transport(resource) is _transport(resource)
+
+    def it_should_use_a_transport_per_thread(resource: Resource):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread_transport = executor.submit(_transport, resource).result()
+
+        assert other_thread_transport is not _transport(resource)
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Compares staging table load throughput (rows/sec) for the engine-specific bulk
+copy path against the multi-row insert fallback, for the users, sections, and
+assignment submissions files in `docs/sample-out`.
+
+Accepts the same database arguments / environment variables as the loader,
+plus `--rows`. Example:
+
+    poetry run python benchmarks/bulk_copy_benchmark.py --engine postgresql \\
+        --server localhost --dbname lms_benchmark --username postgres \\
+        --password <password> --csvpath ../../docs/sample-out --rows 100000
+
+WARNING: truncates the staging tables in the target database.
+"""
+
+import sys
+from argparse import ArgumentParser
+from os.path import abspath
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+from dotenv import load_dotenv
+import pandas as pd
+
+from edfi_lms_file_utils import file_reader
+from edfi_lms_ds_loader import migrator
+from edfi_lms_ds_loader.helpers.argparser import parse_main_arguments
+from edfi_lms_ds_loader.helpers.constants import Table
+from edfi_lms_ds_loader.sql_lms_operations import SqlLmsOperations
+
+
+def _expand(df: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """Repeats the sample rows with unique natural keys until reaching `rows`."""
+    repeats = -(-rows // df.shape[0])
+    expanded = pd.concat([df] * repeats, ignore_index=True).head(rows)
+    expanded["SourceSystemIdentifier"] = [f"bench-{i}" for i in range(rows)]
+    return expanded
+
+
+def _samples(csv_path: str) -> List[Tuple[str, pd.DataFrame]]:
+    sections = file_reader.get_all_sections(csv_path)
+    assignments = file_reader.get_all_assignments(csv_path, sections)
+    submissions = file_reader.get_all_submissions(csv_path, assignments)
+
+    return [
+        (Table.USER, file_reader.get_all_users(csv_path)),
+        (Table.SECTION, sections),
+        (Table.ASSIGNMENT_SUBMISSION, submissions),
+    ]
+
+
+def _time(operation: Callable[[], None]) -> float:
+    start = perf_counter()
+    operation()
+    return perf_counter() - start
+
+
+def main() -> None:
+    load_dotenv()
+
+    parser = ArgumentParser(add_help=False)
+    parser.add_argument("--rows", type=int, default=100000)
+    benchmark_args, loader_args = parser.parse_known_args(sys.argv[1:])
+
+    arguments = parse_main_arguments(loader_args)
+    adapter = arguments.get_adapter()
+    migrator.migrate(adapter, arguments.engine)
+
+    bulk = SqlLmsOperations(adapter, arguments.engine, use_bulk_copy=True)
+    fallback = SqlLmsOperations(adapter, arguments.engine, use_bulk_copy=False)
+
+    rows = benchmark_args.rows
+    print(f"{'table':<24}{'rows':>10}{'multi rows/s':>16}{'bulk rows/s':>16}{'speedup':>10}")
+    for table, sample in _samples(abspath(arguments.csv_path)):
+        if sample.empty:
+            print(f"{table:<24}no sample files found, skipping")
+            continue
+        df = _expand(sample, rows)
+
+        results = []
+        for operations in (fallback, bulk):
+            operations.truncate_staging_table(table)
+            results.append(_time(lambda: operations.insert_into_staging(df, table)))
+        operations.truncate_staging_table(table)
+
+        multi, copy = results
+        print(
+            f"{table:<24}{rows:>10}{rows / multi:>16,.0f}{rows / copy:>16,.0f}{multi / copy:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from typing import List, Tuple
+
 
 def truncate_stg_table(table: str) -> str:
     return f"TRUNCATE TABLE lms.stg_{table};"
@@ -475,3 +477,28 @@ VALUES
     {rows}
 )
 """
+
+
+def add_processed_files(files: List[Tuple[str, int]], resource_name: str) -> str:
+    values = ",".join(
+        [
+            f"""
+(
+    '{path}',
+    '{resource_name}',
+    {rows}
+)"""
+            for path, rows in files
+        ]
+    )
+
+    return f"""
+INSERT INTO
+    lms.ProcessedFiles
+(
+    FullPath,
+    ResourceName,
+    NumberOfRows
+)
+VALUES{values}
+"""
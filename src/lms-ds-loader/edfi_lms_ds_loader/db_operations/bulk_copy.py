@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+"""
+Engine-specific bulk insert methods, in the callable form accepted by the
+`method` argument of `pandas.DataFrame.to_sql`.
+"""
+
+import csv
+from io import StringIO
+from typing import Any, Callable, Iterable, List, Union
+
+from sqlalchemy.engine.base import Connection
+
+from edfi_lms_ds_loader.helpers.constants import DbEngine
+
+# Rows sent to the database per bulk copy call. Much larger than the
+# "multi" insert chunk size, which is bound by the maximum number of
+# parameters allowed in a single statement.
+BULK_COPY_CHUNK_SIZE = 10000
+
+# Chunk size and method used when bulk copy is disabled or not available
+FALLBACK_CHUNK_SIZE = 120
+FALLBACK_METHOD = "multi"
+
+PGSQL_NULL = "\\N"
+
+InsertMethod = Callable[[Any, Connection, List[str], Iterable[tuple]], None]
+
+
+def _qualified_table_name(pd_table: Any, open_quote: str, close_quote: str) -> str:
+    name = f"{open_quote}{pd_table.name}{close_quote}"
+    if pd_table.schema:
+        return f"{open_quote}{pd_table.schema}{close_quote}.{name}"
+    return name
+
+
+def pgsql_copy(
+    pd_table: Any, conn: Connection, keys: List[str], data_iter: Iterable[tuple]
+) -> None:
+    """
+    Streams rows into PostgreSQL with `COPY FROM STDIN`, using an in-memory
+    CSV buffer.
+
+    Parameters
+    ----------
+    pd_table: pandas.io.sql.SQLTable
+        The destination table, as provided by Pandas.
+    conn: sqlalchemy.engine.base.Connection
+        The connection supplied by Pandas, already in a transaction.
+    keys: List[str]
+        Column names.
+    data_iter: Iterable[tuple]
+        The rows to insert.
+    """
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        [PGSQL_NULL if value is None else value for value in row] for row in data_iter
+    )
+    buffer.seek(0)
+
+    columns = ", ".join([f'"{k}"' for k in keys])
+    table = _qualified_table_name(pd_table, '"', '"')
+    statement = (
+        f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{PGSQL_NULL}')"
+    )
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(sql=statement, file=buffer)
+
+
+def mssql_fast_executemany(
+    pd_table: Any, conn: Connection, keys: List[str], data_iter: Iterable[tuple]
+) -> None:
+    """
+    Inserts rows into SQL Server with pyodbc's `fast_executemany`, which sends
+    the entire chunk as a parameter array in a single round trip.
+
+    Parameters
+    ----------
+    pd_table: pandas.io.sql.SQLTable
+        The destination table, as provided by Pandas.
+    conn: sqlalchemy.engine.base.Connection
+        The connection supplied by Pandas, already in a transaction.
+    keys: List[str]
+        Column names.
+    data_iter: Iterable[tuple]
+        The rows to insert.
+    """
+    rows = list(data_iter)
+    if len(rows) == 0:
+        return
+
+    columns = ", ".join([f"[{k}]" for k in keys])
+    placeholders = ", ".join(["?"] * len(keys))
+    table = _qualified_table_name(pd_table, "[", "]")
+    statement = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.fast_executemany = True
+        cursor.executemany(statement, rows)
+    finally:
+        cursor.close()
+
+
+def get_insert_method(engine: str) -> Union[str, InsertMethod]:
+    """
+    Selects the bulk insert method for a database engine, falling back to the
+    standard Pandas multi-row insert for unrecognized engines.
+
+    Parameters
+    ----------
+    engine: str
+        Database engine, either "mssql" or "postgresql".
+
+    Returns
+    -------
+    Union[str, InsertMethod]
+        A value for the `method` argument of `pandas.DataFrame.to_sql`.
+    """
+    if engine == DbEngine.POSTGRESQL:
+        return pgsql_copy
+
+    if engine == DbEngine.MSSQL:
+        return mssql_fast_executemany
+
+    return FALLBACK_METHOD
+
+
+def get_chunk_size(method: Union[str, InsertMethod]) -> int:
+    """
+    Returns the appropriate `chunksize` argument for `pandas.DataFrame.to_sql`
+    when using the given insert method.
+    """
+    return FALLBACK_CHUNK_SIZE if method == FALLBACK_METHOD else BULK_COPY_CHUNK_SIZE
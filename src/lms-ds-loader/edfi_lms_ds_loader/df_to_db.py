@@ -3,8 +3,9 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+import itertools
 import logging
-from typing import Callable, List
+from typing import Callable, Iterable, Iterator, List, Union
 
 import pandas as pd
 
@@ -14,15 +15,25 @@ from edfi_lms_ds_loader.helpers import assignment_splitter
 
 logger = logging.getLogger(__name__)
 
+# A whole file, or a file read in chunks
+DataFrameOrChunks = Union[pd.DataFrame, Iterable[pd.DataFrame]]
+
+
+def _non_empty_chunks(data: DataFrameOrChunks) -> Iterator[pd.DataFrame]:
+    # Check for a DataFrame first: iterating a DataFrame yields column names
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    return (chunk for chunk in chunks if not chunk.empty)
+
 
 def _prepare_staging_table(
-    db_adapter: SqlLmsOperations, df: pd.DataFrame, table: str
+    db_adapter: SqlLmsOperations, chunks: Iterable[pd.DataFrame], table: str
 ) -> None:
     logger.info(f"Uploading {table} file ...")
 
     db_adapter.disable_staging_natural_key_index(table)
     db_adapter.truncate_staging_table(table)
-    db_adapter.insert_into_staging(df, table)
+    for df in chunks:
+        db_adapter.insert_into_staging(df, table)
     db_adapter.enable_staging_natural_key_index(table)
 
 
@@ -35,7 +46,7 @@ def _upload_assignment_submission_types(
 ) -> None:
     TABLE = Table.ASSIGNMENT_SUBMISSION_TYPES
 
-    _prepare_staging_table(db_adapter, submission_types_df, TABLE)
+    _prepare_staging_table(db_adapter, [submission_types_df], TABLE)
 
     db_adapter.insert_new_submission_types()
 
@@ -48,20 +59,25 @@ def _upload_assignment_submission_types(
 
 def upload_file(
     db_adapter: SqlLmsOperations,
-    df: pd.DataFrame,
+    df: DataFrameOrChunks,
     table: str,
     db_adapter_insert_method: Callable[[SqlLmsOperations, str, List[str]], None],
     db_adapter_delete_method: Callable[[SqlLmsOperations, str, str], None],
 ) -> None:
     """
-    Uploads a DataFrame to the designated LMS table.
+    Uploads a DataFrame to the designated LMS table. All steps, from staging
+    through soft deletes, run in a single transaction on a single connection.
+
+    When given a sequence of DataFrames, such as the chunks of a large file,
+    inserts each one into the staging table in turn, then merges into
+    production and soft deletes once after the last chunk.
 
     Parameters
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    df: pd.DataFrame
-        A DataFrame to upload.
+    df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     table: str
         The destination table.
     db_adapter_insert_method: Callable[[SqlLmsOperations, str, List[str]], None]
@@ -69,21 +85,24 @@ def upload_file(
     db_adapter_delete_method: Callable[[SqlLmsOperations, str, str], None],
         The SqlLmsOperations delete method to use for the upload
     """
-    if df.empty:
+    chunks = _non_empty_chunks(df)
+    first = next(chunks, None)
+    if first is None:
         return
 
-    _prepare_staging_table(db_adapter, df, table)
+    with db_adapter.unit_of_work():
+        _prepare_staging_table(db_adapter, itertools.chain([first], chunks), table)
 
-    columns = list(df.columns)
+        columns = list(first.columns)
 
-    db_adapter_insert_method(db_adapter, table, columns)
-    db_adapter.copy_updates_to_production(table, columns)
-    db_adapter_delete_method(db_adapter, table, _get_source_system(df))
+        db_adapter_insert_method(db_adapter, table, columns)
+        db_adapter.copy_updates_to_production(table, columns)
+        db_adapter_delete_method(db_adapter, table, _get_source_system(first))
 
     logger.info(f"Done with {table} file.")
 
 
-def upload_users(db_adapter: SqlLmsOperations, users_df: pd.DataFrame) -> None:
+def upload_users(db_adapter: SqlLmsOperations, users_df: DataFrameOrChunks) -> None:
     """
     Uploads a User DataFrame to the User table.
 
@@ -91,8 +110,8 @@ def upload_users(db_adapter: SqlLmsOperations, users_df: pd.DataFrame) -> None:
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    users_df: pd.DataFrame
-        A DataFrame to upload.
+    users_df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     """
     upload_file(
         db_adapter,
@@ -103,7 +122,9 @@ def upload_users(db_adapter: SqlLmsOperations, users_df: pd.DataFrame) -> None:
     )
 
 
-def upload_sections(db_adapter: SqlLmsOperations, sections_df: pd.DataFrame) -> None:
+def upload_sections(
+    db_adapter: SqlLmsOperations, sections_df: DataFrameOrChunks
+) -> None:
     """
     Uploads a Section DataFrame to the Section table.
 
@@ -111,8 +132,8 @@ def upload_sections(db_adapter: SqlLmsOperations, sections_df: pd.DataFrame) ->
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    sections_df: pd.DataFrame
-        A DataFrame to upload.
+    sections_df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     """
     upload_file(
         db_adapter,
@@ -124,7 +145,7 @@ def upload_sections(db_adapter: SqlLmsOperations, sections_df: pd.DataFrame) ->
 
 
 def upload_assignments(
-    db_adapter: SqlLmsOperations, assignments_df: pd.DataFrame
+    db_adapter: SqlLmsOperations, assignments_df: DataFrameOrChunks
 ) -> None:
     """
     Uploads an Assignments DataFrame to the Assignment and AssignmentSubmissionType
@@ -136,30 +157,47 @@ def upload_assignments(
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    df: pd.DataFrame
-        A DataFrame to upload.
+    df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     """
-    if assignments_df.empty:
+    chunks = _non_empty_chunks(assignments_df)
+    first = next(chunks, None)
+    if first is None:
         return
 
-    assignments_df, submissions_type_df = assignment_splitter.split(assignments_df)
+    # Submission types are collected while the assignments are staged
+    submission_types: List[pd.DataFrame] = []
 
-    # Truncate AssignmentDescription to max 1024 characters, matching the database
-    assignments_df["AssignmentDescription"] = assignments_df["AssignmentDescription"].astype("str").str[:1024]  # type: ignore
-    upload_file(
-        db_adapter,
-        assignments_df,
-        Table.ASSIGNMENT,
-        SqlLmsOperations.insert_new_records_to_production_for_section_relation,
-        SqlLmsOperations.soft_delete_from_production_for_section_relation,
-    )
+    def _split(chunk: pd.DataFrame) -> pd.DataFrame:
+        assignments, submissions_type_df = assignment_splitter.split(chunk)
+
+        # Truncate AssignmentDescription to max 1024 characters, matching the database
+        assignments["AssignmentDescription"] = assignments["AssignmentDescription"].astype("str").str[:1024]  # type: ignore
+
+        submission_types.append(submissions_type_df)
+        return assignments
+
+    with db_adapter.unit_of_work():
+        upload_file(
+            db_adapter,
+            map(_split, itertools.chain([first], chunks)),
+            Table.ASSIGNMENT,
+            SqlLmsOperations.insert_new_records_to_production_for_section_relation,
+            SqlLmsOperations.soft_delete_from_production_for_section_relation,
+        )
 
-    if not submissions_type_df.empty:
-        _upload_assignment_submission_types(db_adapter, submissions_type_df)
+        submission_types = [df for df in submission_types if not df.empty]
+        if len(submission_types) > 0:
+            _upload_assignment_submission_types(
+                db_adapter,
+                submission_types[0]
+                if len(submission_types) == 1
+                else pd.concat(submission_types, ignore_index=True),
+            )
 
 
 def upload_section_associations(
-    db_adapter: SqlLmsOperations, section_associations_df: pd.DataFrame
+    db_adapter: SqlLmsOperations, section_associations_df: DataFrameOrChunks
 ) -> None:
     """
     Uploads a Section Association DataFrame to the User-Section Association
@@ -169,8 +207,8 @@ def upload_section_associations(
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    section_associations_df: pd.DataFrame
-        A DataFrame to upload.
+    section_associations_df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     """
     upload_file(
         db_adapter,
@@ -182,7 +220,7 @@ def upload_section_associations(
 
 
 def upload_assignment_submissions(
-    db_adapter: SqlLmsOperations, submissions_df: pd.DataFrame
+    db_adapter: SqlLmsOperations, submissions_df: DataFrameOrChunks
 ) -> None:
     """
     Uploads an Assignment Submission DataFrame to the Assignment Submission
@@ -192,8 +230,8 @@ def upload_assignment_submissions(
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    submissions_df: pd.DataFrame
-        A DataFrame to upload.
+    submissions_df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     """
     upload_file(
         db_adapter,
@@ -205,7 +243,7 @@ def upload_assignment_submissions(
 
 
 def upload_section_activities(
-    db_adapter: SqlLmsOperations, section_activities_df: pd.DataFrame
+    db_adapter: SqlLmsOperations, section_activities_df: DataFrameOrChunks
 ) -> None:
     """
     Uploads a Section Activity DataFrame to the Section Activity
@@ -215,8 +253,8 @@ def upload_section_activities(
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    section_activities_df: pd.DataFrame
-        A DataFrame to upload.
+    section_activities_df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     """
     upload_file(
         db_adapter,
@@ -228,7 +266,7 @@ def upload_section_activities(
 
 
 def upload_system_activities(
-    db_adapter: SqlLmsOperations, system_activities_df: pd.DataFrame
+    db_adapter: SqlLmsOperations, system_activities_df: DataFrameOrChunks
 ) -> None:
     """
     Uploads a System Activity DataFrame to the System Activity
@@ -238,8 +276,8 @@ def upload_system_activities(
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    system_activities_df: pd.DataFrame
-        A DataFrame to upload.
+    system_activities_df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     """
     upload_file(
         db_adapter,
@@ -251,7 +289,7 @@ def upload_system_activities(
 
 
 def upload_attendance_events(
-    db_adapter: SqlLmsOperations, attendance_df: pd.DataFrame
+    db_adapter: SqlLmsOperations, attendance_df: DataFrameOrChunks
 ) -> None:
     """
     Uploads a System Activity DataFrame to the System Activity
@@ -261,8 +299,8 @@ def upload_attendance_events(
     ----------
     db_adapter: SqlLmsOperations
         Database engine-specific adapter/wrapper for database operations.
-    attendance_df: pd.DataFrame
-        A DataFrame to upload.
+    attendance_df: pd.DataFrame or Iterable[pd.DataFrame]
+        A DataFrame, or a sequence of DataFrames with the same columns, to upload.
     """
     upload_file(
         db_adapter,
@@ -5,7 +5,7 @@
 
 from dataclasses import dataclass
 import os
-from typing import List
+from typing import List, Optional
 
 from configargparse import ArgParser  # type: ignore
 
@@ -30,6 +30,14 @@ class MainArguments:
         Base path for finding CSV files.
     engine : str
         Database engine, either "mssql" or "postgresql"
+    use_bulk_copy : bool
+        Load staging tables with the engine's native bulk copy mechanism
+    max_workers : int
+        Maximum number of resources to load concurrently
+    batch_size : int
+        Maximum number of per-section files to stage and merge together
+    chunk_size : Optional[int]
+        If set, read files in chunks of this many rows instead of all at once
     """
 
     csv_path: str
@@ -40,6 +48,10 @@ class MainArguments:
     port: int
     encrypt: bool = False
     trust_certificate: bool = False
+    use_bulk_copy: bool = True
+    max_workers: int = 1
+    batch_size: int = 1
+    chunk_size: Optional[int] = None
 
     def __post_init__(self) -> None:
         self.db_adapter: Adapter
@@ -92,7 +104,7 @@ class MainArguments:
         return self.db_adapter
 
     def get_db_operations_adapter(self) -> SqlLmsOperations:
-        return SqlLmsOperations(self.get_adapter(), self.engine)
+        return SqlLmsOperations(self.get_adapter(), self.engine, self.use_bulk_copy)
 
 
 def parse_main_arguments(args_in: List[str]) -> MainArguments:
@@ -207,8 +219,47 @@ def parse_main_arguments(args_in: List[str]) -> MainArguments:
         env_var="TRUST_SERVER_CERTIFICATE",
     )
 
+    parser.add(  # type: ignore
+        "--disable-bulk-copy",
+        help="Load staging tables with multi-row inserts instead of the database engine's bulk copy.",
+        action="store_true",
+        env_var="DISABLE_BULK_COPY",
+    )
+
+    parser.add(  # type: ignore
+        "--max-workers",
+        help="Maximum number of resources to load concurrently, each on its own database connection. Resources still wait for the resources they depend on.",
+        type=int,
+        default=1,
+        env_var="MAX_WORKERS",
+    )
+
+    parser.add(  # type: ignore
+        "--batch-size",
+        help="Maximum number of per-section files (section associations, assignments, submissions, attendance events, section activities) to stage and merge into production together.",
+        type=int,
+        default=1,
+        env_var="BATCH_SIZE",
+    )
+
+    parser.add(  # type: ignore
+        "--chunk-size",
+        help="Read files and insert them into the staging tables in chunks of this many rows, limiting memory use for very large files. By default, reads each file all at once.",
+        type=int,
+        env_var="CHUNK_SIZE",
+    )
+
     args_parsed = parser.parse_args(args_in)
 
+    if args_parsed.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
+
+    if args_parsed.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    if args_parsed.chunk_size is not None and args_parsed.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
     # Need to add this back in because reading it manually earlier
     # seems to cause it to be misread by the parser.
     args_parsed.useintegratedsecurity = (
@@ -224,6 +275,10 @@ def parse_main_arguments(args_in: List[str]) -> MainArguments:
         args_parsed.port,
         args_parsed.encrypt,
         args_parsed.trust_certificate,
+        not args_parsed.disable_bulk_copy,
+        args_parsed.max_workers,
+        args_parsed.batch_size,
+        args_parsed.chunk_size,
     )
 
     if args_parsed.useintegratedsecurity and args_parsed.engine == DbEngine.MSSQL:
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from os.path import dirname
+from typing import Callable, Dict, Iterable, Iterator, List, Set
+
+from pandas import DataFrame
+
+
+def batch_by_directory(file_paths: List[str], batch_size: int) -> List[List[str]]:
+    """
+    Groups file paths into batches of up to `batch_size` files, with at most one
+    file from each directory in any batch. Files from the same directory are
+    assigned to batches in sorted (date) order, so that loading the batches in
+    order applies each directory's files in the same sequence as loading the
+    files one at a time. With a `batch_size` of 1, the batches are the sorted
+    file paths.
+
+    Parameters
+    ----------
+    file_paths: List[str]
+        Full paths of the files to batch.
+    batch_size: int
+        Maximum number of files per batch.
+
+    Returns
+    -------
+    List[List[str]]
+        The batches, in the order they should be loaded.
+    """
+    assert batch_size > 0, "Argument `batch_size` must be greater than zero"
+
+    remaining: List[str] = sorted(file_paths)
+    batches: List[List[str]] = []
+
+    while remaining:
+        batch: List[str] = []
+        directories: Set[str] = set()
+        deferred: List[str] = []
+
+        for path in remaining:
+            directory = dirname(path)
+            if len(batch) < batch_size and directory not in directories:
+                batch.append(path)
+                directories.add(directory)
+            else:
+                deferred.append(path)
+
+        batches.append(batch)
+        remaining = deferred
+
+    return batches
+
+
+def read_batch(
+    batch: List[str],
+    read_file: Callable[[str], Iterable[DataFrame]],
+    row_counts: Dict[str, int],
+) -> Iterator[DataFrame]:
+    """
+    Lazily reads the files in a batch, in order, as one sequence of DataFrames.
+    As each file is read, records its total number of rows in `row_counts`.
+
+    Parameters
+    ----------
+    batch: List[str]
+        Full paths of the files to read.
+    read_file: Callable[[str], Iterable[DataFrame]]
+        Reads a file as a sequence of DataFrames, for example one per chunk.
+    row_counts: Dict[str, int]
+        Receives the number of rows read from each file, keyed by path.
+
+    Returns
+    -------
+    Iterator[DataFrame]
+        The DataFrames read from all of the files.
+    """
+    for path in batch:
+        row_counts[path] = 0
+        for df in read_file(path):
+            row_counts[path] += df.shape[0]
+            yield df
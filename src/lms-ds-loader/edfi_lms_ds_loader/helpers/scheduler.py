@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import logging
+from typing import Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def run_in_dependency_order(
+    tasks: Dict[str, Callable[[], None]],
+    dependencies: Dict[str, List[str]],
+    max_workers: int = 1,
+) -> None:
+    """
+    Runs tasks on a thread pool, starting each task only after all of the tasks
+    it depends on have completed. When more tasks are ready than there are free
+    workers, tasks start in the order they appear in `tasks`. Therefore a single
+    worker runs the tasks in exactly that order.
+
+    If a task fails, then no further tasks are started, and the first error is
+    re-raised once the already-running tasks have finished.
+
+    Parameters
+    ----------
+    tasks: Dict[str, Callable[[], None]]
+        Tasks to run, keyed by name.
+    dependencies: Dict[str, List[str]]
+        Names of the tasks that must complete before the keyed task can start.
+        Tasks without an entry have no dependencies.
+    max_workers: int
+        Maximum number of tasks to run concurrently. Defaults to 1.
+    """
+    assert max_workers > 0, "Argument `max_workers` must be greater than zero"
+
+    for name, required in dependencies.items():
+        for dependency in required:
+            assert (
+                dependency in tasks
+            ), f"Task `{name}` depends on unknown task `{dependency}`"
+
+    pending: List[str] = list(tasks.keys())
+    completed: Set[str] = set()
+    running: Dict[Future, str] = dict()
+    error: Optional[BaseException] = None
+
+    def _is_ready(name: str) -> bool:
+        return all(d in completed for d in dependencies.get(name, []))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            if error is None:
+                for name in [n for n in pending if _is_ready(n)]:
+                    if len(running) >= max_workers:
+                        break
+
+                    logger.debug(f"Starting task `{name}`")
+                    pending.remove(name)
+                    running[executor.submit(tasks[name])] = name
+
+            if not running:
+                if error is not None:
+                    break
+
+                raise ValueError(
+                    f"Tasks {pending} cannot start because of circular dependencies"
+                )
+
+            done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                exception = future.exception()
+
+                if exception is not None:
+                    logger.error(f"Task `{name}` failed")
+                    error = error or exception
+                else:
+                    logger.debug(f"Finished task `{name}`")
+                    completed.add(name)
+
+    if error is not None:
+        raise error
@@ -10,12 +10,14 @@
 
 import logging
 from os.path import abspath
-from typing import Callable, List
-from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+from functools import lru_cache, partial
 
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
+from edfi_lms_ds_loader.helpers import file_batches
 from edfi_lms_ds_loader.helpers.argparser import MainArguments
+from edfi_lms_ds_loader.helpers.scheduler import run_in_dependency_order
 from edfi_lms_ds_loader import migrator
 from edfi_lms_file_utils import file_reader, file_repository
 from edfi_lms_file_utils.constants import Resources
@@ -24,6 +26,20 @@ from edfi_lms_ds_loader.sql_lms_operations import SqlLmsOperations
 
 logger = logging.getLogger(__name__)
 
+# Resources that must be loaded before each resource can be loaded, following
+# the foreign keys between the tables. Attendance events are matched to user
+# section associations, so those must be loaded first.
+RESOURCE_DEPENDENCIES: Dict[str, List[str]] = {
+    Resources.USERS: [],
+    Resources.SECTIONS: [],
+    Resources.SECTION_ASSOCIATIONS: [Resources.USERS, Resources.SECTIONS],
+    Resources.ASSIGNMENTS: [Resources.SECTIONS],
+    Resources.SUBMISSIONS: [Resources.USERS, Resources.ASSIGNMENTS],
+    Resources.ATTENDANCE_EVENTS: [Resources.SECTION_ASSOCIATIONS],
+    Resources.SECTION_ACTIVITIES: [Resources.USERS, Resources.SECTIONS],
+    Resources.SYSTEM_ACTIVITIES: [Resources.USERS],
+}
+
 
 # This module deliberately has no exception handling. Due to the foreign key
 # relationships between tables, there is little point to continuing after a
@@ -34,9 +50,9 @@ logger = logging.getLogger(__name__)
 # exceptions throughout then to only catch exceptions on "lower value" targets
 # like grades or attendance.
 
-# TODO: consider refactoring for transaction management, so that operations can
-# be rolled back. SQL Alchemy transactions can be used with DataFrame, so this
-# should be feasible. LMS-244
+# Each file is uploaded as a single unit of work (see `df_to_db.upload_file`),
+# so a failure rolls back that file's staging and production changes, but not
+# those of files that were already loaded.
 
 
 @lru_cache()
@@ -67,21 +83,49 @@ def _upload_files_from_paths(
     file_paths: List[str],
     resource_name: str,
     read_file_callback: Callable[[str], DataFrame],
-    upload_function: Callable[[SqlLmsOperations, DataFrame], None],
+    upload_function: Callable[[SqlLmsOperations, df_to_db.DataFrameOrChunks], None],
+    batch_size: int = 1,
+    chunk_size: Optional[int] = None,
 ) -> None:
     unprocessed_files: List[str] = _get_unprocessed_file_paths(
         db_adapter, resource_name, file_paths
     )
 
-    for path in unprocessed_files:
-        data: DataFrame = read_file_callback(path)
-        rows = data.shape[0]
-        if rows != 0:
-            upload_function(db_adapter, data)
-        db_adapter.add_processed_file(path, resource_name, rows)
+    # Batching is only safe for resources whose soft deletes are scoped to the
+    # section (or assignment) in the staging table, as each batch has at most one
+    # file per section directory.
+    batches = file_batches.batch_by_directory(unprocessed_files, batch_size)
+
+    if chunk_size is not None:
+        # Stream each batch into staging without holding whole files in memory
+        read_file = partial(
+            file_reader.read_file_in_chunks, resource_name, chunksize=chunk_size
+        )
+        for batch in batches:
+            row_counts: Dict[str, int] = dict()
+            chunks = file_batches.read_batch(batch, read_file, row_counts)
+
+            with db_adapter.unit_of_work():
+                upload_function(db_adapter, chunks)
+                db_adapter.add_processed_files(list(row_counts.items()), resource_name)
+        return
+
+    for batch in batches:
+        frames: List[DataFrame] = [read_file_callback(path) for path in batch]
+        processed = [(path, df.shape[0]) for path, df in zip(batch, frames)]
+        data: DataFrame = (
+            frames[0] if len(frames) == 1 else concat(frames, ignore_index=True)
+        )
+
+        with db_adapter.unit_of_work():
+            if data.shape[0] != 0:
+                upload_function(db_adapter, data)
+            db_adapter.add_processed_files(processed, resource_name)
 
 
-def _load_users(csv_path: str, db_adapter: SqlLmsOperations) -> None:
+def _load_users(
+    csv_path: str, db_adapter: SqlLmsOperations, chunk_size: Optional[int] = None
+) -> None:
     file_paths = file_repository.get_users_file_paths(abspath(csv_path))
 
     _upload_files_from_paths(
@@ -90,10 +134,13 @@ def _load_users(csv_path: str, db_adapter: SqlLmsOperations) -> None:
         Resources.USERS,
         file_reader.read_users_file,
         df_to_db.upload_users,
+        chunk_size=chunk_size,
     )
 
 
-def _load_sections(csv_path: str, db_adapter: SqlLmsOperations) -> None:
+def _load_sections(
+    csv_path: str, db_adapter: SqlLmsOperations, chunk_size: Optional[int] = None
+) -> None:
     file_paths = file_repository.get_sections_file_paths(abspath(csv_path))
 
     _upload_files_from_paths(
@@ -102,10 +149,16 @@ def _load_sections(csv_path: str, db_adapter: SqlLmsOperations) -> None:
         Resources.SECTIONS,
         file_reader.read_sections_file,
         df_to_db.upload_sections,
+        chunk_size=chunk_size,
     )
 
 
-def _load_assignments(csv_path: str, db_adapter: SqlLmsOperations) -> None:
+def _load_assignments(
+    csv_path: str,
+    db_adapter: SqlLmsOperations,
+    batch_size: int = 1,
+    chunk_size: Optional[int] = None,
+) -> None:
     sections_df = _get_sections_df(csv_path)
     if sections_df.empty:
         logger.info("No sections loaded. Skipping assignments.")
@@ -127,10 +180,17 @@ def _load_assignments(csv_path: str, db_adapter: SqlLmsOperations) -> None:
         Resources.ASSIGNMENTS,
         file_reader.read_assignments_file,
         df_to_db.upload_assignments,
+        batch_size,
+        chunk_size,
     )
 
 
-def _load_attendance_events(csv_path: str, db_adapter: SqlLmsOperations) -> None:
+def _load_attendance_events(
+    csv_path: str,
+    db_adapter: SqlLmsOperations,
+    batch_size: int = 1,
+    chunk_size: Optional[int] = None,
+) -> None:
     sections_df: DataFrame = _get_sections_df(csv_path)
     if sections_df.empty:
         logger.info("No sections loaded. Skipping section associations.")
@@ -150,10 +210,17 @@ def _load_attendance_events(csv_path: str, db_adapter: SqlLmsOperations) -> None
         Resources.ATTENDANCE_EVENTS,
         file_reader.read_attendance_events_file,
         df_to_db.upload_attendance_events,
+        batch_size,
+        chunk_size,
     )
 
 
-def _load_section_associations(csv_path: str, db_adapter: SqlLmsOperations) -> None:
+def _load_section_associations(
+    csv_path: str,
+    db_adapter: SqlLmsOperations,
+    batch_size: int = 1,
+    chunk_size: Optional[int] = None,
+) -> None:
     sections_df: DataFrame = _get_sections_df(csv_path)
     if sections_df.empty:
         logger.info("No sections loaded. Skipping section associations.")
@@ -173,10 +240,17 @@ def _load_section_associations(csv_path: str, db_adapter: SqlLmsOperations) -> N
         Resources.SECTION_ASSOCIATIONS,
         file_reader.read_section_associations_file,
         df_to_db.upload_section_associations,
+        batch_size,
+        chunk_size,
     )
 
 
-def _load_assignment_submissions(csv_path: str, db_adapter: SqlLmsOperations) -> None:
+def _load_assignment_submissions(
+    csv_path: str,
+    db_adapter: SqlLmsOperations,
+    batch_size: int = 1,
+    chunk_size: Optional[int] = None,
+) -> None:
     assignments_df: DataFrame = _get_assignments_df(csv_path)
     if assignments_df.empty:
         logger.info("No assignments loaded. Skipping assignment submissions.")
@@ -200,10 +274,17 @@ def _load_assignment_submissions(csv_path: str, db_adapter: SqlLmsOperations) ->
         Resources.SUBMISSIONS,
         file_reader.read_submissions_file,
         df_to_db.upload_assignment_submissions,
+        batch_size,
+        chunk_size,
     )
 
 
-def _load_section_activities(csv_path: str, db_adapter: SqlLmsOperations) -> None:
+def _load_section_activities(
+    csv_path: str,
+    db_adapter: SqlLmsOperations,
+    batch_size: int = 1,
+    chunk_size: Optional[int] = None,
+) -> None:
     sections_df: DataFrame = _get_sections_df(csv_path)
     if sections_df.empty:
         logger.info("No sections loaded. Skipping section associations.")
@@ -223,10 +304,14 @@ def _load_section_activities(csv_path: str, db_adapter: SqlLmsOperations) -> Non
         Resources.SECTION_ACTIVITIES,
         file_reader.read_section_activities_file,
         df_to_db.upload_section_activities,
+        batch_size,
+        chunk_size,
     )
 
 
-def _load_system_activities(csv_path: str, db_adapter: SqlLmsOperations) -> None:
+def _load_system_activities(
+    csv_path: str, db_adapter: SqlLmsOperations, chunk_size: Optional[int] = None
+) -> None:
     file_paths = file_repository.get_system_activities_file_paths(abspath(csv_path))
 
     _upload_files_from_paths(
@@ -235,6 +320,7 @@ def _load_system_activities(csv_path: str, db_adapter: SqlLmsOperations) -> None
         Resources.SYSTEM_ACTIVITIES,
         file_reader.read_system_activities_file,
         df_to_db.upload_system_activities,
+        chunk_size=chunk_size,
     )
 
 
@@ -246,17 +332,32 @@ def run_loader(arguments: MainArguments) -> None:
 
     csv_path = arguments.csv_path
 
-    sql_operations = arguments.get_db_operations_adapter()
-
-    _load_users(csv_path, sql_operations)
-    _load_sections(csv_path, sql_operations)
+    def _task(load: Callable[..., None], **kwargs) -> Callable[[], None]:
+        # Each task gets its own operations adapter, so that concurrent tasks
+        # work on separate pooled connections.
+        return lambda: load(
+            csv_path,
+            arguments.get_db_operations_adapter(),
+            chunk_size=arguments.chunk_size,
+            **kwargs,
+        )
 
-    # Important: run this immediately after loading sections, before loading other section-related resources
-    _load_section_associations(csv_path, sql_operations)
-    _load_assignments(csv_path, sql_operations)
-    _load_assignment_submissions(csv_path, sql_operations)
-    _load_attendance_events(csv_path, sql_operations)
-    _load_section_activities(csv_path, sql_operations)
-    _load_system_activities(csv_path, sql_operations)
+    # Only per-section (and per-assignment) files can be batched
+    def _batched(load: Callable[..., None]) -> Callable[[], None]:
+        return _task(load, batch_size=arguments.batch_size)
+
+    # With a single worker, resources load in exactly this order
+    tasks = {
+        Resources.USERS: _task(_load_users),
+        Resources.SECTIONS: _task(_load_sections),
+        Resources.SECTION_ASSOCIATIONS: _batched(_load_section_associations),
+        Resources.ASSIGNMENTS: _batched(_load_assignments),
+        Resources.SUBMISSIONS: _batched(_load_assignment_submissions),
+        Resources.ATTENDANCE_EVENTS: _batched(_load_attendance_events),
+        Resources.SECTION_ACTIVITIES: _batched(_load_section_activities),
+        Resources.SYSTEM_ACTIVITIES: _task(_load_system_activities),
+    }
+
+    run_in_dependency_order(tasks, RESOURCE_DEPENDENCIES, arguments.max_workers)
 
     logger.info("Done loading files into the LMS Data Store.")
@@ -3,10 +3,12 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from contextlib import contextmanager
 import logging
-from typing import List, Set
+from typing import Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
+from sqlalchemy.engine.base import Connection as sa_Connection
 from sqlalchemy.engine.result import ResultProxy as sa_Result
 from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.orm import Session as sa_Session
@@ -15,10 +17,14 @@ from edfi_lms_ds_loader.helpers.constants import DbEngine, Table
 from edfi_sql_adapter.sql_adapter import Adapter
 from edfi_lms_ds_loader.db_operations import MSSQL_sql_builder as MS_builder
 from edfi_lms_ds_loader.db_operations import PGSQL_sql_builder as PG_builder
+from edfi_lms_ds_loader.db_operations import bulk_copy
 
 logger = logging.getLogger(__name__)
 SUPPORTED_ENGINES = [DbEngine.POSTGRESQL, DbEngine.MSSQL]
 
+# SQL Server limits a single INSERT ... VALUES statement to 1000 rows
+MAX_ROWS_PER_INSERT = 1000
+
 
 class SqlLmsOperations:
     """
@@ -31,14 +37,25 @@ class SqlLmsOperations:
         The adapter to be used.
     engine: sqlalchemy.engine.Engine
         SQL Alchemy engine.
+    use_bulk_copy: bool
+        Load staging tables with the engine's native bulk copy mechanism. When
+        false, falls back to multi-row inserts. Defaults to true.
     """
 
     db_adapter: Adapter
     engine: str
-
-    def __init__(self, sql_adapter: Adapter, engine: str = DbEngine.MSSQL) -> None:
+    use_bulk_copy: bool
+    _connection: Optional[sa_Connection] = None
+
+    def __init__(
+        self,
+        sql_adapter: Adapter,
+        engine: str = DbEngine.MSSQL,
+        use_bulk_copy: bool = True,
+    ) -> None:
         self.db_adapter = sql_adapter
         self.engine = engine
+        self.use_bulk_copy = use_bulk_copy
         if self.engine not in SUPPORTED_ENGINES:
             logger.error(f"The engine {self.engine} is not supported.")
 
@@ -51,13 +68,41 @@ class SqlLmsOperations:
             result: sa_Result = session.execute(statement)
             return result
 
-        result = self.db_adapter.execute_transaction(__callback)
+        if self._connection is not None:
+            result = self._connection.execute(statement)
+        else:
+            result = self.db_adapter.execute_transaction(__callback)
 
         if result:
             return int(result.rowcount)
 
         return 0
 
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """
+        Runs every operation issued inside the context on a single pooled
+        connection and in a single transaction, which is committed when the
+        context exits and rolled back if an error occurs. Nested calls join the
+        outer unit of work.
+        """
+        if self._connection is not None:
+            yield
+            return
+
+        with self.db_adapter.engine.connect() as connection:
+            try:
+                with connection.begin():
+                    self._connection = connection
+                    yield
+            except ProgrammingError as pe:
+                # Deliberately bubbling this error up to the stack - but need to make
+                # sure it is handled in the standard error log messages as well.
+                logger.exception(pe)
+                raise
+            finally:
+                self._connection = None
+
     def truncate_staging_table(self, table: str) -> None:
         """
         Executes a truncate command on the staging version of a table.
@@ -127,6 +172,12 @@ class SqlLmsOperations:
 
         assert table.strip() != "", "Argument `table` cannot be whitespace"
 
+        method = (
+            bulk_copy.get_insert_method(self.engine)
+            if self.use_bulk_copy
+            else bulk_copy.FALLBACK_METHOD
+        )
+
         # PostgreSQL requires lower case column names, but our
         # code uses upper case. Temporarily convert, then restore
         proper_names = df.columns
@@ -134,12 +185,12 @@ class SqlLmsOperations:
         df.columns = proper_names.str.lower()
         df.to_sql(
             f"stg_{table}".lower(),
-            self.db_adapter.engine,
+            self._connection or self.db_adapter.engine,
             schema="lms",
             if_exists="append",
             index=False,
-            method="multi",
-            chunksize=120,
+            method=method,
+            chunksize=bulk_copy.get_chunk_size(method),
         )
         df.columns = proper_names
         logger.debug(f"All records have been loaded into staging table 'stg_{table}'")
@@ -668,3 +719,33 @@ class SqlLmsOperations:
         except ProgrammingError as pe:
             logger.exception(pe)
             raise
+
+    def add_processed_files(self, files: List[Tuple[str, int]], resource_name: str):
+        """
+        Records that a batch of files has been processed and thus should not be
+        processed a second time, using multi-row inserts.
+
+        Parameters
+        ----------
+        files: List[Tuple[str, int]]
+            Filesystem path and number of rows for each file that was processed.
+        resource_name: str
+            Name of the resource covered by the files.
+        """
+        for start in range(0, len(files), MAX_ROWS_PER_INSERT):
+            chunk = files[start : start + MAX_ROWS_PER_INSERT]
+
+            statement = ""
+            if self.engine == DbEngine.MSSQL:
+                statement = MS_builder.add_processed_files(chunk, resource_name)
+
+            if self.engine == DbEngine.POSTGRESQL:
+                statement = PG_builder.add_processed_files(chunk, resource_name)
+
+            statement = statement.strip()
+
+            try:
+                _ = self._exec(statement)
+            except ProgrammingError as pe:
+                logger.exception(pe)
+                raise
@@ -15,6 +15,7 @@ from edfi_lms_ds_loader.db_operations.PGSQL_sql_builder import (
     soft_delete_from_production,
     get_processed_files,
     add_processed_file,
+    add_processed_files,
 )
 
 
@@ -350,3 +351,36 @@ values
 
         # Assert
         assert sql == expected
+
+
+def describe_when_add_processed_files_is_called():
+    def it_should_return_the_expected_sql():
+        # Arrange
+        files = [("the_Path/one", 23), ("the_Path/two", 5)]
+        resource_name = "a_Resource_Name"
+        expected = """
+insert into
+    lms.processedfiles
+(
+    fullpath,
+    resourcename,
+    numberofrows
+)
+values
+(
+    'the_Path/one',
+    'a_Resource_Name',
+    23
+),
+(
+    'the_Path/two',
+    'a_Resource_Name',
+    5
+)
+""".strip()
+
+        # Act
+        sql = add_processed_files(files, resource_name).strip()
+
+        # Assert
+        assert sql == expected
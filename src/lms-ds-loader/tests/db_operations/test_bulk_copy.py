@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from unittest.mock import MagicMock
+
+from edfi_lms_ds_loader.db_operations.bulk_copy import (
+    BULK_COPY_CHUNK_SIZE,
+    FALLBACK_CHUNK_SIZE,
+    get_chunk_size,
+    get_insert_method,
+    mssql_fast_executemany,
+    pgsql_copy,
+)
+from edfi_lms_ds_loader.helpers.constants import DbEngine
+
+
+def _pd_table() -> MagicMock:
+    pd_table = MagicMock()
+    pd_table.name = "stg_lmsuser"
+    pd_table.schema = "lms"
+    return pd_table
+
+
+def describe_when_getting_the_insert_method():
+    def describe_given_postgresql():
+        def it_should_use_copy():
+            assert get_insert_method(DbEngine.POSTGRESQL) == pgsql_copy
+
+    def describe_given_mssql():
+        def it_should_use_fast_executemany():
+            assert get_insert_method(DbEngine.MSSQL) == mssql_fast_executemany
+
+    def describe_given_unknown_engine():
+        def it_should_fall_back_to_multi_row_inserts():
+            assert get_insert_method("sqlite") == "multi"
+
+
+def describe_when_getting_the_chunk_size():
+    def describe_given_a_bulk_copy_method():
+        def it_should_use_the_bulk_copy_chunk_size():
+            assert get_chunk_size(pgsql_copy) == BULK_COPY_CHUNK_SIZE
+
+    def describe_given_the_fallback_method():
+        def it_should_use_the_fallback_chunk_size():
+            assert get_chunk_size("multi") == FALLBACK_CHUNK_SIZE
+
+
+def describe_when_copying_into_postgresql():
+    def it_should_stream_csv_with_null_markers():
+        # Arrange
+        conn = MagicMock()
+        cursor = conn.connection.cursor.return_value.__enter__.return_value
+        rows = [("a", None, 1), ("b", "", 2)]
+
+        copied = {}
+
+        def _copy_expert(sql, file):
+            copied["sql"] = sql
+            copied["data"] = file.read()
+
+        cursor.copy_expert.side_effect = _copy_expert
+
+        # Act
+        pgsql_copy(_pd_table(), conn, ["sourcesystem", "name", "number"], iter(rows))
+
+        # Assert
+        assert (
+            copied["sql"]
+            == 'COPY "lms"."stg_lmsuser" ("sourcesystem", "name", "number") FROM STDIN WITH (FORMAT csv, NULL \'\\N\')'
+        )
+        assert copied["data"] == "a,\\N,1\r\nb,,2\r\n"
+
+
+def describe_when_inserting_into_sql_server():
+    def describe_given_there_are_rows():
+        def it_should_execute_many_with_fast_executemany():
+            # Arrange
+            conn = MagicMock()
+            cursor = conn.connection.cursor.return_value
+            rows = [("a", None), ("b", "c")]
+
+            # Act
+            mssql_fast_executemany(_pd_table(), conn, ["sourcesystem", "name"], iter(rows))
+
+            # Assert
+            assert cursor.fast_executemany is True
+            cursor.executemany.assert_called_once_with(
+                "INSERT INTO [lms].[stg_lmsuser] ([sourcesystem], [name]) VALUES (?, ?)",
+                rows,
+            )
+            cursor.close.assert_called_once()
+
+    def describe_given_there_are_no_rows():
+        def it_should_not_open_a_cursor():
+            conn = MagicMock()
+
+            mssql_fast_executemany(_pd_table(), conn, ["sourcesystem"], iter([]))
+
+            conn.connection.cursor.assert_not_called()
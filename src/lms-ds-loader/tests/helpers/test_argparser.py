@@ -257,6 +257,148 @@ def describe_when_parsing_system_arguments() -> None:
 
         _assert_no_messages(capsys)
 
+    def describe_given_optional_load_arguments_are_not_provided() -> None:
+        def it_should_use_bulk_copy(capsys) -> None:
+            args = [
+                *_path_args(),
+                *_engine_args(DbEngine.POSTGRESQL),
+                *_server_args(),
+                *_db_name_args(),
+                *_username_args(),
+                *_password_args(),
+            ]
+
+            parsed = parse_main_arguments(args)
+
+            assert parsed.use_bulk_copy is True
+
+        def it_should_load_one_resource_at_a_time(capsys) -> None:
+            args = [
+                *_path_args(),
+                *_engine_args(DbEngine.POSTGRESQL),
+                *_server_args(),
+                *_db_name_args(),
+                *_username_args(),
+                *_password_args(),
+            ]
+
+            parsed = parse_main_arguments(args)
+
+            assert parsed.max_workers == 1
+
+        def it_should_load_one_file_at_a_time(capsys) -> None:
+            args = [
+                *_path_args(),
+                *_engine_args(DbEngine.POSTGRESQL),
+                *_server_args(),
+                *_db_name_args(),
+                *_username_args(),
+                *_password_args(),
+            ]
+
+            parsed = parse_main_arguments(args)
+
+            assert parsed.batch_size == 1
+
+        def it_should_read_whole_files(capsys) -> None:
+            args = [
+                *_path_args(),
+                *_engine_args(DbEngine.POSTGRESQL),
+                *_server_args(),
+                *_db_name_args(),
+                *_username_args(),
+                *_password_args(),
+            ]
+
+            parsed = parse_main_arguments(args)
+
+            assert parsed.chunk_size is None
+
+    def describe_given_batch_size_is_provided() -> None:
+        def it_should_parse_batch_size(capsys) -> None:
+            args = [
+                *_path_args(),
+                *_engine_args(DbEngine.POSTGRESQL),
+                *_server_args(),
+                *_db_name_args(),
+                *_username_args(),
+                *_password_args(),
+                "--batch-size",
+                "50",
+            ]
+
+            parsed = parse_main_arguments(args)
+
+            assert parsed.batch_size == 50
+
+    def describe_given_chunk_size_is_provided() -> None:
+        def it_should_parse_chunk_size(capsys) -> None:
+            args = [
+                *_path_args(),
+                *_engine_args(DbEngine.POSTGRESQL),
+                *_server_args(),
+                *_db_name_args(),
+                *_username_args(),
+                *_password_args(),
+                "--chunk-size",
+                "100000",
+            ]
+
+            parsed = parse_main_arguments(args)
+
+            assert parsed.chunk_size == 100000
+
+    def describe_given_bulk_copy_is_disabled() -> None:
+        def it_should_not_use_bulk_copy(capsys) -> None:
+            args = [
+                *_path_args(),
+                *_engine_args(DbEngine.POSTGRESQL),
+                *_server_args(),
+                *_db_name_args(),
+                *_username_args(),
+                *_password_args(),
+                "--disable-bulk-copy",
+            ]
+
+            parsed = parse_main_arguments(args)
+
+            assert parsed.use_bulk_copy is False
+
+    def describe_given_max_workers_is_provided() -> None:
+        def it_should_parse_max_workers(capsys) -> None:
+            args = [
+                *_path_args(),
+                *_engine_args(DbEngine.POSTGRESQL),
+                *_server_args(),
+                *_db_name_args(),
+                *_username_args(),
+                *_password_args(),
+                "--max-workers",
+                "4",
+            ]
+
+            parsed = parse_main_arguments(args)
+
+            assert parsed.max_workers == 4
+
+    def describe_given_max_workers_is_less_than_one() -> None:
+        def it_should_show_an_error(capsys) -> None:
+            with pytest.raises(SystemExit):
+                args = [
+                    *_path_args(),
+                    *_engine_args(DbEngine.POSTGRESQL),
+                    *_server_args(),
+                    *_db_name_args(),
+                    *_username_args(),
+                    *_password_args(),
+                    "--max-workers",
+                    "0",
+                ]
+
+                parse_main_arguments(args)
+
+                _assert_error_message(capsys)
+
     def describe_given_engine_mssql() -> None:
         def describe_given_using_integrated_security() -> None:
             def it_should_have_a_plain_connection_string(
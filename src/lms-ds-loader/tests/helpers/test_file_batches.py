@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+from edfi_lms_ds_loader.helpers.file_batches import batch_by_directory, read_batch
+
+A1 = "/base/section=a/attendance-events/2021-01-01-00-00-00.csv"
+A2 = "/base/section=a/attendance-events/2021-01-02-00-00-00.csv"
+B1 = "/base/section=b/attendance-events/2021-01-01-00-00-00.csv"
+C1 = "/base/section=c/attendance-events/2021-01-01-00-00-00.csv"
+C2 = "/base/section=c/attendance-events/2021-01-02-00-00-00.csv"
+C3 = "/base/section=c/attendance-events/2021-01-03-00-00-00.csv"
+
+
+def describe_when_batching_files_by_directory() -> None:
+    def describe_given_a_batch_size_of_one() -> None:
+        def it_should_return_each_file_in_sorted_order() -> None:
+            batches = batch_by_directory([C1, A2, B1, A1], 1)
+
+            assert batches == [[A1], [A2], [B1], [C1]]
+
+    def describe_given_one_file_per_directory() -> None:
+        def it_should_fill_batches_up_to_the_batch_size() -> None:
+            batches = batch_by_directory([C1, B1, A1], 2)
+
+            assert batches == [[A1, B1], [C1]]
+
+    def describe_given_multiple_files_in_a_directory() -> None:
+        def it_should_put_each_directory_file_in_a_later_batch() -> None:
+            batches = batch_by_directory([C3, A1, C1, B1, A2, C2], 10)
+
+            assert batches == [[A1, B1, C1], [A2, C2], [C3]]
+
+    def describe_given_no_files() -> None:
+        def it_should_return_no_batches() -> None:
+            assert batch_by_directory([], 5) == []
+
+    def describe_given_invalid_batch_size() -> None:
+        def it_should_raise_an_error() -> None:
+            with pytest.raises(AssertionError):
+                batch_by_directory([A1], 0)
+
+
+def describe_when_reading_a_batch() -> None:
+    @pytest.fixture
+    def result() -> Dict:
+        files = {
+            A1: [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})],
+            B1: [pd.DataFrame({"a": []})],
+        }
+        row_counts: Dict[str, int] = dict()
+
+        chunks = read_batch([A1, B1], lambda path: iter(files[path]), row_counts)
+
+        return {"chunks": list(chunks), "row_counts": row_counts}
+
+    def it_should_yield_every_chunk_in_order(result) -> None:
+        chunks: List[pd.DataFrame] = result["chunks"]
+        assert [c.shape[0] for c in chunks] == [2, 1, 0]
+
+    def it_should_count_the_rows_in_each_file(result) -> None:
+        assert result["row_counts"] == {A1: 3, B1: 0}
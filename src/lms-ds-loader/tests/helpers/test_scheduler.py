@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from threading import Event, Lock
+from typing import Callable, List
+
+import pytest
+
+from edfi_lms_ds_loader.helpers.scheduler import run_in_dependency_order
+
+
+def _recorder(log: List[str], lock: Lock) -> Callable[[str], Callable[[], None]]:
+    def _task(name: str) -> Callable[[], None]:
+        def _run() -> None:
+            with lock:
+                log.append(name)
+
+        return _run
+
+    return _task
+
+
+def describe_when_running_tasks_in_dependency_order() -> None:
+    def describe_given_a_single_worker() -> None:
+        def it_should_run_ready_tasks_in_the_given_order() -> None:
+            log: List[str] = []
+            task = _recorder(log, Lock())
+            tasks = {name: task(name) for name in ["a", "b", "c", "d"]}
+            dependencies = {"c": ["a", "b"], "d": ["a"]}
+
+            run_in_dependency_order(tasks, dependencies, 1)
+
+            assert log == ["a", "b", "c", "d"]
+
+    def describe_given_multiple_workers() -> None:
+        def it_should_run_independent_tasks_concurrently() -> None:
+            b_started = Event()
+
+            def a() -> None:
+                # Deadlocks, and times out, if "b" cannot start until "a" finishes
+                assert b_started.wait(timeout=5)
+
+            tasks = {"a": a, "b": b_started.set}
+
+            run_in_dependency_order(tasks, {}, 2)
+
+        def it_should_not_start_a_task_before_its_dependencies_finish() -> None:
+            log: List[str] = []
+            lock = Lock()
+            task = _recorder(log, lock)
+            tasks = {name: task(name) for name in ["a", "b", "c", "d", "e"]}
+            dependencies = {"b": ["a"], "c": ["a"], "d": ["b", "c"], "e": ["d"]}
+
+            run_in_dependency_order(tasks, dependencies, 4)
+
+            assert log[0] == "a"
+            assert set(log[1:3]) == {"b", "c"}
+            assert log[3:] == ["d", "e"]
+
+    def describe_given_a_task_fails() -> None:
+        def it_should_raise_the_error_and_not_start_dependent_tasks() -> None:
+            log: List[str] = []
+            task = _recorder(log, Lock())
+
+            def fail() -> None:
+                raise RuntimeError("bad things")
+
+            tasks = {"a": fail, "b": task("b")}
+
+            with pytest.raises(RuntimeError):
+                run_in_dependency_order(tasks, {"b": ["a"]}, 2)
+
+            assert log == []
+
+    def describe_given_a_dependency_on_an_unknown_task() -> None:
+        def it_should_raise_an_error() -> None:
+            with pytest.raises(AssertionError):
+                run_in_dependency_order({"a": lambda: None}, {"a": ["z"]}, 1)
+
+    def describe_given_circular_dependencies() -> None:
+        def it_should_raise_an_error() -> None:
+            tasks = {"a": lambda: None, "b": lambda: None}
+
+            with pytest.raises(ValueError):
+                run_in_dependency_order(tasks, {"a": ["b"], "b": ["a"]}, 1)
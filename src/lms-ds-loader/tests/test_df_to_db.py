@@ -79,6 +79,78 @@ def describe_given_a_resource_that_is_not_a_child_of_section_or_user() -> None:
             call(adapter_mock, Table.USER, SOURCE_SYSTEM)
         ]
 
+    def it_runs_in_a_single_unit_of_work(when_uploading_users) -> None:
+        adapter_mock, _, _, _ = when_uploading_users
+        adapter_mock.unit_of_work.assert_called_once()
+        adapter_mock.unit_of_work.return_value.__exit__.assert_called_once()
+
+
+def describe_given_a_file_read_in_chunks() -> None:
+    @pytest.fixture
+    def when_uploading_chunks() -> Tuple[MagicMock, MagicMock, MagicMock, list]:
+        # Arrange
+        adapter_mock = MagicMock()
+        db_adapter_insert_method_mock = MagicMock()
+        db_adapter_delete_method_mock = MagicMock()
+        chunks = [
+            pd.DataFrame([{"SourceSystem": SOURCE_SYSTEM}]),
+            pd.DataFrame(columns=["SourceSystem"]),
+            pd.DataFrame([{"SourceSystem": SOURCE_SYSTEM}]),
+        ]
+
+        # Act
+        df_to_db.upload_file(
+            adapter_mock,
+            iter(chunks),
+            Table.USER,
+            db_adapter_insert_method_mock,
+            db_adapter_delete_method_mock,
+        )
+
+        return (
+            adapter_mock,
+            db_adapter_insert_method_mock,
+            db_adapter_delete_method_mock,
+            chunks,
+        )
+
+    def it_truncates_the_staging_table_once(when_uploading_chunks) -> None:
+        adapter_mock, _, _, _ = when_uploading_chunks
+        assert adapter_mock.truncate_staging_table.call_args_list == [call(Table.USER)]
+
+    def it_inserts_each_non_empty_chunk_into_staging(when_uploading_chunks) -> None:
+        adapter_mock, _, _, chunks = when_uploading_chunks
+        assert adapter_mock.insert_into_staging.call_args_list == [
+            call(chunks[0], Table.USER),
+            call(chunks[2], Table.USER),
+        ]
+
+    def it_inserts_into_production_once(when_uploading_chunks) -> None:
+        adapter_mock, db_adapter_insert_method_mock, _, _ = when_uploading_chunks
+        assert db_adapter_insert_method_mock.call_args_list == [
+            call(adapter_mock, Table.USER, ["SourceSystem"])
+        ]
+
+    def it_soft_deletes_from_production_once(when_uploading_chunks) -> None:
+        adapter_mock, _, db_adapter_delete_method_mock, _ = when_uploading_chunks
+        assert db_adapter_delete_method_mock.call_args_list == [
+            call(adapter_mock, Table.USER, SOURCE_SYSTEM)
+        ]
+
+    def describe_given_all_chunks_are_empty() -> None:
+        def it_does_not_touch_the_database() -> None:
+            adapter_mock = MagicMock()
+
+            df_to_db.upload_file(
+                adapter_mock,
+                iter([pd.DataFrame()]),
+                Table.USER,
+                MagicMock(),
+                MagicMock(),
+            )
+
+            adapter_mock.unit_of_work.assert_not_called()
+
 
 def describe_given_assignments_description_too_long() -> None:
     @pytest.fixture
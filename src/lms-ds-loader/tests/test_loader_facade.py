@@ -22,13 +22,16 @@ def describe_when_uploading_extractor_files() -> None:
             # Arrange
             args_mock = MagicMock(spec=MainArguments)
             args_mock.engine = DbEngine.MSSQL
+            args_mock.max_workers = 1
+            args_mock.batch_size = 1
+            args_mock.chunk_size = None
 
             db_engine_mock = MagicMock()
             args_mock.get_adapter.return_value = db_engine_mock
 
             args_mock.csv_path = "/some/path"
 
-            db_adapter_mock = Mock()
+            db_adapter_mock = MagicMock()
             db_adapter_mock.get_processed_files = Mock(
                 return_value=set(["FullPathOne"])
             )
@@ -280,12 +283,15 @@ def describe_when_uploading_extractor_files() -> None:
         def it_bubbles_up_the_error(mocker) -> None:
             # Arrange
             args_mock = MagicMock(spec=MainArguments)
+            args_mock.max_workers = 1
+            args_mock.batch_size = 1
+            args_mock.chunk_size = None
             db_engine_mock = Mock()
             args_mock.get_adapter.return_value = db_engine_mock
 
             args_mock.csv_path = "/some/path"
 
-            db_adapter_mock = Mock()
+            db_adapter_mock = MagicMock()
             db_adapter_mock.get_processed_files = Mock(return_value=set(["fileOne"]))
             args_mock.get_db_operations_adapter.return_value = db_adapter_mock
 
@@ -6,14 +6,69 @@
 import logging
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 import pandas as pd
 from sqlalchemy.exc import ProgrammingError
 
+from edfi_lms_ds_loader.db_operations import bulk_copy
 from edfi_lms_ds_loader.sql_lms_operations import SqlLmsOperations
 from edfi_sql_adapter import sql_adapter
 
 
+def describe_when_using_a_unit_of_work() -> None:
+    @pytest.fixture
+    def adapter_mock() -> MagicMock:
+        return MagicMock()
+
+    def it_should_execute_statements_on_a_single_connection(adapter_mock) -> None:
+        connection = adapter_mock.engine.connect.return_value.__enter__.return_value
+        operations = SqlLmsOperations(adapter_mock)
+
+        with operations.unit_of_work():
+            operations.truncate_staging_table("one")
+            operations.truncate_staging_table("two")
+
+        adapter_mock.engine.connect.assert_called_once()
+        assert connection.execute.call_count == 2
+        adapter_mock.execute_transaction.assert_not_called()
+
+    def it_should_wrap_the_statements_in_a_transaction(adapter_mock) -> None:
+        connection = adapter_mock.engine.connect.return_value.__enter__.return_value
+
+        with SqlLmsOperations(adapter_mock).unit_of_work():
+            pass
+
+        connection.begin.return_value.__exit__.assert_called_once()
+
+    def it_should_join_an_outer_unit_of_work(adapter_mock) -> None:
+        operations = SqlLmsOperations(adapter_mock)
+
+        with operations.unit_of_work():
+            with operations.unit_of_work():
+                operations.truncate_staging_table("one")
+
+        adapter_mock.engine.connect.assert_called_once()
+
+    def it_should_release_the_connection_afterward(adapter_mock) -> None:
+        operations = SqlLmsOperations(adapter_mock)
+
+        with operations.unit_of_work():
+            pass
+        operations.truncate_staging_table("one")
+
+        adapter_mock.execute_transaction.assert_called_once()
+
+    def it_should_insert_into_staging_on_the_connection(adapter_mock) -> None:
+        connection = adapter_mock.engine.connect.return_value.__enter__.return_value
+        df = Mock(spec=pd.DataFrame)
+        operations = SqlLmsOperations(adapter_mock)
+
+        with operations.unit_of_work():
+            operations.insert_into_staging(df, "aaa")
+
+        assert df.to_sql.call_args.args[1] is connection
+
+
 def describe_when_truncating_staging_table() -> None:
     def describe_given_invalid_input() -> None:
         def it_raises_an_error() -> None:
@@ -89,7 +144,9 @@ def describe_when_inserting_into_staging() -> None:
                 SqlLmsOperations(Mock()).insert_into_staging(df, "   ")
 
     def describe_given_valid_arguments() -> None:
-        def it_then_use_pandas_to_load_into_the_db(mocker) -> None:
+        def it_then_use_pandas_to_load_into_the_db_with_fast_executemany(
+            mocker,
+        ) -> None:
             table = "aaa"
             staging_table = "stg_aaa"
             df = Mock(spec=pd.DataFrame)
@@ -100,7 +157,30 @@ def describe_when_inserting_into_staging() -> None:
             SqlLmsOperations(adapter_mock).insert_into_staging(df, table)
 
             # Assert
-            # adapter_mock.assert_called()
+            df.to_sql.assert_called_with(
+                staging_table,
+                engine,
+                schema="lms",
+                if_exists="append",
+                index=False,
+                method=bulk_copy.mssql_fast_executemany,
+                chunksize=bulk_copy.BULK_COPY_CHUNK_SIZE,
+            )
+
+    def describe_given_bulk_copy_is_disabled() -> None:
+        def it_then_use_pandas_multi_row_inserts(mocker) -> None:
+            table = "aaa"
+            staging_table = "stg_aaa"
+            df = Mock(spec=pd.DataFrame)
+            adapter_mock = Mock(spec=sql_adapter)
+            engine = adapter_mock.engine = Mock()
+
+            # Act
+            SqlLmsOperations(
+                adapter_mock, use_bulk_copy=False
+            ).insert_into_staging(df, table)
+
+            # Assert
             df.to_sql.assert_called_with(
                 staging_table,
                 engine,
@@ -816,4 +896,45 @@ VALUES
             mock_exc_logger.assert_called_once()
 
 
+def describe_when_adding_a_batch_of_processed_files():
+    def describe_given_parameters_are_correct():
+        def it_should_insert_all_files_in_one_statement(mocker):
+            resource_name = "fake_resource_name"
+            files = [("fake_path/one", 3), ("fake_path/two", 0)]
+            expected_statement = """
+INSERT INTO
+    lms.ProcessedFiles
+(
+    FullPath,
+    ResourceName,
+    NumberOfRows
+)
+VALUES
+(
+    'fake_path/one',
+    'fake_resource_name',
+    3
+),
+(
+    'fake_path/two',
+    'fake_resource_name',
+    0
+)
+""".strip()
+
+            exec_mock = mocker.patch.object(SqlLmsOperations, "_exec")
+            SqlLmsOperations(Mock()).add_processed_files(files, resource_name)
+
+            exec_mock.assert_called_once_with(expected_statement)
+
+    def describe_given_more_files_than_allowed_in_one_statement():
+        def it_should_split_the_inserts(mocker):
+            files = [(f"path/{i}", 1) for i in range(2001)]
+
+            exec_mock = mocker.patch.object(SqlLmsOperations, "_exec")
+            SqlLmsOperations(Mock()).add_processed_files(files, "resource")
+
+            assert exec_mock.call_count == 3
+
+
 # insert_new_records_to_production_for_attendance_events
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import logging
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLatency(object):
+    """
+    Running totals of the time taken by HTTP requests, from sending the
+    request to reading the response. Safe to share between threads.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._lock = Lock()
+
+    def record(self, seconds: float) -> None:
+        """
+        Add the time taken by a request.
+
+        Parameters
+        ----------
+        seconds: float
+            the time taken by the request
+        """
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def log_summary(self) -> None:
+        """
+        Log the number of requests and their average and slowest times.
+        """
+        logger.info(
+            f"Made {self.count} Schoology API requests, averaging "
+            f"{self.average_seconds:.3f}s, slowest {self.max_seconds:.3f}s"
+        )
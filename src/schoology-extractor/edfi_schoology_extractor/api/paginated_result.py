@@ -4,8 +4,10 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 from typing import TYPE_CHECKING
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
 
 
 if TYPE_CHECKING:
@@ -68,7 +70,7 @@ class PaginatedResult():
 
     @property
     def total_pages(self) -> int:
-        """int: Number of pages for the current resource with the current page size.
+        """int: Number of items for the current resource, across all pages.
 
         The value is obtained from the original request dictionary.
         """
@@ -95,9 +97,12 @@ class PaginatedResult():
         next_url = self._api_response["links"]["next"]
         next_url = next_url.replace(self.request_client.base_url, "")
 
-        response = self.request_client.get(next_url)
+        self._set_page(next_url, self.request_client.get(next_url))
 
-        self.requested_url = next_url
+        return self
+
+    def _set_page(self, requested_url: str, response: Dict[str, Any]) -> None:
+        self.requested_url = requested_url
         self.current_page = self.current_page + 1
         self._api_response = response
         if self._resource_name in self._api_response:
@@ -105,22 +110,89 @@ class PaginatedResult():
         else:
             self.current_page_items = []
 
-        return self
+    def _get_remaining_page_urls(self) -> List[str]:
+        """
+        Build the URLs of the pages after the current one, from the `start` and
+        `limit` of the next page link and the total number of items.
 
-    def get_all_pages(self) -> List[Dict[str, Any]]:
+        Returns
+        -------
+        list
+            The URLs of the remaining pages, in order, or an empty list if
+            they cannot be worked out.
+        """
+        next_url = self._api_response.get("links", {}).get("next")
+        if next_url is None or "total" not in self._api_response:
+            return []
+
+        parts = urlsplit(next_url.replace(self.request_client.base_url, ""))
+        query = parse_qs(parts.query)
+        try:
+            start = int(query["start"][0])
+            limit = int(query["limit"][0])
+        except (KeyError, ValueError):
+            return []
+
+        if limit < 1:
+            return []
+
+        page_urls: List[str] = []
+        for page_start in range(start, self.total_pages, limit):
+            query["start"] = [str(page_start)]
+            page_urls.append(
+                urlunsplit(parts._replace(query=urlencode(query, doseq=True)))
+            )
+        return page_urls
+
+    def _prefetch_pages(self, max_concurrency: int) -> List[Dict[str, Any]]:
+        """
+        Get the remaining pages, up to `max_concurrency` at once, leaving the
+        last one as the current page.
+
+        Returns
+        -------
+        list
+            The items of the remaining pages, in page order
+        """
+        page_urls = self._get_remaining_page_urls()
+        if len(page_urls) == 0:
+            return []
+
+        items: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(page_urls))
+        ) as executor:
+            for page_url, response in zip(
+                page_urls, executor.map(self.request_client.get, page_urls)
+            ):
+                self._set_page(page_url, response)
+                items = items + self.current_page_items
+
+        return items
+
+    def get_all_pages(self, max_concurrency: int = 1) -> List[Dict[str, Any]]:
         """
         Returns all items from the PaginatedResult object within all available pages
 
+        Parameters
+        ----------
+        max_concurrency : int
+            The number of pages to request at once. When more than one, the
+            URLs of the remaining pages are worked out from the total, and the
+            pages are requested together. Items are returned in page order.
+
         Returns
         -------
         list
             A list of all parsed results
         """
 
-        items: List[Dict[str, Any]] = []
-        while True:
+        items: List[Dict[str, Any]] = self.current_page_items
+        if max_concurrency > 1:
+            items = items + self._prefetch_pages(max_concurrency)
+
+        # Follows any page that the total did not account for
+        while self.get_next_page() is not None:
             items = items + self.current_page_items
-            if self.get_next_page() is None:
-                break
 
         return items
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from collections import deque
+import logging
+import os
+from threading import Lock
+import time
+from typing import Deque, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Schoology allows 50 requests every 5 seconds for each API key
+RATE_LIMIT_REQUESTS = int(os.environ.get("SCHOOLOGY_RATE_LIMIT_REQUESTS") or 50)
+RATE_LIMIT_WINDOW_SECONDS = float(
+    os.environ.get("SCHOOLOGY_RATE_LIMIT_WINDOW_SECONDS") or 5
+)
+
+RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
+RETRY_AFTER_HEADER = "Retry-After"
+
+
+class TokenBucket(object):
+    """
+    Token bucket holding one token for each request allowed in the Schoology
+    rate limit window. A token taken for a request goes back in the bucket one
+    window later, so that no more than `requests` start in any window. Safe to
+    share between threads.
+
+    The bucket also follows the server: it takes the tokens that an
+    `X-RateLimit-Remaining` header shows were used by other clients of the
+    same key, and holds every request back after a rate limit response.
+    """
+
+    def __init__(
+        self,
+        requests: int = RATE_LIMIT_REQUESTS,
+        window_seconds: float = RATE_LIMIT_WINDOW_SECONDS,
+    ):
+        self.requests = requests
+        self.window_seconds = window_seconds
+        self._taken: Deque[float] = deque()
+        self._paused_until = 0.0
+        self._lock = Lock()
+
+    def _expire(self, now: float) -> None:
+        while self._taken and self._taken[0] <= now - self.window_seconds:
+            self._taken.popleft()
+
+    def wait(self) -> None:
+        """
+        Block until there is a token in the bucket, then take it. The lock is
+        released while waiting, so that responses and rate limit pauses from
+        other threads are recorded, and seen when the waiting thread wakes.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._expire(now)
+
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif len(self._taken) < self.requests:
+                    self._taken.append(now)
+                    return
+                else:
+                    delay = self._taken[0] + self.window_seconds - now
+
+            logger.debug(f"Schoology rate limit reached, waiting {delay:.1f}s")
+            time.sleep(delay)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Take the tokens that the server reports as used beyond those taken
+        from this bucket.
+
+        Parameters
+        ----------
+        headers: Mapping[str, str]
+            the response headers
+        """
+        value = headers.get(RATE_LIMIT_REMAINING_HEADER)
+        if value is None or not value.isdigit():
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._expire(now)
+            available = self.requests - len(self._taken)
+            self._taken.extend([now] * max(0, available - int(value)))
+
+    def pause(self, headers: Mapping[str, str]) -> None:
+        """
+        Hold every request back after a rate limit response, for the time
+        given by its `Retry-After` header, or else for a whole window.
+
+        Parameters
+        ----------
+        headers: Mapping[str, str]
+            the headers of the rate limit response
+        """
+        seconds = self.window_seconds
+        value = headers.get(RETRY_AFTER_HEADER)
+        if value is not None and value.isdigit():
+            seconds = float(value)
+
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -8,21 +8,31 @@ import logging
 import os
 import time
 import random
-from typing import Any, Dict, List, Union
+from threading import Lock
+from typing import Any, Dict, List, Optional, Union
 from http import HTTPStatus
+import json as jsonlib
 import socket
+from urllib.parse import urlsplit
 
 from opnieuw import retry
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, RequestException, Timeout
 from requests.packages.urllib3.exceptions import ProtocolError  # type: ignore
 from requests_oauthlib import OAuth1Session  # type: ignore
 
+from .latency import RequestLatency
 from .paginated_result import PaginatedResult
+from .rate_limit import TokenBucket
 from edfi_schoology_extractor.helpers.constants import RESOURCE_NAMES
 
 DEFAULT_URL = os.environ.get("SCHOOLOGY_BASE_URL") or "https://api.schoology.com/v1/"
 DEFAULT_PAGE_SIZE = 20
+DEFAULT_MAX_CONNECTIONS = 10
+
+# GET requests bundled into one multiget request, the most Schoology accepts
+MULTIGET_MAX_REQUESTS = 50
 
 REQUEST_RETRY_COUNT = int(os.environ.get("REQUEST_RETRY_COUNT") or 4)
 REQUEST_RETRY_TIMEOUT_SECONDS = int(
@@ -46,19 +56,40 @@ class RequestClient:
         The consumer secret given by Schoology.
     base_url : Optional[str]
         The API base url. Default value: https://api.schoology.com/v1/
+    max_connections : int
+        The number of keep-alive connections kept open, which should be at
+        least the number of threads sharing the client. Default value: 10
 
     Attributes
     ----------
     oauth : OAuth1Session
-        The two-legged authenticated OAuth1 session.
+        The two-legged authenticated OAuth1 session, which keeps connections
+        open between requests.
+    rate_limiter : TokenBucket
+        Holds requests back to stay under the Schoology rate limit, across all
+        the threads that share the client.
+    latency : RequestLatency
+        The time taken by the requests made.
     """
 
     schoology_key: str
     schoology_secret: str
     base_url: str = DEFAULT_URL
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
 
     def __post_init__(self) -> None:
         self.oauth = OAuth1Session(self.schoology_key, self.schoology_secret)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections)
+        self.oauth.mount("https://", adapter)
+        self.oauth.mount("http://", adapter)
+
+        self.rate_limiter = TokenBucket()
+        self.latency = RequestLatency()
+
+        # Responses from multiget requests, kept for the next GET of each
+        # resource
+        self._prefetched: Dict[str, Dict[str, Any]] = {}
+        self._prefetched_lock = Lock()
 
     @property
     def _request_header(self) -> Dict[str, str]:
@@ -78,19 +109,17 @@ class RequestClient:
             self.schoology_secret, str
         ), "Property `schoology_secret` should be of type `str`."
 
+        # The nonce only has to be unique for the timestamp, so a random
+        # 32-bit number is enough
         auth_header = (
             'OAuth realm="Schoology API",',
             f'oauth_consumer_key="{self.schoology_key}",',
             'oauth_token="",',
-            f'oauth_nonce="{"".join( [str(random.randint(0, 9)) for i in range(8)] )}",',
-            f'oauth_timestamp="{time.time()}",',
+            f'oauth_nonce="{random.getrandbits(32):08x}",',
+            f'oauth_timestamp="{int(time.time())}",',
             'oauth_signature_method="PLAINTEXT",',
             'oauth_version="1.0",',
-            'oauth_signature="%s%%26%s"'
-            % (
-                self.schoology_secret,
-                "",
-            ),
+            f'oauth_signature="{self.schoology_secret}%26"',
         )
 
         return {
@@ -105,8 +134,8 @@ class RequestClient:
 
     def _check_for_rate_limiting(self, response: Response, http_method: str, url: str) -> None:
         """
-        Check for a rate limit response. If it has occurred, log and
-        raise an exception to be caught to trigger a retry.
+        Check for a rate limit response. If it has occurred, log, hold all
+        requests back, and raise an exception to be caught to trigger a retry.
 
         Parameters
         ----------
@@ -128,6 +157,7 @@ class RequestClient:
                 http_method,
                 url,
             )
+            self.rate_limiter.pause(response.headers)
             raise HTTPError(
                 f"{response.reason} ({response.status_code}): {response.text}"
             )
@@ -181,6 +211,43 @@ class RequestClient:
         self._check_for_rate_limiting(response, http_method, url)
         self._check_for_success(response, success_status)
 
+    def _send(self, http_method: str, url: str, **kwargs: Any) -> Response:
+        """
+        Send an HTTP request on the session, once the rate limiter allows it,
+        and record its latency.
+
+        Parameters
+        ----------
+        http_method: str
+            The HTTP method
+        url: str
+            The url of the request
+        **kwargs
+            Further arguments for the request, such as the json body
+
+        Returns
+        -------
+        Response
+            The HTTP response
+        """
+        self.rate_limiter.wait()
+        started = time.perf_counter()
+        response = self.oauth.request(
+            http_method,
+            url,
+            headers=self._request_header,
+            auth=self.oauth.auth,
+            **kwargs,
+        )
+        elapsed = time.perf_counter() - started
+
+        self.rate_limiter.update(response.headers)
+        self.latency.record(elapsed)
+        logger.debug(
+            f"{http_method} {url} returned {response.status_code} in {elapsed:.3f}s"
+        )
+        return response
+
     @retry(
         retry_on_exceptions=(
             IOError,
@@ -198,7 +265,7 @@ class RequestClient:
     )
     def get(self, resource: str) -> Dict[str, Any]:
         """
-        Send an HTTP GET request.
+        Send an HTTP GET request, unless the resource has been prefetched.
 
         Parameters
         ----------
@@ -219,12 +286,13 @@ class RequestClient:
             self.base_url, str
         ), "Property `base_url` should be of type `str`."
 
+        with self._prefetched_lock:
+            prefetched = self._prefetched.pop(resource, None)
+        if prefetched is not None:
+            return prefetched
+
         url = self.base_url + resource
-        response = self.oauth.get(
-            url=url,
-            headers=self._request_header,
-            auth=self.oauth.auth,
-        )
+        response = self._send("GET", url)
 
         self._check_response(
             response=response, success_status=HTTPStatus.OK, http_method="GET", url=url
@@ -268,12 +336,7 @@ class RequestClient:
             If the POST operation is unsuccessful.
         """
         url = f"{self.base_url}{resource}"
-        response = self.oauth.post(
-            url=url,
-            headers=self._request_header,
-            auth=self.oauth.auth,
-            json=json,
-        )
+        response = self._send("POST", url, json=json)
 
         self._check_response(
             response=response,
@@ -324,12 +387,7 @@ class RequestClient:
             attempt to check status codes for each individual operation.
         """
         url = f"{self.base_url}{resource}"
-        response = self.oauth.post(
-            url=url,
-            headers=self._request_header,
-            auth=self.oauth.auth,
-            json=json,
-        )
+        response = self._send("POST", url, json=json)
 
         self._check_response(
             response=response,
@@ -379,11 +437,7 @@ class RequestClient:
             attempt to check status codes for each individual operation.
         """
         url = f"{self.base_url}{resource}?{parameters}"
-        response = self.oauth.delete(
-            url=url,
-            headers=self._request_header,
-            auth=self.oauth.auth,
-        )
+        response = self._send("DELETE", url)
 
         self._check_response(
             response=response,
@@ -432,11 +486,7 @@ class RequestClient:
             attempt to check status codes for each individual operation.
         """
         url = f"{self.base_url}{resource}/{id}"
-        response = self.oauth.delete(
-            url=url,
-            headers=self._request_header,
-            auth=self.oauth.auth,
-        )
+        response = self._send("DELETE", url)
 
         self._check_response(
             response=response,
@@ -445,6 +495,136 @@ class RequestClient:
             url=url,
         )
 
+    @retry(
+        retry_on_exceptions=(
+            IOError,
+            ConnectionError,
+            RequestException,
+            HTTPError,
+            ProtocolError,
+            Timeout,
+            RuntimeError,
+            socket.timeout,
+            socket.error
+        ),
+        max_calls_total=REQUEST_RETRY_COUNT,
+        retry_window_after_first_call_in_seconds=REQUEST_RETRY_TIMEOUT_SECONDS,
+    )
+    def multi_get(self, resources: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send up to 50 GET requests bundled in one HTTP multiget request.
+
+        Parameters
+        ----------
+        resources : List[str]
+            The resource endpoints that you want to request.
+
+        Returns
+        -------
+        list
+            A parsed response from the server for each resource, in order, or
+            None for the resources whose GET was unsuccessful
+
+        Raises
+        -------
+        RuntimeError
+            If the multiget operation as a whole is unsuccessful.
+        """
+        assert (
+            len(resources) <= MULTIGET_MAX_REQUESTS
+        ), f"A multiget request can hold at most {MULTIGET_MAX_REQUESTS} requests."
+
+        url = f"{self.base_url}multiget"
+        base_path = urlsplit(self.base_url).path
+        response = self._send(
+            "PUT",
+            url,
+            json={"request": [base_path + resource for resource in resources]},
+        )
+
+        self._check_response(
+            response=response,
+            success_status=HTTPStatus.OK,
+            http_method="multiget PUT",
+            url=url,
+        )
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for result in response.json()["response"]:
+            body = result.get("body")
+            if int(result.get("response_code", 0)) != HTTPStatus.OK:
+                body = None
+            elif isinstance(body, str):
+                body = jsonlib.loads(body)
+            results.append(body)
+        return results
+
+    def prefetch(self, resources: List[str]) -> None:
+        """
+        Get many resources with multiget requests, keeping each response for
+        the next GET of the resource. The resources whose multiget failed are
+        left to be requested on their own.
+
+        Parameters
+        ----------
+        resources : List[str]
+            The resource endpoints that will be requested.
+        """
+        for start in range(0, len(resources), MULTIGET_MAX_REQUESTS):
+            batch = resources[start:start + MULTIGET_MAX_REQUESTS]
+            try:
+                responses = self.multi_get(batch)
+            except Exception as e:
+                logger.warning(
+                    "Multiget failed, the resources will be requested one by one: %s",
+                    e,
+                )
+                continue
+
+            with self._prefetched_lock:
+                for resource, response in zip(batch, responses):
+                    if response is not None:
+                        self._prefetched[resource] = response
+
+    def discard_prefetched(self, resources: List[str]) -> None:
+        """
+        Drop the prefetched responses of resources that were not requested,
+        such as when the extraction of a section failed before getting them.
+
+        Parameters
+        ----------
+        resources : List[str]
+            The prefetched resource endpoints.
+        """
+        with self._prefetched_lock:
+            for resource in resources:
+                self._prefetched.pop(resource, None)
+
+    def assignments_resource(
+        self, section_id: int, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> str:
+        """str: The endpoint of the first page of assignments of a section."""
+        return f"sections/{section_id}/assignments?{self._build_query_params_for_first_page(page_size)}"
+
+    def enrollments_resource(
+        self, section_id: int, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> str:
+        """str: The endpoint of the first page of enrollments of a section."""
+        params = self._build_query_params_for_first_page(page_size)
+        return f"sections/{section_id}/enrollments?{params}"
+
+    def attendance_resource(self, section_id: int) -> str:
+        """str: The endpoint of the attendance events of a section."""
+        return f"sections/{section_id}/attendance"
+
+    def discussions_resource(self, section_id: int) -> str:
+        """str: The endpoint of the discussions of a section."""
+        return f"sections/{section_id}/discussions"
+
+    def section_updates_resource(self, section_id: int) -> str:
+        """str: The endpoint of the first page of updates of a section."""
+        return f"sections/{section_id}/updates"
+
     def get_assignments(
         self, section_id: int, page_size: int = DEFAULT_PAGE_SIZE
     ) -> PaginatedResult:
@@ -462,7 +642,7 @@ class RequestClient:
             A parsed response from the server
         """
 
-        url = f"sections/{section_id}/assignments?{self._build_query_params_for_first_page(page_size)}"
+        url = self.assignments_resource(section_id, page_size)
 
         return PaginatedResult(
             self,
@@ -606,8 +786,7 @@ class RequestClient:
             A parsed response from the server
         """
 
-        params = self._build_query_params_for_first_page(page_size)
-        url = f"sections/{section_id}/enrollments?{params}"
+        url = self.enrollments_resource(section_id, page_size)
 
         return PaginatedResult(
             self,
@@ -638,9 +817,7 @@ class RequestClient:
         that's why it returns a list.
         """
 
-        url = f"sections/{section_id}/attendance"
-
-        result = self.get(url)
+        result = self.get(self.attendance_resource(section_id))
 
         return result["date"]  # type: ignore
 
@@ -664,7 +841,7 @@ class RequestClient:
         that's why it returns a list.
         """
 
-        result = self.get(f"sections/{section_id}/discussions")
+        result = self.get(self.discussions_resource(section_id))
         return result["discussion"]  # type: ignore
 
     def get_discussion_replies(
@@ -712,7 +889,7 @@ class RequestClient:
         PaginatedResult
             A parsed response from the server
         """
-        url = f"sections/{section_id}/updates"
+        url = self.section_updates_resource(section_id)
         return PaginatedResult(
             self,
             page_size,
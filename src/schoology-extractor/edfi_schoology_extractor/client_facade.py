@@ -40,11 +40,15 @@ class ClientFacade:
         Number of records to retrieve with each API call
     db_engine : sqlalchemy.engine.base.Engine
         Database connectivity for sync process
+    max_concurrency : int
+        Number of pages of users, roles, courses and sections to request at
+        once. Default value: 1
     """
 
     request_client: RequestClient
     page_size: int
     db_engine: sqlalchemy.engine.base.Engine
+    max_concurrency: int = 1
 
     @property
     def _client(self) -> RequestClient:
@@ -72,10 +76,14 @@ class ClientFacade:
         """
 
         logger.debug("Exporting users: get users")
-        users_list = self._client.get_users(self._page_size).get_all_pages()
+        users_list = self._client.get_users(self._page_size).get_all_pages(
+            self.max_concurrency
+        )
 
         logger.debug("Exporting users: get roles")
-        roles_list = self._client.get_roles(self._page_size).get_all_pages()
+        roles_list = self._client.get_roles(self._page_size).get_all_pages(
+            self.max_concurrency
+        )
 
         users_df: DataFrame = sync.sync_resource(
             RESOURCE_NAMES.USER, self._db_engine, users_list
@@ -101,10 +109,14 @@ class ClientFacade:
         """
 
         logger.debug("Exporting sections: get active courses")
-        courses_list = self._client.get_courses(self._page_size).get_all_pages()
+        courses_list = self._client.get_courses(self._page_size).get_all_pages(
+            self.max_concurrency
+        )
 
         def _get_section_for_course(section_id: Union[int, str]) -> List[Dict[str, Any]]:
-            return self._client.get_section_by_course_id(section_id).get_all_pages()
+            return self._client.get_section_by_course_id(section_id).get_all_pages(
+                self.max_concurrency
+            )
 
         logger.debug("Exporting sections: get sections for active courses")
         all_sections: List[Dict[str, Any]] = []
@@ -117,6 +129,54 @@ class ClientFacade:
 
         return sectionsMap.map_to_udm(sections_df)
 
+    def prefetch_sections(
+        self,
+        section_ids: List[int],
+        assignments: bool = False,
+        activities: bool = False,
+        attendance: bool = False,
+    ) -> List[str]:
+        """
+        Gets the first page of the enrollments, and optionally of the
+        assignments, section activities and attendance events, of many sections
+        with multiget requests. Later calls for these sections use the
+        prefetched pages instead of requesting them one by one.
+
+        Parameters
+        ----------
+        section_ids : List[int]
+            Section Ids
+        assignments : bool
+            Whether to prefetch the assignments
+        activities : bool
+            Whether to prefetch the discussions and section updates
+        attendance : bool
+            Whether to prefetch the attendance events
+
+        Returns
+        -------
+        List[str]
+            The prefetched resource endpoints, to discard the pages left
+            unused once the sections are extracted
+        """
+
+        resources: List[str] = []
+        for section_id in section_ids:
+            resources.append(self._client.enrollments_resource(section_id))
+            if assignments:
+                resources.append(
+                    self._client.assignments_resource(section_id, self._page_size)
+                )
+            if activities:
+                resources.append(self._client.discussions_resource(section_id))
+                resources.append(self._client.section_updates_resource(section_id))
+            if attendance:
+                resources.append(self._client.attendance_resource(section_id))
+
+        logger.debug(f"Prefetching {len(resources)} resources for sections")
+        self._client.prefetch(resources)
+        return resources
+
     def get_assignments(self, section_id: int) -> DataFrame:
         """
         Gets all Schoology assignments for the given sections, with separate
@@ -3,16 +3,21 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
 import os
 import sys
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from pandas import DataFrame
 import sqlalchemy
 
 from edfi_schoology_extractor.helpers.arg_parser import MainArguments
-from edfi_schoology_extractor.api.request_client import RequestClient
+from edfi_schoology_extractor.api.request_client import (
+    DEFAULT_MAX_CONNECTIONS,
+    MULTIGET_MAX_REQUESTS,
+    RequestClient,
+)
 from edfi_schoology_extractor.helpers import csv_writer
 from edfi_schoology_extractor import usage_analytics_facade
 import edfi_schoology_extractor.lms_filesystem as lms
@@ -22,10 +27,6 @@ from edfi_lms_extractor_lib.helpers.decorators import catch_exceptions
 
 logger = logging.getLogger(__name__)
 
-# This variable facilitates temporary storage of output results from one GET
-# request that need to be used for creating another GET request.
-result_bucket: Dict[str, DataFrame] = {}
-
 
 def _initialize(
     arguments: MainArguments,
@@ -34,11 +35,18 @@ def _initialize(
 
     try:
         request_client: RequestClient = RequestClient(
-            arguments.client_key, arguments.client_secret
+            arguments.client_key,
+            arguments.client_secret,
+            max_connections=max(DEFAULT_MAX_CONNECTIONS, arguments.max_concurrency),
         )
         db_engine = get_sync_db_engine(arguments.sync_database_directory)
 
-        facade = ClientFacade(request_client, arguments.page_size, db_engine)
+        facade = ClientFacade(
+            request_client,
+            arguments.page_size,
+            db_engine,
+            arguments.max_concurrency,
+        )
 
         # Will generate an exception if directory is not valid
         os.lstat(arguments.output_directory)
@@ -73,7 +81,11 @@ def _get_users(client_facade: ClientFacade, output_directory: str) -> None:
 
 
 @catch_exceptions
-def _get_sections(client_facade: ClientFacade, output_directory: str) -> None:
+def _get_sections(
+    client_facade: ClientFacade,
+    output_directory: str,
+    result_bucket: Dict[str, DataFrame],
+) -> None:
 
     sections = client_facade.get_sections()
     result_bucket["sections"] = sections
@@ -85,7 +97,10 @@ def _get_sections(client_facade: ClientFacade, output_directory: str) -> None:
 
 @catch_exceptions
 def _get_assignments(
-    client_facade: ClientFacade, output_directory: str, section_id: int
+    client_facade: ClientFacade,
+    output_directory: str,
+    section_id: int,
+    result_bucket: Dict[str, DataFrame],
 ) -> None:
 
     assignment_file_path: str = lms.get_assignment_file_path(
@@ -113,7 +128,10 @@ def _get_section_activities(
 
 @catch_exceptions
 def _get_submissions(
-    client_facade: ClientFacade, output_directory: str, section_id: int
+    client_facade: ClientFacade,
+    output_directory: str,
+    section_id: int,
+    result_bucket: Dict[str, DataFrame],
 ) -> None:
     assignments: DataFrame = result_bucket["assignments"]
 
@@ -134,7 +152,10 @@ def _get_submissions(
 
 @catch_exceptions
 def _get_section_associations(
-    client_facade: ClientFacade, output_directory: str, section_id: int
+    client_facade: ClientFacade,
+    output_directory: str,
+    section_id: int,
+    result_bucket: Dict[str, DataFrame],
 ) -> None:
     file_path = lms.get_section_association_file_path(output_directory, section_id)
 
@@ -146,7 +167,10 @@ def _get_section_associations(
 
 @catch_exceptions
 def _get_attendance_events(
-    client_facade: ClientFacade, output_directory: str, section_id: int
+    client_facade: ClientFacade,
+    output_directory: str,
+    section_id: int,
+    result_bucket: Dict[str, DataFrame],
 ) -> None:
     file_path = lms.get_attendance_events_file_path(output_directory, section_id)
 
@@ -177,12 +201,84 @@ def _get_system_activities(
         _create_file_from_dataframe(system_activities, system_activities_output_dir)
 
 
+def _extract_section(
+    facade: ClientFacade, arguments: MainArguments, section_id: int
+) -> None:
+    # This variable facilitates temporary storage of output results from one GET
+    # request that need to be used for creating another GET request, for this
+    # section only.
+    result_bucket: Dict[str, DataFrame] = {}
+    output_directory = arguments.output_directory
+
+    _get_section_associations(facade, output_directory, section_id, result_bucket)
+
+    if arguments.extract_assignments:
+        _get_assignments(facade, output_directory, section_id, result_bucket)
+        succeeded = result_bucket.get("assignments", None) is not None
+        if succeeded:
+            _get_submissions(facade, output_directory, section_id, result_bucket)
+
+    if arguments.extract_activities:
+        _get_section_activities(facade, output_directory, section_id)
+
+    if arguments.extract_attendance:
+        _get_attendance_events(facade, output_directory, section_id, result_bucket)
+
+
+def _extract_sections(
+    facade: ClientFacade, arguments: MainArguments, section_ids: List[int]
+) -> None:
+    """
+    Extract the resources of each section, up to `max_concurrency` sections
+    at once. The requests of all sections share the rate limit of the client.
+
+    The first pages of the sections are prefetched with multiget requests, a
+    batch of sections at a time. A batch is prefetched while the sections of
+    the previous batch are extracted, and the pages a batch left unused are
+    dropped once its sections are done, so that prefetched pages do not pile
+    up.
+    """
+
+    def _finish(batch: List[Future], resources: List[str]) -> None:
+        if not batch:
+            return
+        try:
+            for future in batch:
+                future.result()
+        finally:
+            facade.request_client.discard_prefetched(resources)
+
+    with ThreadPoolExecutor(
+        max_workers=arguments.max_concurrency, thread_name_prefix="section"
+    ) as executor:
+        previous_batch: List[Future] = []
+        previous_resources: List[str] = []
+        for start in range(0, len(section_ids), MULTIGET_MAX_REQUESTS):
+            batch_ids = section_ids[start:start + MULTIGET_MAX_REQUESTS]
+            resources = facade.prefetch_sections(
+                batch_ids,
+                assignments=arguments.extract_assignments,
+                activities=arguments.extract_activities,
+                attendance=arguments.extract_attendance,
+            )
+            batch = [
+                executor.submit(_extract_section, facade, arguments, section_id)
+                for section_id in batch_ids
+            ]
+
+            _finish(previous_batch, previous_resources)
+            previous_batch, previous_resources = batch, resources
+
+        _finish(previous_batch, previous_resources)
+
+
 def run(arguments: MainArguments) -> None:
     logger.info("Starting Ed-Fi LMS Schoology Extractor")
     facade, db_engine = _initialize(arguments)
 
+    result_bucket: Dict[str, DataFrame] = {}
     _get_users(facade, arguments.output_directory)
-    _get_sections(facade, arguments.output_directory)
+    _get_sections(facade, arguments.output_directory, result_bucket)
     succeeded = result_bucket.get("sections", None) is not None
 
     if not succeeded:
@@ -192,22 +288,14 @@ def run(arguments: MainArguments) -> None:
         sys.exit(1)
 
     if result_bucket["sections"].shape[0] > 0:
-        for section_id in result_bucket["sections"]["SourceSystemIdentifier"].values:
-            _get_section_associations(facade, arguments.output_directory, section_id)
-
-            if arguments.extract_assignments:
-                _get_assignments(facade, arguments.output_directory, section_id)
-                succeeded = result_bucket.get("assignments", None) is not None
-                if succeeded:
-                    _get_submissions(facade, arguments.output_directory, section_id)
-
-            if arguments.extract_activities:
-                _get_section_activities(facade, arguments.output_directory, section_id)
-
-            if arguments.extract_attendance:
-                _get_attendance_events(facade, arguments.output_directory, section_id)
+        _extract_sections(
+            facade,
+            arguments,
+            result_bucket["sections"]["SourceSystemIdentifier"].tolist(),
+        )
 
     if arguments.extract_activities:
         _get_system_activities(arguments, db_engine)
 
+    facade.request_client.latency.log_summary()
     logger.info("Finishing Ed-Fi LMS Schoology Extractor")
@@ -3,6 +3,7 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+from argparse import ArgumentTypeError
 from dataclasses import dataclass
 from typing import List
 
@@ -27,6 +28,14 @@ class MainArguments:
     extract_assignments: bool = False
     extract_attendance: bool = False
     extract_grades: bool = False
+    max_concurrency: int = constants.DEFAULT_MAX_CONCURRENCY
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"{value} is not a positive integer")
+    return number
 
 
 def parse_main_arguments(args_in: List[str]) -> MainArguments:
@@ -126,6 +135,15 @@ def parse_main_arguments(args_in: List[str]) -> MainArguments:
         env_var="FEATURE",
     )
 
+    parser.add(  # type: ignore
+        "--max-concurrency",
+        required=False,
+        help="The maximum number of sections to extract at once.",
+        type=_positive_int,
+        default=constants.DEFAULT_MAX_CONCURRENCY,
+        env_var="MAX_CONCURRENCY",
+    )
+
     args_parsed = parser.parse_args(args_in)
     # Required
     assert isinstance(
@@ -158,6 +176,7 @@ def parse_main_arguments(args_in: List[str]) -> MainArguments:
         extract_assignments=constants.Features.Assignments in args_parsed.feature,
         extract_attendance=constants.Features.Attendance in args_parsed.feature,
         extract_grades=constants.Features.Grades in args_parsed.feature,
+        max_concurrency=args_parsed.max_concurrency,
     )
 
     return arguments
@@ -4,6 +4,9 @@
 # See the LICENSE and NOTICES files in the project root for more information.
 LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+# Sections extracted at once by default
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 class RESOURCE_NAMES:
     ASSIGNMENT = "assignment"
@@ -2,13 +2,14 @@
 # Licensed to the Ed-Fi Alliance under one or more agreements.
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
-import os
 import logging
+from threading import Lock
 from typing import Any, Dict, List, Union
 
 from pandas import DataFrame
 import sqlalchemy
 from sqlalchemy.engine import ResultProxy
+from edfi_lms_extractor_lib.api import sync_db
 from edfi_lms_extractor_lib.api.resource_sync import (
     cleanup_after_sync,
     sync_to_db_without_cleanup,
@@ -18,6 +19,10 @@ USAGE_TABLE_NAME = "USAGE_PROCESSED_FILES"
 
 logger = logging.getLogger(__name__)
 
+# Sections are extracted concurrently, but the sync tables of a resource,
+# including its temporary tables, are shared, so syncs run one at a time
+_sync_lock = Lock()
+
 
 def get_sync_db_engine(sync_database_directory: str) -> sqlalchemy.engine.base.Engine:
     """
@@ -28,12 +33,7 @@ def get_sync_db_engine(sync_database_directory: str) -> sqlalchemy.engine.base.E
     sqlalchemy.engine.base.Engine
         a SQL Alchemy Engine
     """
-    logger.debug(
-        "Ensuring database directory at %s", os.path.abspath(sync_database_directory)
-    )
-    os.makedirs(sync_database_directory, exist_ok=True)
-
-    return sqlalchemy.create_engine(f"sqlite:///{sync_database_directory}/sync.sqlite")
+    return sync_db.get_sync_db_engine(sync_database_directory)
 
 
 def sync_resource(
@@ -46,13 +46,14 @@ def sync_resource(
         return DataFrame()
     resource_df: DataFrame = DataFrame(data)
 
-    synced_df = sync_to_db_without_cleanup(
-        resource_df=resource_df,
-        identity_columns=[id_column],
-        resource_name=resource_name,
-        sync_db=db_engine,
-    )
-    cleanup_after_sync(resource_name, db_engine)
+    with _sync_lock:
+        synced_df = sync_to_db_without_cleanup(
+            resource_df=resource_df,
+            identity_columns=[id_column],
+            resource_name=resource_name,
+            sync_db=db_engine,
+        )
+        cleanup_after_sync(resource_name, db_engine)
     return synced_df
 
 
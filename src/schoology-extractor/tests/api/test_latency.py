@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+import logging
+
+from edfi_schoology_extractor.api.latency import RequestLatency
+
+
+def describe_when_recording_request_latency():
+    def it_should_average_zero_without_requests():
+        assert RequestLatency().average_seconds == 0.0
+
+    def it_should_keep_the_count_average_and_slowest():
+        latency = RequestLatency()
+
+        for seconds in [0.1, 0.3, 0.2]:
+            latency.record(seconds)
+
+        assert latency.count == 3
+        assert round(latency.average_seconds, 6) == 0.2
+        assert latency.max_seconds == 0.3
+
+    def it_should_log_a_summary(caplog):
+        latency = RequestLatency()
+        latency.record(0.25)
+
+        with caplog.at_level(logging.INFO):
+            latency.log_summary()
+
+        assert "Made 1 Schoology API requests, averaging 0.250s" in caplog.text
@@ -155,3 +155,81 @@ def describe_when_getting_all_pages():
 
     def it_should_return_all_available_items(result: list):
         assert len(result) == 1
+
+
+def describe_when_prefetching_all_pages():
+    def _page(start: int, total: int, limit: int = 2):
+        response = {
+            "user": [{"uid": uid} for uid in range(start, min(start + limit, total))],
+            "total": total,
+            "links": {"self": "ignore"},
+        }
+        if start + limit < total:
+            response["links"]["next"] = (
+                f"{DEFAULT_URL}users?start={start + limit}&limit={limit}"
+            )
+        return response
+
+    def _request_client(total: int):
+        request_client = Mock(spec=RequestClient)
+        request_client.base_url = DEFAULT_URL
+
+        def _get(url: str):
+            start = int(url.split("start=")[1].split("&")[0])
+            return _page(start, total)
+
+        request_client.get.side_effect = _get
+        return request_client
+
+    def it_should_return_the_items_of_all_pages_in_order():
+        request_client = _request_client(total=9)
+        paginated_result = PaginatedResult(
+            request_client, 2, _page(0, 9), "user", f"{DEFAULT_URL}users"
+        )
+
+        result = paginated_result.get_all_pages(max_concurrency=3)
+
+        assert [item["uid"] for item in result] == list(range(9))
+
+    def it_should_request_each_remaining_page_once():
+        request_client = _request_client(total=9)
+        paginated_result = PaginatedResult(
+            request_client, 2, _page(0, 9), "user", f"{DEFAULT_URL}users"
+        )
+
+        paginated_result.get_all_pages(max_concurrency=3)
+
+        assert sorted(call.args[0] for call in request_client.get.call_args_list) == [
+            "users?start=2&limit=2",
+            "users?start=4&limit=2",
+            "users?start=6&limit=2",
+            "users?start=8&limit=2",
+        ]
+
+    def it_should_follow_pages_beyond_the_first_total():
+        request_client = _request_client(total=7)
+        paginated_result = PaginatedResult(
+            request_client, 2, _page(0, 5), "user", f"{DEFAULT_URL}users"
+        )
+
+        result = paginated_result.get_all_pages(max_concurrency=3)
+
+        assert [item["uid"] for item in result] == list(range(7))
+
+    def it_should_follow_next_links_without_start_and_limit():
+        request_client = Mock(spec=RequestClient)
+        request_client.base_url = DEFAULT_URL
+        request_client.get.return_value = {"user": [{"uid": 2}], "links": {}}
+        first_page = {
+            "user": [{"uid": 1}],
+            "total": 2,
+            "links": {"next": f"{DEFAULT_URL}users?page=2"},
+        }
+        paginated_result = PaginatedResult(
+            request_client, 1, first_page, "user", f"{DEFAULT_URL}users"
+        )
+
+        result = paginated_result.get_all_pages(max_concurrency=3)
+
+        assert [item["uid"] for item in result] == [1, 2]
+        request_client.get.assert_called_once_with("users?page=2")
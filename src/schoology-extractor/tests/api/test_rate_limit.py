@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from threading import Thread
+from typing import List
+
+import pytest
+
+from edfi_schoology_extractor.api import rate_limit
+from edfi_schoology_extractor.api.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake_clock.monotonic)
+    monkeypatch.setattr(rate_limit.time, "sleep", fake_clock.sleep)
+    return fake_clock
+
+
+def describe_when_waiting_for_a_token():
+    def it_should_default_to_the_schoology_rate_limit():
+        bucket = TokenBucket()
+
+        assert bucket.requests == 50
+        assert bucket.window_seconds == 5.0
+
+    def it_should_not_wait_while_there_are_tokens(clock: FakeClock):
+        bucket = TokenBucket(3, 5.0)
+
+        for _ in range(3):
+            bucket.wait()
+
+        assert clock.sleeps == []
+
+    def it_should_wait_for_the_oldest_token_to_come_back(clock: FakeClock):
+        bucket = TokenBucket(2, 5.0)
+        bucket.wait()
+        clock.now += 1.0
+        bucket.wait()
+
+        bucket.wait()
+
+        assert clock.sleeps == [4.0]
+
+    def it_should_not_start_more_requests_than_allowed_in_any_window(
+        clock: FakeClock,
+    ):
+        bucket = TokenBucket(3, 5.0)
+        started: List[float] = []
+
+        for _ in range(10):
+            bucket.wait()
+            started.append(clock.now)
+            clock.now += 0.5
+
+        for index in range(len(started) - 3):
+            assert started[index + 3] - started[index] >= 5.0
+
+
+def describe_when_following_the_server():
+    def it_should_take_the_tokens_used_by_other_clients(clock: FakeClock):
+        bucket = TokenBucket(5, 5.0)
+        bucket.wait()
+
+        bucket.update({"X-RateLimit-Remaining": "1"})
+        bucket.wait()
+        bucket.wait()
+
+        assert clock.sleeps == [5.0]
+
+    def it_should_not_give_back_tokens_taken_from_the_bucket(clock: FakeClock):
+        bucket = TokenBucket(2, 5.0)
+        bucket.wait()
+        bucket.wait()
+
+        bucket.update({"X-RateLimit-Remaining": "40"})
+        bucket.wait()
+
+        assert clock.sleeps == [5.0]
+
+    def it_should_ignore_responses_without_the_header(clock: FakeClock):
+        bucket = TokenBucket(2, 5.0)
+
+        bucket.update({})
+        bucket.wait()
+        bucket.wait()
+
+        assert clock.sleeps == []
+
+    def it_should_pause_for_the_retry_after_time(clock: FakeClock):
+        bucket = TokenBucket(5, 5.0)
+
+        bucket.pause({"Retry-After": "2"})
+        bucket.wait()
+
+        assert clock.sleeps == [2.0]
+
+    def it_should_pause_for_a_window_without_retry_after(clock: FakeClock):
+        bucket = TokenBucket(5, 5.0)
+
+        bucket.pause({})
+        bucket.wait()
+
+        assert clock.sleeps == [5.0]
+
+    def it_should_record_a_pause_while_a_thread_is_waiting(
+        clock: FakeClock, monkeypatch
+    ):
+        bucket = TokenBucket(1, 5.0)
+        bucket.wait()
+        paused: List[bool] = []
+
+        def _sleep(seconds: float) -> None:
+            if not paused:
+                pausing = Thread(target=bucket.pause, args=({"Retry-After": "20"},))
+                pausing.start()
+                pausing.join(timeout=1)
+                paused.append(not pausing.is_alive())
+            clock.sleep(seconds)
+
+        monkeypatch.setattr(rate_limit.time, "sleep", _sleep)
+
+        bucket.wait()
+
+        assert paused == [True]
+        assert clock.sleeps == [5.0, 15.0]
@@ -3,7 +3,11 @@
 # The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
 # See the LICENSE and NOTICES files in the project root for more information.
 
+import time
+
 import pytest
+from requests import Response
+from requests.exceptions import HTTPError
 
 from edfi_schoology_extractor.api.request_client import RequestClient
 from edfi_schoology_extractor.api.paginated_result import PaginatedResult
@@ -56,6 +60,175 @@ def describe_testing_RequestClient_class():
                 contained_value="OAuth",
             )
 
+        def it_uses_a_new_nonce_for_each_request(default_request_client):
+            def _nonce(request_header):
+                return request_header["Authorization"].split('oauth_nonce="')[1][:8]
+
+            nonces = {_nonce(default_request_client._request_header) for _ in range(20)}
+
+            assert len(nonces) > 1
+
+        def it_uses_a_timestamp_in_whole_seconds(default_request_client):
+            authorization = default_request_client._request_header["Authorization"]
+            timestamp = authorization.split('oauth_timestamp="')[1].split('"')[0]
+
+            assert abs(int(timestamp) - time.time()) < 5
+
+    def describe_when_sending_requests():
+        def it_keeps_the_connections_open_in_one_pool():
+            request_client = RequestClient(FAKE_KEY, FAKE_SECRET, max_connections=16)
+
+            adapter = request_client.oauth.get_adapter(DEFAULT_URL)
+
+            assert adapter._pool_maxsize == 16
+            assert request_client.oauth.get_adapter("http://localhost") is adapter
+
+        def it_records_the_latency_of_each_request(
+            requests_mock, default_request_client
+        ):
+            requests_mock.get(DEFAULT_URL + FAKE_ENDPOINT_URL, json={})
+
+            default_request_client.get(FAKE_ENDPOINT_URL)
+            default_request_client.get(FAKE_ENDPOINT_URL)
+
+            assert default_request_client.latency.count == 2
+            assert default_request_client.latency.max_seconds > 0
+
+        def it_passes_the_rate_limit_headers_to_the_rate_limiter(
+            requests_mock, default_request_client
+        ):
+            requests_mock.get(
+                DEFAULT_URL + FAKE_ENDPOINT_URL,
+                json={},
+                headers={"X-RateLimit-Remaining": "0"},
+            )
+
+            default_request_client.get(FAKE_ENDPOINT_URL)
+
+            rate_limiter = default_request_client.rate_limiter
+            assert len(rate_limiter._taken) == rate_limiter.requests
+
+    def describe_when_prefetching_with_multiget():
+        MULTIGET_URL = DEFAULT_URL + "multiget"
+
+        def _multiget_response(*entries):
+            return {
+                "response": [
+                    {"response_code": code, "location": "ignore", "body": body}
+                    for code, body in entries
+                ]
+            }
+
+        def it_bundles_the_requests_with_the_api_path(
+            requests_mock, default_request_client
+        ):
+            requests_mock.put(
+                MULTIGET_URL,
+                json=_multiget_response((200, {"a": 1}), (200, {"b": 2})),
+            )
+
+            result = default_request_client.multi_get(
+                ["sections/1/attendance", "sections/2/attendance"]
+            )
+
+            assert result == [{"a": 1}, {"b": 2}]
+            assert requests_mock.last_request.json() == {
+                "request": ["/v1/sections/1/attendance", "/v1/sections/2/attendance"]
+            }
+
+        def it_returns_None_for_unsuccessful_requests(
+            requests_mock, default_request_client
+        ):
+            requests_mock.put(
+                MULTIGET_URL,
+                json=_multiget_response((200, {"a": 1}), (404, "Not found")),
+            )
+
+            result = default_request_client.multi_get(["a", "b"])
+
+            assert result == [{"a": 1}, None]
+
+        def it_uses_the_prefetched_response_once(
+            requests_mock, default_request_client
+        ):
+            requests_mock.put(MULTIGET_URL, json=_multiget_response((200, {"a": 1})))
+            requests_mock.get(DEFAULT_URL + "a", json={"a": 2})
+
+            default_request_client.prefetch(["a"])
+
+            assert default_request_client.get("a") == {"a": 1}
+            assert default_request_client.get("a") == {"a": 2}
+
+        def it_discards_the_prefetched_responses_left_unused(
+            requests_mock, default_request_client
+        ):
+            requests_mock.put(
+                MULTIGET_URL,
+                json=_multiget_response((200, {"a": 1}), (200, {"b": 2})),
+            )
+            default_request_client.prefetch(["a", "b"])
+            default_request_client.get("a")
+
+            default_request_client.discard_prefetched(["a", "b"])
+
+            assert default_request_client._prefetched == {}
+
+        def it_requests_failed_resources_one_by_one(
+            requests_mock, default_request_client
+        ):
+            requests_mock.put(
+                MULTIGET_URL,
+                json=_multiget_response((200, {"a": 1}), (500, "Error")),
+            )
+            requests_mock.get(DEFAULT_URL + "b", json={"b": 2})
+
+            default_request_client.prefetch(["a", "b"])
+
+            assert default_request_client.get("b") == {"b": 2}
+
+        def it_sends_at_most_50_requests_in_each_multiget(
+            mocker, default_request_client
+        ):
+            default_request_client.multi_get = mocker.MagicMock(
+                side_effect=lambda resources: [{}] * len(resources)
+            )
+
+            default_request_client.prefetch([str(index) for index in range(120)])
+
+            assert [
+                len(call.args[0])
+                for call in default_request_client.multi_get.call_args_list
+            ] == [50, 50, 20]
+
+        def it_ignores_a_failed_multiget(mocker, default_request_client):
+            default_request_client.multi_get = mocker.MagicMock(
+                side_effect=RuntimeError("Bad Gateway (502)")
+            )
+
+            default_request_client.prefetch(["a"])
+
+            assert default_request_client._prefetched == {}
+
+    def describe_when_rate_limited():
+        def it_pauses_the_rate_limiter_and_raises_an_HTTPError(
+            default_request_client,
+        ):
+            response = Response()
+            response.status_code = 429
+            response.reason = "Too Many Requests"
+            response.headers["Retry-After"] = "3"
+            response._content = b""
+
+            with pytest.raises(HTTPError):
+                default_request_client._check_for_rate_limiting(
+                    response, "GET", DEFAULT_URL
+                )
+
+            paused_for = (
+                default_request_client.rate_limiter._paused_until - time.monotonic()
+            )
+            assert 2 < paused_for <= 3
+
     def describe_when_get_method_is_called():
         def describe_given_error_occurs():
             def it_raises_an_HTTPError(requests_mock, default_request_client):
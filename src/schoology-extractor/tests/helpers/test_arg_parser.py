@@ -54,6 +54,9 @@ def describe_when_parsing_arguments():
         def it_should_default_to_current_directory(result: MainArguments):
             assert result.output_directory == ""
 
+        def it_should_default_to_four_concurrent_sections(result: MainArguments):
+            assert result.max_concurrency == 4
+
     def describe_given_optional_parameters():
         @pytest.fixture
         def result() -> MainArguments:
@@ -101,6 +104,22 @@ def describe_when_parsing_arguments():
             assert result.extract_assignments
             assert result.extract_grades
 
+    def describe_given_max_concurrency():
+        def it_should_load_the_max_concurrency():
+            parameters = ["-s", FAKE_SECRET, "-k", FAKE_KEY, "--max-concurrency", "8"]
+
+            result = parse_main_arguments(parameters)
+
+            assert result.max_concurrency == 8
+
+        def it_should_reject_zero(capsys):
+            parameters = ["-s", FAKE_SECRET, "-k", FAKE_KEY, "--max-concurrency", "0"]
+
+            with pytest.raises(SystemExit):
+                parse_main_arguments(parameters)
+
+            assert_error_message(capsys)
+
     def describe_given_parameters_are_not_valid():
         @pytest.fixture
         def default_parameters() -> List[str]:
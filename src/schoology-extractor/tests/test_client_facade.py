@@ -238,6 +238,45 @@ def describe_when_getting_sections():
             assert 3333 == args[0][0]
 
 
+def describe_when_prefetching_sections():
+    @pytest.fixture
+    def request_client() -> RequestClient:
+        request_client = RequestClient("key", "secret")
+        request_client.prefetch = Mock()
+        return request_client
+
+    def it_should_prefetch_the_enrollments_of_each_section(request_client):
+        db_engine = Mock(spec=sqlalchemy.engine.base.Engine)
+        service = ClientFacade(request_client, 22, db_engine)
+
+        service.prefetch_sections([1, 2])
+
+        request_client.prefetch.assert_called_once_with(
+            [
+                "sections/1/enrollments?start=0&limit=20",
+                "sections/2/enrollments?start=0&limit=20",
+            ]
+        )
+
+    def it_should_prefetch_the_resources_of_the_features(request_client):
+        db_engine = Mock(spec=sqlalchemy.engine.base.Engine)
+        service = ClientFacade(request_client, 22, db_engine)
+
+        service.prefetch_sections(
+            [1], assignments=True, activities=True, attendance=True
+        )
+
+        request_client.prefetch.assert_called_once_with(
+            [
+                "sections/1/enrollments?start=0&limit=20",
+                "sections/1/assignments?start=0&limit=22",
+                "sections/1/discussions",
+                "sections/1/updates",
+                "sections/1/attendance",
+            ]
+        )
+
+
 def describe_when_getting_assignments():
     def describe_given_a_section_has_one_assignment():
         @pytest.fixture
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+# Licensed to the Ed-Fi Alliance under one or more agreements.
+# The Ed-Fi Alliance licenses this file to you under the Apache License, Version 2.0.
+# See the LICENSE and NOTICES files in the project root for more information.
+
+from typing import Dict, List
+from unittest.mock import Mock
+
+from pandas import DataFrame
+import pytest
+
+from edfi_schoology_extractor import extract_facade
+from edfi_schoology_extractor.api.request_client import RequestClient
+from edfi_schoology_extractor.client_facade import ClientFacade
+from edfi_schoology_extractor.helpers.arg_parser import MainArguments
+
+
+def _arguments(max_concurrency: int) -> MainArguments:
+    return MainArguments(
+        client_key="key",
+        client_secret="secret",
+        output_directory="output",
+        log_level="INFO",
+        page_size=20,
+        input_directory="",
+        sync_database_directory="data",
+        extract_assignments=True,
+        extract_attendance=True,
+        max_concurrency=max_concurrency,
+    )
+
+
+@pytest.fixture
+def written_files(monkeypatch) -> Dict[str, DataFrame]:
+    files: Dict[str, DataFrame] = {}
+
+    def _write(df, file_name):
+        files[file_name] = df
+
+    monkeypatch.setattr(extract_facade, "_create_file_from_dataframe", _write)
+    return files
+
+
+def _facade(failing_assignments: List[int]) -> Mock:
+    facade = Mock(spec=ClientFacade)
+
+    facade.get_section_associations.side_effect = lambda section_id: DataFrame(
+        {"SourceSectionIdentifier": [section_id]}
+    )
+
+    def _get_assignments(section_id):
+        if section_id in failing_assignments:
+            raise RuntimeError("Assignments failed")
+        return DataFrame({"SourceSystemIdentifier": [section_id * 10]})
+
+    facade.get_assignments.side_effect = _get_assignments
+    facade.get_submissions.return_value = DataFrame()
+    facade.get_attendance_events.return_value = DataFrame()
+    facade.prefetch_sections.side_effect = lambda section_ids, **features: [
+        f"sections/{section_id}/attendance" for section_id in section_ids
+    ]
+    facade.request_client = Mock(spec=RequestClient)
+    return facade
+
+
+def describe_when_extracting_sections():
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    def it_should_use_the_section_associations_of_each_section(
+        written_files, max_concurrency
+    ):
+        facade = _facade([])
+        section_ids = list(range(1, 9))
+
+        extract_facade._extract_sections(
+            facade, _arguments(max_concurrency), section_ids
+        )
+
+        assert facade.get_attendance_events.call_count == len(section_ids)
+        for call in facade.get_attendance_events.call_args_list:
+            section_id, section_associations = call.args
+            assert section_associations["SourceSectionIdentifier"].tolist() == [
+                section_id
+            ]
+
+    def it_should_get_the_submissions_of_each_section_assignment(written_files):
+        facade = _facade([])
+
+        extract_facade._extract_sections(facade, _arguments(4), [1, 2, 3])
+
+        assert sorted(
+            call.args for call in facade.get_submissions.call_args_list
+        ) == [(10, 1), (20, 2), (30, 3)]
+
+    def it_should_skip_submissions_of_sections_with_failed_assignments(
+        written_files,
+    ):
+        facade = _facade([2])
+
+        extract_facade._extract_sections(facade, _arguments(4), [1, 2, 3])
+
+        assert sorted(
+            call.args for call in facade.get_submissions.call_args_list
+        ) == [(10, 1), (30, 3)]
+
+    def it_should_prefetch_the_sections_in_batches_of_50(written_files):
+        facade = _facade([])
+
+        extract_facade._extract_sections(facade, _arguments(4), list(range(1, 121)))
+
+        assert [
+            call.args[0] for call in facade.prefetch_sections.call_args_list
+        ] == [list(range(1, 51)), list(range(51, 101)), list(range(101, 121))]
+        assert facade.prefetch_sections.call_args.kwargs == {
+            "assignments": True,
+            "activities": False,
+            "attendance": True,
+        }
+
+    def it_should_discard_the_unused_prefetched_pages_of_each_batch(written_files):
+        facade = _facade([])
+        facade.get_attendance_events.side_effect = KeyError("section_associations")
+
+        extract_facade._extract_sections(facade, _arguments(4), list(range(1, 61)))
+
+        assert [
+            call.args[0]
+            for call in facade.request_client.discard_prefetched.call_args_list
+        ] == [
+            [f"sections/{section_id}/attendance" for section_id in range(1, 51)],
+            [f"sections/{section_id}/attendance" for section_id in range(51, 61)],
+        ]